@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+File Description: Wide decomposition benchmark. Times planning for methods that return long subtask lists.
+
+The planner picks the next node to refine using an open child cursor kept on every node, so the time per node should
+stay flat as the width of the decomposition grows. (Scanning the children of the parent for the first open child on
+every iteration makes the time per node grow linearly with the width instead.)
+The planner backtracks using a trail, so that the cost of copying the (wide) state does not hide the cost of the
+node selection.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+import time
+from ipyhop import IPyHOP, Methods, Actions, State, MultiGoal, mgm_split_multigoal
+
+
+# ******************************************        Domain Definition       ****************************************** #
+def a_set(state, key, val):
+    state.val[key] = val
+    return state
+
+
+actions = Actions()
+actions.declare_actions([a_set])
+
+
+def tm_set_all(state, width):
+    return [('a_set', key, 1) for key in range(width)]
+
+
+def gm_set(state, key, val):
+    return [('a_set', key, val)]
+
+
+methods = Methods()
+methods.declare_task_methods('set_all', [tm_set_all])
+methods.declare_goal_methods('val', [gm_set])
+methods.declare_multigoal_methods(None, [mgm_split_multigoal])
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    planner = IPyHOP(methods, actions, trail=True)
+    print('{:>8} {:>14} {:>14} {:>16} {:>16}'.format('width', 'task (s)', 'multigoal (s)', 'task (us/node)',
+                                                      'multigoal (us/node)'))
+    for width in (1000, 2000, 4000, 8000, 16000):
+        state = State('state')
+        state.val = {key: 0 for key in range(width)}
+        goal = MultiGoal('goal')
+        goal.val = {key: 1 for key in range(width)}
+
+        start = time.perf_counter()
+        plan = planner.plan(state, [('set_all', width)])
+        t_task = time.perf_counter() - start
+        assert len(plan) == width
+
+        start = time.perf_counter()
+        plan = planner.plan(state, [goal])
+        t_goal = time.perf_counter() - start
+        assert len(plan) == width
+
+        print('{:>8} {:>14.4f} {:>14.4f} {:>16.2f} {:>16.2f}'.format(width, t_task, t_goal, 1e6 * t_task / width,
+                                                                      1e6 * t_goal / width))
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
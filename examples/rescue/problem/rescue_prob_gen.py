@@ -36,6 +36,7 @@ class StateSampler(object):
             rigid_relations['obstacles'].append(((lp[0][0] + lp[1][0]) / 2, (lp[0][1] + lp[1][1]) / 2))
 
         state.rigid = rigid_relations
+        state.declare_copy_policy('rigid', State.RIGID)
 
         state.loc = {'r1': rigid_relations['base_loc'], 'w1': rigid_relations['base_loc'],
                      'a1': rigid_relations['base_loc'], 'p1': rigid_relations['other_loc'][0],
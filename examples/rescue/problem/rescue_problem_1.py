@@ -14,6 +14,7 @@ rigid_relations['drones'] = ('a1',)
 rigid_relations['large_robots'] = ()
 
 init_state.rigid = rigid_relations
+init_state.declare_copy_policy('rigid', State.RIGID)
 
 init_state.loc = {'r1': (1, 1), 'w1': (5, 5), 'p1': (2, 2), 'a1': (2, 1)}
 init_state.robot_type = {'r1': 'wheeled', 'w1': 'wheeled', 'a1': 'uav'}
@@ -40,6 +40,7 @@ class StateSampler(object):
              'gm2': 'gm', 'cm1': 'cm', 'cm2': 'cm', 'gp1': 'gp', 'gp2': 'gp', 'c1': 'c', 'v1': 'v', 'v2': 'v',
              'd1': 'd', 'ap1': 'ap', 'ap2': 'ap', 's1': 's', 't1': 't', 't2': 't'}
         state.rigid = rigid_relations
+        state.declare_copy_policy('rigid', State.RIGID)
         state.found = {'g': False, 'gm1': False, 'cm1': False, 'gp1': False,
                        'v1': False, 'v2': False, 'gp2': False,
                        'gm2': False, 'c1': False, 'ap1': False, 'd1': False,
@@ -37,6 +37,7 @@ rigid_relations['type'] = {'l0': 'l', 'l1': 'l', 'l2': 'l', 'l3': 'l', 'l4': 'l'
                            'gm1': 'gm', 'gm2': 'gm', 'cm1': 'cm', 'cm2': 'cm', 'gp1': 'gp', 'gp2': 'gp', 'c1': 'c',
                            'v1': 'v', 'v2': 'v', 'd1': 'd', 'ap1': 'ap', 'ap2': 'ap', 's1': 's', 't1': 't', 't2': 't'}
 init_state.rigid = rigid_relations
+init_state.declare_copy_policy('rigid', State.RIGID)
 
 task_list_1 = [('pinger_task', ), ('main_task', ['l1', 'l2', 'l3', 'l4', 'l5'])]
 task_list_2 = [('pinger_task', ), ('main_task', ['l1']), ('main_task', ['l2']), ('main_task', ['l3']),
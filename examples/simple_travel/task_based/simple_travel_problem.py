@@ -15,6 +15,7 @@ rigid_relations['dist'] = {('home_a', 'park'): 8, ('home_b', 'park'): 2, ('stati
 
 init_state = State('init_state')
 init_state.rigid = rigid_relations
+init_state.declare_copy_policy('rigid', State.RIGID)
 init_state.loc = {'alice': 'home_a', 'bob': 'home_b', 'taxi1': 'park', 'taxi2': 'station'}
 init_state.cash = {'alice': 20, 'bob': 15}
 init_state.owe = {'alice': 0, 'bob': 0}
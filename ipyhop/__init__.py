@@ -12,9 +12,15 @@ Derived from:
 
 from ipyhop.mc_executor import MonteCarloExecutor
 from ipyhop.state import State
+from ipyhop.persistent_state import PersistentState
 from ipyhop.mulitgoal import MultiGoal
 from ipyhop.methods import Methods, mgm_split_multigoal
 from ipyhop.actions import Actions
+from ipyhop.method_cache import MethodCache, uncached
+from ipyhop.nogood_memo import NogoodMemo
+from ipyhop.tracked_state import TrackedState, AccessProfile
+from ipyhop.conflict_tracker import writes
+from ipyhop.planning_context import PlanningContext
 from ipyhop.planner import IPyHOP
 from ipyhop.plotter import planar_plot
 # from ipyhop.failure_handler import post_failure_tasks
@@ -5,8 +5,10 @@ File Description: File used for definition of Actions Class.
 
 # ******************************************    Libraries to be imported    ****************************************** #
 from __future__ import print_function, division
-from typing import List, Callable, Union, Any, Dict
+from typing import List, Callable, Union, Any, Dict, Tuple
 from ipyhop.state import State
+from ipyhop.dispatch import add_entry
+from ipyhop.sol_tree import A
 
 
 # ******************************************    Class Declaration Start     ****************************************** #
@@ -18,18 +20,23 @@ class Actions(object):
         To add actions into it, you should use actions.declare_actions(action_list).
         declare_actions([a1, a2, ..., ak]) tells IPyHOP that a1, a2, ..., ak are all of the planning actions.
         This supersedes any previous call to declare_actions([a1, a2, ..., ak]).
+        An action can also be declared as a (precondition, effect) pair of functions, i.e., declare_actions([(p1, e1)]).
 
     All the actions are stored in a dictionary member variable named action_dict with the following structure::
 
         {op_name_1: [op_func_a, ...], op_name_2: [op_func_x, ...]...}
 
     Use the member function declare_actions to add actions to the action_dict.
+    The actions are also entered in a dispatch table named dispatch (see ipyhop.dispatch). revision counts the
+    declarations made so far.
     """
 
     def __init__(self):
         self.action_dict = dict()
         self.action_prob = dict()
         self.action_cost = dict()
+        self.dispatch = dict()
+        self.revision = 0
 
     # ******************************        Class Method Declaration        ****************************************** #
     def __str__(self):
@@ -40,7 +47,7 @@ class Actions(object):
     def __repr__(self):
         return self.__str__()
 
-    _action_list_type = List[Callable[[Any], Union[State, bool]]]
+    _action_list_type = List[Union[Callable[[Any], Union[State, bool]], Tuple[Callable, Callable]]]
     _act_prob_dict_type = Dict[str, List]
     _act_cost_dict_type = Dict[str, float]
 
@@ -50,14 +57,29 @@ class Actions(object):
         declare_actions([a1, a2, ..., ak]) tells IPyHOP that [a1, a2, ..., ak] are all of the planning actions.
         This supersedes any previous call to declare_actions.
 
-        :param action_list: List of actions in the
+        Each action is either a function a(state, *args) returning the modified state (or None if the action is not
+        applicable), or a (precondition, effect) pair of functions named after the effect:
+            * precondition(state, *args) returns True if the action is applicable. It must not modify the state.
+            * effect(state, *args) applies the action by modifying the state in place. It can not fail.
+        The planner checks the precondition on the current state directly and applies the effect only if it holds, so
+        an inapplicable action never costs a copy of the state.
+
+        :param action_list: List of actions in the planning domain.
         """
         assert type(action_list) == list, "action_list must be a list."
         for action in action_list:
-            assert callable(action), "action in action_list should be callable."
+            if type(action) == tuple:
+                assert len(action) == 2 and callable(action[0]) and callable(action[1]), \
+                    "(precondition, effect) action in action_list should be a pair of callables."
+            else:
+                assert callable(action), "action in action_list should be callable."
+        action_list = [SplitAction(*action) if type(action) == tuple else action for action in action_list]
         self.action_dict.update({action.__name__: action for action in action_list})
         self.action_prob.update({action.__name__: [1, 0] for action in action_list})
         self.action_cost.update({action.__name__: 1.0 for action in action_list})
+        for action in action_list:
+            add_entry(self.dispatch, action.__name__, A, [action])
+        self.revision += 1
 
     # ******************************        Class Method Declaration        ****************************************** #
     def declare_action_models(self, act_prob_dict: _act_prob_dict_type, act_cost_dict: _act_cost_dict_type):
@@ -68,6 +90,33 @@ class Actions(object):
         assert (len(self.action_cost.keys()) == len(self.action_dict.keys()))
 
 
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class SplitAction(object):
+    """
+    An action declared as a (precondition, effect) pair of functions. It is named after the effect function.
+
+    Calling it behaves like a single function action: action(state, *args) applies the effect to the state and returns
+    it if the precondition holds, and returns None otherwise.
+    """
+
+    def __init__(self, precondition: Callable, effect: Callable):
+        self.precondition = precondition
+        self.effect = effect
+        self.__name__ = effect.__name__
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __call__(self, state: State, *args):
+        if self.precondition(state, *args):
+            self.effect(state, *args)
+            return state
+        return None
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return '<SplitAction ' + self.__name__ + '>'
+
+
 # ******************************************    Class Declaration End       ****************************************** #
 # ******************************************    Demo / Test Routine         ****************************************** #
 if __name__ == '__main__':
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of the batch planning functions of IPyHOP (planning many problems of the
+same domain in a pool of worker processes).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from traceback import format_exc
+from typing import Iterable, Iterator, Optional, Tuple
+from ipyhop.budget import Budget
+from ipyhop.method_cache import MethodCache
+from ipyhop.nogood_memo import NogoodMemo
+
+# Value of BatchResult.status for the problems that raised an exception.
+ERROR = 'error'
+
+BatchResult = namedtuple('BatchResult', ['index', 'status', 'plan', 'stats', 'error'])
+BatchResult.__doc__ = """
+The result of one problem of IPyHOP.plan_batch().
+
+*   index is the position of the problem in the problems given to plan_batch().
+*   status, plan and stats are those of the PlanResult of the problem (see ipyhop.budget). If planning the problem
+    raised an exception, status is ERROR, plan is None, stats is an empty dictionary and error is the formatted
+    traceback of the exception (error is None otherwise).
+"""
+
+# The planner of a worker process (constructed once per worker by _init_worker).
+_worker_planner = None
+
+
+# ****************************************        Function Declaration        **************************************** #
+def plan_batch(planner, problems: Iterable[Tuple], workers: Optional[int] = None, chunksize: int = 1,
+               ordered: bool = True, budget: Optional[Budget] = None) -> Iterator[BatchResult]:
+    """
+    Plan many problems of the domain of a planner in a pool of worker processes (see IPyHOP.plan_batch()).
+
+    :param planner: An instance of IPyHOP class.
+    :param problems: An iterable of (state, task_list) pairs.
+    :param workers: [Optional] The number of worker processes (os.cpu_count() if None). If 0, the problems are
+        planned one after the other in the calling process.
+    :param chunksize: [Optional] The number of problems sent to a worker at once.
+    :param ordered: [Optional] If True, the results are yielded in the order of the problems. Else, in the order they
+        complete.
+    :param budget: [Optional] An instance of Budget class limiting the search of each problem.
+    :return: An iterator over the BatchResult of every problem.
+    """
+    assert chunksize > 0, "chunksize must be a positive integer."
+    problems = list(problems)
+    chunks = [[(index, state, task_list) for index, (state, task_list) in
+               enumerate(problems[start:start + chunksize], start)] for start in range(0, len(problems), chunksize)]
+    domain = _domain_of(planner)
+    if workers == 0:
+        local_planner = _make_planner(*domain)
+        for chunk in chunks:
+            yield from _plan_chunk(local_planner, chunk, budget)
+        return
+
+    # The domain is sent once to every worker (by its initializer), and only the problems are sent with the chunks.
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=domain)
+    futures = {executor.submit(_plan_chunk_in_worker, chunk, budget): chunk for chunk in chunks}
+    try:
+        for future in (futures if ordered else as_completed(futures)):
+            try:
+                results = future.result()
+            except Exception:  # The worker died, or a result could not be sent back. Only this chunk is lost.
+                error = format_exc()
+                results = [BatchResult(index, ERROR, None, dict(), error) for index, _, _ in futures[future]]
+            yield from results
+    finally:
+        # If the caller stops iterating early, the problems not started yet are dropped.
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _domain_of(planner):
+    # The arguments of _init_worker: everything needed to construct a planner like planner in a worker.
+    method_cache = planner.method_cache and planner.method_cache.maxsize
+    nogood_memo = planner.nogood_memo and planner.nogood_memo.maxsize
+    options = {'trail': planner.trail, 'method_cache': method_cache, 'nogood_memo': nogood_memo,
+               'detect_cycles': planner.detect_cycles, 'backjumping': planner.backjumping}
+    return planner.__class__, planner.methods, planner.actions, options, set(planner.blacklist)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _make_planner(planner_class, methods, actions, options, blacklist):
+    options = dict(options)
+    if options['method_cache'] is not None:
+        options['method_cache'] = MethodCache(options['method_cache'])
+    if options['nogood_memo'] is not None:
+        options['nogood_memo'] = NogoodMemo(options['nogood_memo'])
+    planner = planner_class(methods, actions, **options)
+    planner.blacklist.update(blacklist)
+    return planner
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _init_worker(*domain):
+    global _worker_planner
+    _worker_planner = _make_planner(*domain)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _plan_chunk_in_worker(chunk, budget):
+    return _plan_chunk(_worker_planner, chunk, budget)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _plan_chunk(planner, chunk, budget):
+    results = []
+    for index, state, task_list in chunk:
+        try:
+            result = planner.plan(state, task_list, budget=Budget() if budget is None else budget)
+            results.append(BatchResult(index, result.status, result.plan, result.stats, None))
+        except Exception:  # A failure in one problem must not stop the others.
+            results.append(BatchResult(index, ERROR, None, dict(), format_exc()))
+    return results
+
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of the best first search engine of IPyHOP (a search over partial
+decompositions ordered by cost so far plus a heuristic, instead of the chronological depth first search of plan()).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from heapq import heappush, heappop
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+from ipyhop.actions import SplitAction
+from ipyhop.budget import Budget, approx_state_bytes, search_stats
+from ipyhop.methods import _goals_not_achieved
+from ipyhop.mulitgoal import MultiGoal
+from ipyhop.state import State
+from ipyhop.sol_tree import T, A, G, M, VG, VM
+
+# A partial decomposition is a tuple (g, state, agenda, steps, next_id):
+#   *   g is the cost of the actions applied so far, and state the state they lead to.
+#   *   agenda is the linked list (item, rest) of the nodes still to be refined in order (None if empty). An item is a
+#       tuple (node_id, node_type, info, handler): handler is the list of methods of a task/goal/multigoal, the action
+#       of an action, and the info of the goal/multigoal to verify of a verification node.
+#   *   steps is the linked list (step, previous) of the refinements made so far, the last one first. A step is a tuple
+#       (node_id, method_index, subtasks): the node was refined using its method_index-th method into subtasks, or
+#       closed without children (method_index and subtasks are None).
+#   *   next_id is the id the next node added to the solution tree gets.
+# The partial decompositions share their agenda tails, steps and states. So, refining a node only allocates its new
+# items, and the state is only copied to apply an action.
+
+
+# ****************************************        Function Declaration        **************************************** #
+def best_first_search(planner, ctx, state: State, task_list: List[Tuple], heuristic: Optional[Callable] = None,
+                      budget: Optional[Budget] = None) -> Tuple[Optional[List[Tuple]], Optional[float],
+                                                                Optional[State], dict]:
+    """
+    Search the decompositions of task_list from state in best first order (see IPyHOP.plan_best_first()).
+
+    :param planner: An instance of IPyHOP class.
+    :param ctx: The PlanningContext class instance of the search (its state is set to the refined state before every
+        method call, so the method cache of the planner can be used).
+    :param state: The initial state (it is not modified).
+    :param task_list: A list of tasks that need to be accomplished in the planning problem.
+    :param heuristic: [Optional] A function heuristic(state, tasks) estimating the cost of accomplishing the list of
+        tasks/goals/multigoals/actions tasks from state.
+    :param budget: [Optional] An instance of Budget class limiting the search.
+    :return: A tuple (steps, cost, state, stats): the refinements of the solution in order (None if none was found),
+        its cost, the state it leads to and the search statistics.
+    """
+    budget = Budget() if budget is None else budget
+    dispatch, blacklist, action_cost = ctx._dispatch, planner.blacklist, planner.actions.action_cost
+    next_id = len(task_list) + 1
+    agenda = None
+    for node_id in range(len(task_list), 0, -1):
+        agenda = (_agenda_item(planner, node_id, task_list[node_id - 1], dispatch, ('root',)), agenda)
+
+    start_time = perf_counter()
+    # The solution tree of a partial decomposition has next_id nodes (with the root). The queued partial
+    # decompositions after the same action share its state, so the saved states are the distinct states in the queue.
+    live_nodes, state_bytes = next_id, approx_state_bytes(state)
+    next_check = 0
+    seq = 0
+    exhausted = None
+    dead_ends = 0
+    heap = [(_estimate(heuristic, state, agenda), seq, (0.0, state, agenda, None, next_id))]
+    _iter = 0
+    while heap:
+        if _iter == next_check:
+            exhausted, next_check = budget.check(_iter, live_nodes, lambda: _saved_states(heap) * state_bytes)
+            if exhausted is not None:
+                break
+        _iter += 1
+        f, _, (g, state, agenda, steps, next_id) = heappop(heap)
+        live_nodes = next_id
+        if ctx._verbose > 1:
+            print('Iteration {}, Refining {} (cost so far {}, estimate {}).'.format(
+                _iter, 'nothing' if agenda is None else repr(agenda[0][2]), g, f))
+
+        # Close the nodes that need no choice and cost nothing, up to the next action or task/goal/multigoal to refine.
+        while agenda is not None:
+            (node_id, node_type, info, handler), rest = agenda
+            if node_type == A:
+                new_state = None if info in blacklist else _apply_action(handler, state, info, planner.access_profile)
+                if new_state is None:
+                    dead_ends += 1
+                else:
+                    g += action_cost[info[0]]
+                    agenda, steps = rest, ((node_id, None, None), steps)
+                    seq += 1
+                    heappush(heap, (g + _estimate(heuristic, new_state, agenda), -seq,
+                                    (g, new_state, agenda, steps, next_id)))
+                break
+            if node_type == VG or node_type == VM:
+                if not _achieved(state, node_type, handler):
+                    dead_ends += 1
+                    break
+            elif node_type == T or not _achieved(state, node_type, info):
+                children = _refinements(planner, ctx, state, agenda, steps, next_id)
+                if not children:
+                    dead_ends += 1
+                # Among the partial decompositions with the same estimate, the first method is refined first.
+                for child_agenda, child_steps, child_next_id in reversed(children):
+                    seq += 1
+                    heappush(heap, (g + _estimate(heuristic, state, child_agenda), -seq,
+                                    (g, state, child_agenda, child_steps, child_next_id)))
+                break
+            agenda, steps = rest, ((node_id, None, None), steps)
+        else:
+            # Nothing is left to refine. The other partial decompositions are all estimated to cost at least as much.
+            return _in_order(steps), g, state, _stats(_iter, dead_ends, start_time, live_nodes, heap, state_bytes,
+                                                      exhausted)
+    return None, None, None, _stats(_iter, dead_ends, start_time, live_nodes, heap, state_bytes, exhausted)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _refinements(planner, ctx, state, agenda, steps, next_id):
+    # The partial decompositions (agenda, steps, next_id) obtained by refining the first node of agenda with each of
+    # its methods that applies in state.
+    (node_id, node_type, info, methods), rest = agenda
+    dispatch = ctx._dispatch
+    ctx.state = state
+    args = (info,) if node_type == M else info[1:]
+    children = []
+    for method_index, method in enumerate(methods):
+        subtasks = planner._call_method(ctx, method, args)
+        if subtasks is None:
+            continue
+        child_agenda = rest
+        child_next_id = next_id + len(subtasks)
+        if node_type == G:
+            child_agenda = ((child_next_id, VG, 'VerifyGoal', info), child_agenda)
+            child_next_id += 1
+        elif node_type == M:
+            child_agenda = ((child_next_id, VM, 'VerifyMultiGoal', info), child_agenda)
+            child_next_id += 1
+        for index in range(len(subtasks) - 1, -1, -1):
+            child_agenda = (_agenda_item(planner, next_id + index, subtasks[index], dispatch, info), child_agenda)
+        children.append((child_agenda, ((node_id, method_index, subtasks), steps), child_next_id))
+    return children
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _agenda_item(planner, node_id, node_info, dispatch, parent_info):
+    # Validated like the subtasks added to the solution tree by IPyHOP._add_nodes_and_edges().
+    if isinstance(node_info, MultiGoal):
+        methods = planner.methods.multigoal_method_dict.get(node_info.goal_tag)
+        if methods is None:
+            raise ValueError(planner._subtask_error(node_info, None, parent_info))
+        return node_id, M, node_info, methods
+    entry = dispatch.get(node_info[0])
+    if entry is None or (entry[2] is not None and len(node_info) != entry[2] + 1):
+        raise ValueError(planner._subtask_error(node_info, entry, parent_info))
+    return node_id, entry[0], node_info, entry[1][0] if entry[0] == A else entry[1]
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _apply_action(action, state, action_info, profile):
+    # The state is shared with other partial decompositions. So, the action is applied to a copy of it.
+    if type(action) is SplitAction:
+        if not _call(profile, action.precondition, state, action_info[1:]):
+            return None
+        new_state = state.copy()
+        _call(profile, action.effect, new_state, action_info[1:])
+        return new_state
+    return _call(profile, action, state.copy(), action_info[1:])
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _call(profile, func, state, args):
+    # With an access profile, the accesses of the call are recorded (see AccessProfile.call()).
+    return func(state, *args) if profile is None else profile.call(func, state, args)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _achieved(state, node_type, info):
+    if node_type == G or node_type == VG:
+        state_var, arg, desired_val = info
+        return state.__dict__[state_var][arg] == desired_val
+    return not _goals_not_achieved(state, info)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _estimate(heuristic, state, agenda):
+    if heuristic is None:
+        return 0.0
+    tasks = []
+    while agenda is not None:
+        item, agenda = agenda
+        if item[1] != VG and item[1] != VM:
+            tasks.append(item[2])
+    return heuristic(state, tasks)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _saved_states(heap):
+    return len({id(entry[2][1]) for entry in heap})
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _in_order(steps):
+    in_order = []
+    while steps is not None:
+        step, steps = steps
+        in_order.append(step)
+    in_order.reverse()
+    return in_order
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _stats(iterations, dead_ends, start_time, live_nodes, heap, state_bytes, exhausted):
+    saved_states = _saved_states(heap)
+    stats = search_stats(iterations, dead_ends, start_time, live_nodes, saved_states, saved_states * state_bytes,
+                         exhausted)
+    stats['queued'] = len(heap)
+    return stats
+
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of Budget Class (the search budgets of IPyHOP) and of PlanResult.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections import namedtuple
+from collections.abc import Mapping
+from sys import getsizeof
+from time import monotonic, perf_counter
+from typing import Callable, Optional
+
+# Values of PlanResult.status.
+SUCCESS = 'success'
+BUDGET_EXHAUSTED = 'budget_exhausted'
+NO_PLAN = 'no_plan'
+CANCELLED = 'cancelled'
+
+PlanResult = namedtuple('PlanResult', ['status', 'plan', 'stats'])
+PlanResult.__doc__ = """
+The structured result of IPyHOP.plan() and IPyHOP.replan().
+
+*   status is SUCCESS, BUDGET_EXHAUSTED or NO_PLAN (or CANCELLED, if IPyHOP.aplan() or IPyHOP.areplan() was
+    cancelled).
+*   plan is the solution plan if status is SUCCESS, and the actions completed so far otherwise.
+*   stats is a dictionary of search statistics: iterations, backtracks, elapsed (seconds), live_nodes (the size of the
+    solution tree), snapshots (the number of saved states), snapshot_bytes (their approximate size) and exhausted (the
+    name of the budget that ran out, or None).
+"""
+
+# Approximate size of an entry of the trail of a PersistentState (a 3-tuple plus the saved value reference).
+TRAIL_ENTRY_BYTES = 80
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class Budget(object):
+    """
+    The limits of a call to IPyHOP.plan(), IPyHOP.replan() or IPyHOP.plan_best_first().
+
+    *   budget = Budget(max_iterations=None, deadline=None, max_nodes=None, max_snapshot_bytes=None) creates a budget.
+        Every limit left as None is unbounded.
+        *   max_iterations: the maximum number of iterations of the search.
+        *   deadline: the time (as given by time.monotonic()) by which the search must stop.
+        *   max_nodes: the maximum number of live nodes in the solution tree.
+        *   max_snapshot_bytes: the maximum approximate size of the saved states (the copies of the state, or the trail
+            when planning with trail=True).
+    *   check_interval is the number of iterations between two checks of the deadline, max_nodes and
+        max_snapshot_bytes limits (max_iterations is always exact). Checking them only every few iterations keeps the
+        cost of the budget negligible, but the search may overshoot these limits by up to check_interval iterations.
+    """
+
+    def __init__(self, max_iterations: Optional[int] = None, deadline: Optional[float] = None,
+                 max_nodes: Optional[int] = None, max_snapshot_bytes: Optional[int] = None, check_interval: int = 32):
+        assert max_iterations is None or max_iterations >= 0, "max_iterations must be a non-negative integer."
+        assert check_interval > 0, "check_interval must be a positive integer."
+        self.max_iterations = max_iterations
+        self.deadline = deadline
+        self.max_nodes = max_nodes
+        self.max_snapshot_bytes = max_snapshot_bytes
+        self.check_interval = check_interval
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return 'Budget(max_iterations={}, deadline={}, max_nodes={}, max_snapshot_bytes={})'.format(
+            self.max_iterations, self.deadline, self.max_nodes, self.max_snapshot_bytes)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def check(self, iterations: int, live_nodes: int, snapshot_bytes: Callable[[], int]):
+        """
+        Check the limits of the budget in a search (plan() and plan_best_first() both check them this way).
+
+        :param iterations: The number of iterations of the search so far.
+        :param live_nodes: The number of live nodes in the solution tree of the search.
+        :param snapshot_bytes: A function returning the approximate size of the saved states of the search (only
+            called if max_snapshot_bytes is set).
+        :return: A tuple (exhausted, next_check): the name of the limit that ran out (or None), and the iteration of
+            the next check.
+        """
+        next_check = iterations + self.check_interval
+        if self.max_iterations is not None:
+            if iterations >= self.max_iterations:
+                return 'max_iterations', next_check
+            next_check = min(next_check, self.max_iterations)
+        if self.deadline is not None and monotonic() >= self.deadline:
+            return 'deadline', next_check
+        if self.max_nodes is not None and live_nodes > self.max_nodes:
+            return 'max_nodes', next_check
+        if self.max_snapshot_bytes is not None and snapshot_bytes() > self.max_snapshot_bytes:
+            return 'max_snapshot_bytes', next_check
+        return None, next_check
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ****************************************        Function Declaration        **************************************** #
+def approx_state_bytes(state) -> int:
+    """
+    Get the approximate size of a state: the size of its variables and of the values held in its dictionary variables.
+
+    :param state: An instance of State class.
+    :return: The approximate size of the state in bytes.
+    """
+    size = getsizeof(state.__dict__)
+    for value in vars(state).values():
+        size += getsizeof(value)
+        if isinstance(value, Mapping):
+            size += sum(getsizeof(v) for v in value.values())
+    return size
+
+
+# ****************************************        Function Declaration        **************************************** #
+def search_stats(iterations: int, backtracks: int, start_time: float, live_nodes: int, snapshots: int,
+                 snapshot_bytes: int, exhausted: Optional[str]) -> dict:
+    """
+    Get the stats of a PlanResult (the same for every search engine).
+
+    :param start_time: The time.perf_counter() time the search started at.
+    :return: The dictionary of search statistics (see PlanResult).
+    """
+    return {'iterations': iterations, 'backtracks': backtracks, 'elapsed': perf_counter() - start_time,
+            'live_nodes': live_nodes, 'snapshots': snapshots, 'snapshot_bytes': snapshot_bytes, 'exhausted': exhausted}
+
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
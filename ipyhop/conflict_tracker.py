@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of ConflictTracker Class (the bookkeeping of the conflict-directed
+backjumping of IPyHOP).
+
+When a node fails, chronological backtracking resumes the most recently refined choice point (a task/goal/multigoal
+node with children), even if nothing it did or could do has anything to do with the failure. With backjumping, the
+planner runs the methods and actions on a TrackedState, so it knows which (state_var, key) pairs every refinement read
+and wrote. On a failure explained by the state (an action or a verification failing, or a task/goal/multigoal running
+out of methods), it blames the choice points that could have prevented it:
+
+*   the ancestors of the failed node (another decomposition might not lead to it),
+*   the ancestors of the actions of the plan that wrote what the failed node read (and, transitively, what those
+    actions read),
+*   the choice points having a method left that may write what was read. What the subtree of a method may write is
+    declared using the writes decorator. A method without a declaration may write anything.
+*   the choice points blamed for the earlier failures the failed node was backtracked to for.
+
+The planner then jumps to the latest of them, skipping the alternative methods of the choice points refined after it.
+So, the plans are the ones of chronological backtracking, as long as the declarations hold. They are checked against
+the actions applied in the subtrees of the methods: an action writing what the methods above it do not declare raises
+a ValueError.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from typing import Callable, Optional, Set
+from ipyhop.sol_tree import SolutionTree, M
+from ipyhop.tracked_state import TrackedState
+
+
+# ****************************************        Function Declaration        **************************************** #
+def writes(*accesses) -> Callable:
+    """
+    Decorator declaring what the subtrees of a method may write, so that backjumping can skip the choice points whose
+    methods left can not change what a failure depends on (see IPyHOP(..., backjumping=True)).
+
+    Example: @writes('owe', ('loc', 'taxi1'), lambda p, y: [('loc', p), ('cash', p)]) declares that the actions of
+    the subtree of the method may write any key of state.owe, state.loc['taxi1'], and the keys of state.loc and
+    state.cash equal to the first task argument. @writes() declares that they write nothing.
+
+    :param accesses: The state variables (names), the (state_var, key) pairs, or functions of the task arguments
+        returning a list of those, the subtrees of the method may write.
+    :return: The decorator.
+    """
+    def decorator(method: Callable) -> Callable:
+        method.write_set = accesses
+        return method
+    return decorator
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class ConflictTracker(object):
+    """
+    The accesses, footprints and conflict sets of a search with backjumping (see IPyHOP(..., backjumping=True)).
+
+    *   tracker.focus(node_id, first_visit) makes the accesses of the calls made through tracker.call() be recorded
+        in tracker.reads and tracker.writes, for the node being refined. The reads of a choice point are kept (see
+        keep()) and accumulated over all its visits.
+    *   tracker.add_action(tree, node_id, plan_len) records the accesses of an action appended to the plan, and
+        checks them against the write sets declared by the methods selected for its ancestors.
+    *   tracker.culprits(tree, plan_len, node_id, explained) gives the choice points blamed for the failure of a node
+        (see above), and tracker.blame(node_id, culprits) makes the choice point backtracked to inherit them.
+    """
+
+    def __init__(self):
+        self.reads = set()
+        self.writes = set()
+        self._node_reads = dict()
+        self._conflicts = dict()
+        self._actions = []
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def call(self, func, state, args):
+        """
+        Call func(state, *args) on a TrackedState of state, recording its accesses.
+
+        :param func: A method, action, precondition or effect.
+        :param state: The state to call it on.
+        :param args: The arguments following the state.
+        :return: The result of the call (the state itself if it returned the TrackedState).
+        """
+        result = func(TrackedState(state, self.reads, self.writes), *args)
+        return result.unwrap() if type(result) is TrackedState else result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def focus(self, node_id: int, first_visit: bool):
+        """
+        Start recording the accesses made to refine a node.
+
+        :param node_id: The id of the node.
+        :param first_visit: True if the node is visited for the first time (since it was last opened).
+        """
+        self.writes = set()
+        if first_visit:
+            self._conflicts.pop(node_id, None)
+            self.reads = set()
+        else:
+            self.reads = self._node_reads.setdefault(node_id, set())
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def keep(self, node_id: int):
+        """
+        Keep the reads of the node being refined, which has become a choice point.
+        """
+        self._node_reads[node_id] = self.reads
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def forget(self, node_id: int):
+        """
+        Forget the reads and the conflict set of a choice point that is reset.
+        """
+        self._node_reads.pop(node_id, None)
+        self._conflicts.pop(node_id, None)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def add_action(self, tree: SolutionTree, node_id: int, plan_len: int):
+        """
+        Record the accesses of an action appended to the plan, and check that the methods selected for its ancestors
+        declare its writes (if they declare what they write).
+
+        :param tree: The SolutionTree of the search.
+        :param node_id: The id of the action node.
+        :param plan_len: The length of the plan before the action is appended.
+        """
+        del self._actions[plan_len:]
+        self._actions.append((node_id, self.reads, self.writes))
+        if not self.writes:
+            return
+        parent, nodes, node_type = tree.parent, tree.nodes, tree.node_type
+        a_node_id = node_id
+        node_id = parent[node_id]
+        while node_id > 0:
+            node = nodes[node_id]
+            write_set = _write_set(node, node_type[node_id], node.selected_method)
+            if write_set is not None:
+                for var, key in self.writes:
+                    if (var, None) not in write_set and (key is None or not _covers(write_set, var, key)):
+                        raise ValueError("{} writes {}, which {} (selected for {}) does not declare.".format(
+                            repr(nodes[a_node_id].info), var if key is None else '{}[{!r}]'.format(var, key),
+                            node.selected_method.__name__, repr(node.info)))
+            node_id = parent[node_id]
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def culprits(self, tree: SolutionTree, plan_len: int, node_id: int, explained: bool) -> Optional[Set[int]]:
+        """
+        Get the choice points blamed for the failure of a node.
+
+        :param tree: The SolutionTree of the search.
+        :param plan_len: The length of the plan when the node failed.
+        :param node_id: The id of the failed node.
+        :param explained: True if the failure only depends on the state read by the node (the accesses recorded since
+            it was focused). Else, every choice point is blamed.
+        :return: The set of the ids of the choice points blamed, or None if every choice point is.
+        """
+        conflicts = self._conflicts.get(node_id, ())
+        if not explained or conflicts is None:
+            return None
+        culprits = set(conflicts)
+        parent = tree.parent
+        _add_ancestors(culprits, parent, node_id)
+
+        # The actions of the plan that wrote what was read, latest first. What they read matters as well.
+        reads = set(self.reads)
+        read_vars = {var for var, _ in reads}
+        for index in range(plan_len - 1, -1, -1):
+            a_node_id, a_reads, a_writes = self._actions[index]
+            if _overlaps(a_writes, reads, read_vars):
+                _add_ancestors(culprits, parent, a_node_id)
+                reads.update(a_reads)
+                read_vars.update(var for var, _ in a_reads)
+
+        nodes, node_type = tree.nodes, tree.node_type
+        for cp_node_id in tree.choice_points:
+            if cp_node_id not in culprits and self._may_write(nodes[cp_node_id], node_type[cp_node_id], reads,
+                                                             read_vars):
+                culprits.add(cp_node_id)
+        return culprits
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def blame(self, node_id: int, culprits: Optional[Set[int]]):
+        """
+        Add the culprits of a failure (but itself) to the conflict set of the choice point backtracked to. They are
+        blamed for its own failure, if none of its methods left succeeds.
+
+        :param node_id: The id of the choice point backtracked to.
+        :param culprits: The culprits returned by culprits() (None for every choice point).
+        """
+        if culprits is None:
+            self._conflicts[node_id] = None
+            return
+        conflicts = self._conflicts.setdefault(node_id, set())
+        if conflicts is not None:
+            conflicts.update(culprits)
+            conflicts.discard(node_id)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _may_write(self, node, n_type, reads, read_vars):
+        # Whether one of the methods left of a choice point may write what was read. What the method selected wrote is
+        # known from the actions of the plan.
+        methods = node.methods
+        for index in range(node.method_index, len(methods)):
+            write_set = _write_set(node, n_type, methods[index])
+            if write_set is None:
+                return True
+            try:
+                if _overlaps(write_set, reads, read_vars):
+                    return True
+            except TypeError:  # An unhashable key may have been read under any key.
+                return True
+        return False
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ****************************************        Function Declaration        **************************************** #
+def _write_set(node, n_type, method):
+    # The set of the (state_var, key) pairs (key None for the whole variable) method declares it may write when
+    # refining node, or None if it does not declare them.
+    accesses = getattr(method, 'write_set', None)
+    if accesses is None:
+        return None
+    args = (node.info,) if n_type == M else node.info[1:]
+    write_set = set()
+    for access in accesses:
+        for access in (access(*args) if callable(access) else (access,)):
+            write_set.add((access, None) if isinstance(access, str) else tuple(access))
+    return write_set
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _covers(write_set, var, key):
+    try:
+        return (var, key) in write_set
+    except TypeError:  # An unhashable key is only covered by its whole variable.
+        return False
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _overlaps(writes, reads, read_vars):
+    for var, key in writes:
+        if var in read_vars and (key is None or (var, key) in reads or (var, None) in reads):
+            return True
+    return False
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _add_ancestors(culprits, parent, node_id):
+    node_id = parent[node_id]
+    while node_id > 0:
+        culprits.add(node_id)
+        node_id = parent[node_id]
+
+
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test instantiation of ConflictTracker class ...")
+    test_tracker = ConflictTracker()
+    test_tracker.blame(3, {1, 3})
+    print(writes('loc', lambda robot: [('fuel', robot)])(lambda state, robot: []).write_set)
+    print(test_tracker.culprits(SolutionTree(), 0, 3, False), test_tracker._conflicts)
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
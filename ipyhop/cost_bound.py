@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of CostBound Class (the incumbent and the bound of a cost-optimal search of
+IPyHOP).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from array import array
+from math import inf
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class CostBound(object):
+    """
+    The state of a branch and bound search for a plan of minimum total action cost (see IPyHOP.plan_optimal()).
+
+    *   bound = CostBound(action_cost, lower_bound=None, on_solution=None) creates the bound of a new search, where
+        action_cost maps the action names to their (non-negative) costs, e.g. Actions.action_cost.
+        *   lower_bound(state, node_info) is an optional hook returning an admissible (never overestimating) lower
+            bound of the cost of accomplishing the task/goal/multigoal node_info from state. Without it, the bound of
+            every node is 0.
+        *   on_solution(plan, cost) is an optional callback called with every plan cheaper than all the plans found
+            before it.
+    *   bound.best_plan and bound.best_cost are the cheapest plan found so far and its cost (None and inf if no plan was
+        found yet), and bound.solutions is the number of improving plans found.
+
+    The cost of every prefix of the current plan of the search is kept in an array. The entries of the actions removed
+    on backtracking are discarded lazily, when the next action is appended.
+    """
+
+    def __init__(self, action_cost: Dict[str, float], lower_bound: Optional[Callable] = None,
+                 on_solution: Optional[Callable[[List[Tuple], float], None]] = None):
+        self.action_cost = action_cost
+        self.lower_bound = lower_bound
+        self.on_solution = on_solution
+        self.best_plan = None
+        self.best_cost = inf
+        self.best_tree = None
+        self.best_state = None
+        self.solutions = 0
+        self._prefix_costs = array('d', [0.0])
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def plan_cost(self, plan_len: int) -> float:
+        """
+        Get the cost of the first plan_len actions of the current plan.
+
+        :param plan_len: The length of the current plan.
+        :return: The total cost of its actions.
+        """
+        del self._prefix_costs[plan_len + 1:]
+        return self._prefix_costs[plan_len]
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def admits_action(self, plan_len: int, action_name: str) -> bool:
+        """
+        Check whether appending an action to the current plan keeps its cost below the cost of the best plan.
+
+        :param plan_len: The length of the current plan.
+        :param action_name: The name of the action.
+        :return: False if the action must be pruned.
+        """
+        cost = self.plan_cost(plan_len) + self.action_cost[action_name]
+        self._prefix_costs.append(cost)
+        return cost < self.best_cost
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def admits_node(self, plan_len: int, state, node_info) -> bool:
+        """
+        Check whether the cost of the current plan plus the lower bound of a task/goal/multigoal node is below the cost
+        of the best plan.
+
+        :param plan_len: The length of the current plan.
+        :param state: The current state.
+        :param node_info: The info of the node.
+        :return: False if the node must be pruned.
+        """
+        if self.best_plan is None:
+            return True
+        cost = self.plan_cost(plan_len)
+        if self.lower_bound is not None:
+            cost += self.lower_bound(state, node_info)
+        return cost < self.best_cost
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def improve(self, plan: List[Tuple], state, tree):
+        """
+        Make the current plan the best plan.
+
+        :param plan: The current (complete) plan.
+        :param state: The state reached by the plan.
+        :param tree: The SolutionTree of the plan.
+        """
+        self.best_plan = list(plan)
+        self.best_cost = self.plan_cost(len(plan))
+        self.best_tree = tree.to_digraph()
+        self.best_state = state.copy()
+        self.solutions += 1
+        if self.on_solution is not None:
+            self.on_solution(list(plan), self.best_cost)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test instantiation of CostBound class ...")
+    test_bound = CostBound({'a_1': 2.0, 'a_2': 3.0})
+    print(test_bound.admits_action(0, 'a_1'), test_bound.admits_action(1, 'a_2'), test_bound.plan_cost(2))
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of the domain dispatch table used by IPyHOP.
+
+The dispatch table maps the name of every task, action and goal of a planning domain to an entry
+    (kind, handlers, arity)
+where kind is the node type code of the name (T, A or G, see ipyhop.sol_tree), handlers is the list of methods of the
+task/goal (or a one element list holding the action function), and arity is the number of arguments (following the
+name) that the handlers expect, or None if it is not fixed.
+
+Methods and Actions keep their part of the table up to date as methods and actions are declared. compile_domain()
+merges the two parts, so the planner classifies a subtask with a single dictionary lookup.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from inspect import signature, Parameter
+from typing import Callable, Dict, List, Optional, Tuple
+from ipyhop.sol_tree import T, A, G
+
+_KIND_NAMES = {T: 'task', A: 'action', G: 'goal'}
+_entry_type = Tuple[int, List[Callable], Optional[int]]
+
+
+# ****************************************        Function Declaration        **************************************** #
+def handler_arity(handlers: List[Callable]) -> Optional[int]:
+    """
+    Get the number of arguments (not counting the state) that all the handlers require.
+
+    :param handlers: List of method/action functions.
+    :return: The arity, or None if the handlers take a variable number of arguments or do not agree on the arity.
+    """
+    arity = None
+    for handler in handlers:
+        func = getattr(handler, 'effect', handler)
+        try:
+            params = list(signature(func).parameters.values())[1:]
+        except (TypeError, ValueError):
+            return None
+        if any(p.kind not in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD) or
+               p.default is not Parameter.empty for p in params):
+            return None
+        if arity is not None and arity != len(params):
+            return None
+        arity = len(params)
+    return arity
+
+
+# ****************************************        Function Declaration        **************************************** #
+def add_entry(table: Dict[str, _entry_type], name: str, kind: int, handlers: List[Callable]):
+    """
+    Add (or replace) the entry of a name in a dispatch table.
+
+    :param table: The dispatch table.
+    :param name: The name of the task/action/goal.
+    :param kind: The node type code of the name.
+    :param handlers: The list of methods (or a one element list holding the action function).
+    :raises ValueError: If the name is already declared with a different kind.
+    """
+    _check_collision(table, name, kind)
+    table[name] = (kind, handlers, handler_arity(handlers))
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _check_collision(table, name, kind):
+    entry = table.get(name)
+    if entry is not None and entry[0] != kind:
+        raise ValueError("'{}' can not be declared as a {} since it is already declared as a {}.".format(
+            name, _KIND_NAMES[kind], _KIND_NAMES[entry[0]]))
+
+
+# ****************************************        Function Declaration        **************************************** #
+def compile_domain(methods, actions) -> Dict[str, _entry_type]:
+    """
+    Merge the dispatch tables of a Methods and an Actions instance into the dispatch table of the planning domain.
+
+    :param methods: An instance of Methods class.
+    :param actions: An instance of Actions class.
+    :return: The dispatch table of the planning domain.
+    :raises ValueError: If an action has the same name as a task or a goal.
+    """
+    table = dict(methods.dispatch)
+    for name, entry in actions.dispatch.items():
+        _check_collision(table, name, entry[0])
+        table[name] = entry
+    return table
+
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of the state fingerprinting (Zobrist style hashing) functions.
+
+A fingerprint is a 64-bit integer computed as the XOR of the hashes of all the variable bindings of a State or a
+MultiGoal. Since XOR is its own inverse, a fingerprint can be updated in O(1) when a single binding changes:
+    fingerprint ^= binding_hash(var, key, old_value) ^ binding_hash(var, key, new_value)
+
+Equality contract:
+    *   Two objects with the same variable bindings (i.e., vars(a) == vars(b), ignoring __name__) always have the same
+        fingerprint, regardless of the object type (State, PersistentState, MultiGoal), copy policies or the order in
+        which the bindings were made.
+    *   Objects with different fingerprints never have the same bindings. Objects with the same fingerprint have the
+        same bindings with a very high probability (a 64-bit hash collision is the only exception).
+    *   Fingerprints are built on Python's hash(), so (like hash() of strings) they are only comparable within one
+        Python process.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections.abc import Mapping, Set
+
+_MASK_64 = (1 << 64) - 1
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _mix(x: int) -> int:
+    # splitmix64 finalizer. Spreads the bits of python's hash() so that XOR-ing the hashes works well.
+    x &= _MASK_64
+    x = ((x ^ (x >> 30)) * 0xbf58476d1ce4e5b9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94d049bb133111eb) & _MASK_64
+    return x ^ (x >> 31)
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _hashable(value):
+    """
+    Convert an unhashable value (dict, list, set, ...) into an equivalent hashable value.
+    """
+    if isinstance(value, Mapping):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, Set):
+        return frozenset(_hashable(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+# ****************************************        Function Declaration        **************************************** #
+def binding_hash(var_name: str, key, value) -> int:
+    """
+    binding_hash(var_name, key, value) returns the 64-bit hash of the binding var_name[key] = value.
+
+    :param var_name: Name of the state variable.
+    :param key: The key of the binding in the state variable.
+    :param value: The value of the binding.
+    :return: A 64-bit integer.
+    """
+    try:
+        return _mix(hash((var_name, key, value)))
+    except TypeError:
+        return _mix(hash((var_name, key, _hashable(value))))
+
+
+# ****************************************        Function Declaration        **************************************** #
+def var_fingerprint(var_name: str, value) -> int:
+    """
+    var_fingerprint(var_name, value) returns the 64-bit fingerprint of a state variable bound to value.
+    For mappings, it is the XOR of the binding hashes of all its items (plus a hash of the variable name).
+
+    :param var_name: Name of the state variable.
+    :param value: The value of the state variable.
+    :return: A 64-bit integer.
+    """
+    if isinstance(value, Mapping):
+        fp = _mix(hash((var_name,)))
+        for key, val in value.items():
+            fp ^= binding_hash(var_name, key, val)
+        return fp
+    try:
+        return _mix(hash((var_name, value)))
+    except TypeError:
+        return _mix(hash((var_name, _hashable(value))))
+
+
+# ****************************************        Function Declaration        **************************************** #
+def bindings_fingerprint(bindings: dict) -> int:
+    """
+    bindings_fingerprint(vars(obj)) returns the 64-bit fingerprint of all the variable bindings of obj
+    (a State or a MultiGoal). The __name__ of obj is not a part of its fingerprint.
+
+    :param bindings: The dictionary of variable bindings, i.e., vars(obj).
+    :return: A 64-bit integer.
+    """
+    fp = 0
+    for var_name, value in bindings.items():
+        if var_name != '__name__':
+            fp ^= var_fingerprint(var_name, value)
+    return fp
+
+
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test fingerprint of variable bindings ...")
+    print(hex(bindings_fingerprint({'__name__': 'test', 'loc': {'r1': 'l1', 'r2': 'l2'}, 'flag': 0})))
+    print(hex(bindings_fingerprint({'flag': 0, 'loc': {'r2': 'l2', 'r1': 'l1'}})))
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of MethodCache Class (a bounded LRU cache of method refinements).
+
+A method is expected to be a pure function of the state and the task arguments. So, the result of calling a method
+can be reused whenever the same method is called with the same arguments in a state with the same fingerprint (see
+ipyhop.fingerprint). Methods that depend on anything else (e.g., random numbers or external data) must be marked with
+the uncached decorator.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Callable
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+_MISSING = object()
+
+
+# ****************************************        Function Declaration        **************************************** #
+def uncached(method: Callable) -> Callable:
+    """
+    Decorator marking a method as impure, so that IPyHOP never caches its results.
+
+    :param method: A method function.
+    :return: The same method function.
+    """
+    method.cacheable = False
+    return method
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class MethodCache(object):
+    """
+    A bounded LRU cache mapping (method, task arguments, state fingerprint) to the result of the method call.
+
+    *   planner = IPyHOP(methods, actions, method_cache=MethodCache(maxsize)) tells IPyHOP to cache the method calls.
+        When the cache holds maxsize results, the least recently used one is evicted.
+    *   cache.cache_info() returns the hit, miss and eviction counts, the maxsize and the current size of the cache.
+    *   cache.clear() removes all the results and resets the statistics.
+
+    The cache is kept across calls to plan() and replan(), and can be shared between planners using the same domain.
+    Fingerprints are only comparable within one Python process, so a cache must not be shared across processes. It can
+    be shared between threads (the methods are called outside of its lock).
+    Computing the fingerprint of a PersistentState (i.e., when planning with trail=True) takes O(1), but computing
+    the fingerprint of a State takes time proportional to its size.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        assert type(maxsize) == int and maxsize > 0, "maxsize must be a positive integer."
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __len__(self):
+        return len(self._results)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return 'MethodCache' + repr(tuple(self.cache_info()))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def call(self, method: Callable, state, args: tuple):
+        """
+        Call method(state, *args), or reuse the result of an earlier call made in a state having the same fingerprint.
+
+        :param method: The method function.
+        :param state: The current state.
+        :param args: The arguments of the task/goal (or the multigoal) following the state.
+        :return: The result of the method call.
+        """
+        if not getattr(method, 'cacheable', True):
+            return method(state, *args)
+        try:
+            key = (method, args, state.fingerprint())
+            hash(key)
+        except TypeError:  # Unhashable task arguments can not be cached.
+            return method(state, *args)
+
+        with self._lock:
+            result = self._results.get(key, _MISSING)
+            if result is not _MISSING:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = method(state, *args)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def cache_info(self) -> CacheInfo:
+        """
+        :return: A CacheInfo named tuple (hits, misses, evictions, maxsize, currsize).
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._results))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def clear(self):
+        """
+        Remove all the cached results and reset the statistics.
+        """
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    from ipyhop.state import State
+
+    def test_method(state, arg): return [('test_action', arg, state.val[arg])]
+
+    print("Test instantiation of MethodCache class ...")
+    test_cache = MethodCache(2)
+    test_state = State('test_state')
+    test_state.val = {'a': 1, 'b': 2}
+    for test_arg in ('a', 'b', 'a', 'b', 'a'):
+        print(test_cache.call(test_method, test_state, (test_arg,)))
+    print(test_cache)
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
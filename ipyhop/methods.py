@@ -6,6 +6,8 @@ File Description: File used for definition of Methods Class.
 # ******************************************    Libraries to be imported    ****************************************** #
 from __future__ import print_function, division
 from typing import List, Callable, Union, Any
+from ipyhop.dispatch import add_entry
+from ipyhop.sol_tree import T, G
 
 
 # ******************************************    Class Declaration Start     ****************************************** #
@@ -27,12 +29,16 @@ class Methods(object):
         {gaol_name_1: [method_func_a, ...], goal_name_2: [method_func_x, ...]...}
     All the multigoal methods are stored in a dictionary member variable named method_dict with the following structure:
         {multigaol_tag_1: [method_func_a, ...], multigoal_tag_2: [method_func_x, ...]..., split: tm_split_multigaol}
+    The tasks and goals are also entered in a dispatch table named dispatch as they are declared (see ipyhop.dispatch).
+    A name can not be declared both as a task and as a goal. revision counts the declarations made so far.
     """
 
     def __init__(self):
         self.task_method_dict = dict()
         self.goal_method_dict = dict()
         self.multigoal_method_dict = {None: []}
+        self.dispatch = dict()
+        self.revision = 0
 
     # ******************************        Class Method Declaration        ****************************************** #
     def __str__(self):
@@ -67,7 +73,9 @@ class Methods(object):
         assert type(method_list) == list, "method_list must be a list."
         for method in method_list:
             assert callable(method), "method in method_list should be callable."
+        add_entry(self.dispatch, task_name, T, method_list)
         self.task_method_dict.update({task_name: method_list})
+        self.revision += 1
 
     # ******************************        Class Method Declaration        ****************************************** #
     def declare_goal_methods(self, goal_name: str, method_list: _method_list_type):
@@ -83,7 +91,9 @@ class Methods(object):
         assert type(method_list) == list, "method_list must be a list."
         for method in method_list:
             assert callable(method), "method in method_list should be callable."
+        add_entry(self.dispatch, goal_name, G, method_list)
         self.goal_method_dict.update({goal_name: method_list})
+        self.revision += 1
 
     # ******************************        Class Method Declaration        ****************************************** #
     def declare_multigoal_methods(self, multigoal_tag: Union[None, str], method_list: _method_list_type):
@@ -100,6 +110,7 @@ class Methods(object):
         for method in method_list:
             assert callable(method), "method in method_list should be callable."
         self.multigoal_method_dict.update({multigoal_tag: method_list})
+        self.revision += 1
 
 
 # ******************************************    Class Declaration End       ****************************************** #
@@ -6,6 +6,7 @@ File Description: File used for definition of Multigoal Class.
 # ******************************************    Libraries to be imported    ****************************************** #
 from copy import deepcopy
 from typing import Union
+from ipyhop.fingerprint import bindings_fingerprint
 
 
 # ******************************************    Class Declaration Start     ****************************************** #
@@ -48,6 +49,17 @@ class MultiGoal(object):
         self.__dict__.update(multigoal.__dict__)
         return self
 
+    # ******************************        Class Method Declaration        ****************************************** #
+    def fingerprint(self) -> int:
+        """
+        mg.fingerprint() returns a 64-bit fingerprint of the variable bindings of the MultiGoal (including its goal_tag,
+        but not its name). It is computed exactly like State.fingerprint(). See ipyhop.fingerprint for the equality
+        contract.
+
+        :return: A 64-bit integer.
+        """
+        return bindings_fingerprint(self.__dict__)
+
     # ******************************        Class Method Declaration        ****************************************** #
     def copy(self):
         return deepcopy(self)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of NogoodMemo Class (a bounded memo of the failed task/goal refinements).
+
+A task/goal/multigoal node is exhausted when all of its methods were tried and none of them led to a solution. If the
+node never completed (i.e., the planner never refined all of its descendants), then it can not be accomplished at all
+from the state it was first visited in, whatever comes after it. Such a (node info, state fingerprint) pair is a
+nogood. Since methods are expected to be pure functions of the state and the task arguments, the planner can fail any
+later node having the same info in a state with the same fingerprint immediately.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Hashable
+
+MemoInfo = namedtuple('MemoInfo', ['hits', 'nogoods', 'evictions', 'maxsize', 'currsize'])
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class NogoodMemo(object):
+    """
+    A bounded memo of nogoods. When it holds maxsize nogoods, the least recently used one is evicted.
+
+    *   planner = IPyHOP(methods, actions, nogood_memo=NogoodMemo(maxsize)) tells IPyHOP to learn nogoods and prune
+        the nodes matching them. Every search learns its nogoods in a memo of the same maxsize held by its
+        PlanningContext (context.nogood_memo, e.g., planner.context.nogood_memo), which is cleared at the start of every
+        call to plan() and replan(). So the searches run at once in other contexts never share nogoods.
+    *   memo.memo_info() returns the hit, nogood and eviction counts, the maxsize and the current size of the memo.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        assert type(maxsize) == int and maxsize > 0, "maxsize must be a positive integer."
+        self.maxsize = maxsize
+        self._nogoods = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.nogoods = 0
+        self.evictions = 0
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __len__(self):
+        return len(self._nogoods)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __contains__(self, key: Hashable):
+        with self._lock:
+            if key in self._nogoods:
+                self._nogoods.move_to_end(key)
+                self.hits += 1
+                return True
+            return False
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return 'NogoodMemo' + repr(tuple(self.memo_info()))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def add(self, key: Hashable):
+        """
+        Record a nogood.
+
+        :param key: The (node info, state fingerprint) pair.
+        """
+        with self._lock:
+            if key in self._nogoods:
+                self._nogoods.move_to_end(key)
+                return
+            self._nogoods[key] = None
+            self.nogoods += 1
+            if len(self._nogoods) > self.maxsize:
+                self._nogoods.popitem(last=False)
+                self.evictions += 1
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def memo_info(self) -> MemoInfo:
+        """
+        :return: A MemoInfo named tuple (hits, nogoods, evictions, maxsize, currsize).
+        """
+        return MemoInfo(self.hits, self.nogoods, self.evictions, self.maxsize, len(self._nogoods))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def clear(self):
+        """
+        Remove all the nogoods and reset the statistics.
+        """
+        with self._lock:
+            self._nogoods.clear()
+            self.hits = self.nogoods = self.evictions = 0
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test instantiation of NogoodMemo class ...")
+    test_memo = NogoodMemo(2)
+    for test_key in ((('t_1',), 1), (('t_2',), 1), (('t_1',), 2)):
+        test_memo.add(test_key)
+    print((('t_1',), 1) in test_memo, (('t_1',), 2) in test_memo)
+    print(test_memo)
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
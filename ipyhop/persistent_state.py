@@ -0,0 +1,596 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of PersistentState Class (a copy-on-write State backend).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections.abc import MutableMapping
+from copy import copy, deepcopy
+from typing import Dict, Iterable
+from ipyhop.state import State, _RIGID_TYPES, _freeze
+from ipyhop.fingerprint import binding_hash, var_fingerprint
+
+# Values of these types can be shared between states without ever being copied.
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, complex, bytes, tuple, frozenset, type(None)})
+# Marker recorded on the trail when a key (or variable) did not exist before it was written.
+_MISSING = object()
+# Attributes of PersistentState that are not state variables.
+_INTERNAL_ATTRS = frozenset({'_copy_policy', '_trail', '_fp', '_fp_dirty'})
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class StateMap(MutableMapping):
+    """
+    A copy-on-write view of one dict valued state variable of a PersistentState.
+
+    *   Several StateMap views (belonging to different states) can share the same underlying dict. The underlying dict
+        is copied only when a view that shares it is written to, so copying a state never copies its variables.
+        Mutable values nested inside a shared dict (lists, dicts, sets, ...) are copied before they are handed out,
+        so in-place edits such as state.coffin_filled[c].append(x) never leak into other states.
+
+    A StateMap behaves like the dict it wraps, so domain code such as state.loc[r] = l_ keeps working unchanged.
+    Every write made through a view is reported to the state owning it (for the trail and the fingerprint).
+    """
+
+    __slots__ = ('_data', '_shared', '_flat', '_owner', '_name', '_fp')
+
+    def __init__(self, data=None):
+        self._data = dict() if data is None else data
+        self._shared = False
+        self._flat = all(type(v) in _IMMUTABLE_TYPES for v in self._data.values())
+        self._owner = None
+        self._name = None
+        self._fp = None
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _fork(self):
+        """
+        Create a new view sharing the underlying dict of this view. Both the views become copy-on-write.
+        """
+        self._shared = True
+        view = StateMap.__new__(StateMap)
+        view._data = self._data
+        view._shared = True
+        view._flat = self._flat
+        view._owner = None
+        view._name = self._name
+        view._fp = self._fp
+        owner = self._owner
+        if owner is not None and owner._fp_dirty and self._name in owner._fp_dirty:
+            view._fp = None
+        return view
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _unshare(self):
+        """
+        Give this view a private copy of the underlying dict. Only the mutable values are deep copied.
+        """
+        if self._flat:
+            self._data = dict(self._data)
+        else:
+            self._data = {k: v if type(v) in _IMMUTABLE_TYPES else deepcopy(v) for k, v in self._data.items()}
+        self._shared = False
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _stale(self):
+        """
+        Called when a mutable value of this view is handed out (it may be modified in place after that), so the
+        fingerprint of this view can no longer be updated incrementally.
+        """
+        if self._owner is not None:
+            self._owner._mark_dirty(self._name)
+        else:
+            self._fp = None
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _expose_mutables(self):
+        """
+        Called before the mutable values of this view are handed out (they may be modified in place after that).
+        """
+        if self._shared:
+            self._unshare()
+        owner = self._owner
+        if owner is not None and owner._trail is not None:
+            owner._trail.extend((self, k, deepcopy(v)) for k, v in self._data.items()
+                                if type(v) not in _IMMUTABLE_TYPES)
+        if self._fp is not None:
+            self._stale()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _write(self, key, value):
+        """
+        Bind key to value (or remove the key if value is _MISSING) in the underlying dict, updating the fingerprint.
+        """
+        data = self._data
+        if self._fp is not None:
+            old_value = data.get(key, _MISSING)
+            if (old_value is _MISSING or type(old_value) in _IMMUTABLE_TYPES) and \
+                    (value is _MISSING or type(value) in _IMMUTABLE_TYPES):
+                delta = 0
+                if old_value is not _MISSING:
+                    delta = binding_hash(self._name, key, old_value)
+                if value is not _MISSING:
+                    delta ^= binding_hash(self._name, key, value)
+                self._fp ^= delta
+                if self._owner is not None:
+                    self._owner._fp ^= delta
+            else:
+                self._stale()
+        if value is _MISSING:
+            data.pop(key, None)
+        else:
+            if type(value) not in _IMMUTABLE_TYPES:
+                self._flat = False
+            data[key] = value
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _undo(self, key, old_value):
+        if self._shared:
+            self._unshare()
+        self._write(key, old_value)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __getitem__(self, key):
+        value = self._data[key]
+        if not self._flat and type(value) not in _IMMUTABLE_TYPES:
+            if self._shared:
+                self._unshare()
+                value = self._data[key]
+            owner = self._owner
+            if owner is not None and owner._trail is not None:
+                # The value can be modified in place. So, record it as if it was written.
+                owner._trail.append((self, key, deepcopy(value)))
+            if self._fp is not None:
+                self._stale()
+        return value
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __setitem__(self, key, value):
+        if self._shared:
+            self._unshare()
+        owner = self._owner
+        if owner is not None and owner._trail is not None:
+            owner._trail.append((self, key, self._data.get(key, _MISSING)))
+        self._write(key, value)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __delitem__(self, key):
+        if key not in self._data:
+            raise KeyError(key)
+        if self._shared:
+            self._unshare()
+        owner = self._owner
+        if owner is not None and owner._trail is not None:
+            owner._trail.append((self, key, self._data[key]))
+        self._write(key, _MISSING)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def get(self, key, default=None):
+        if key in self._data:
+            return self[key]
+        return default
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        if not self._flat:
+            self._expose_mutables()
+        return self._data.values()
+
+    def items(self):
+        if not self._flat:
+            self._expose_mutables()
+        return self._data.items()
+
+    def copy(self):
+        return dict(self._data) if self._flat else deepcopy(self._data)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __eq__(self, other):
+        if isinstance(other, StateMap):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return repr(self._data)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __copy__(self):
+        return dict(self._data)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self._data, memo)
+
+    def __reduce__(self):
+        return dict, (self._data,)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class PersistentState(State):
+    """
+    A PersistentState is a State whose dict valued variables are stored as copy-on-write StateMap views.
+
+    *   state = PersistentState('foo') creates an empty persistent state object named 'foo'. Variables are assigned
+        exactly as with State, i.e., foo.var1 = val1. An existing State can be converted using
+        PersistentState.from_state(state).
+
+    PersistentState.copy() runs in time proportional to the number of state variables (not their size) since the
+    copy shares every variable with the original. A write through either state copies only the variable it touches.
+    It is a drop-in replacement for State and can be passed to IPyHOP.plan() in its place.
+
+    Copy policies declared using declare_copy_policy are honored for variables that are not dicts. Dict variables are
+    always copy-on-write, unless they are declared State.RIGID (in which case they are frozen and shared).
+
+    A PersistentState can also record every write made to it on a trail (see start_trail). The writes made after a
+    trail_mark() can then be undone using undo_trail(mark), without ever copying the state.
+
+    Once fingerprint() has been called, the fingerprint is maintained incrementally: every write updates it in O(1)
+    and copies of the state inherit it.
+    """
+
+    __slots__ = ('_trail', '_fp', '_fp_dirty')
+
+    def __init__(self, name: str):
+        object.__setattr__(self, '_trail', None)
+        object.__setattr__(self, '_fp', None)
+        object.__setattr__(self, '_fp_dirty', None)
+        State.__init__(self, name)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __setattr__(self, name, value):
+        if name in _INTERNAL_ATTRS:
+            object.__setattr__(self, name, value)
+            return
+        if type(value) is dict or type(value) is StateMap:
+            copy_policy = self._copy_policy
+            if copy_policy is not None and copy_policy.get(name) == State.RIGID:
+                value = _freeze(value if type(value) is dict else value._data)
+            elif type(value) is dict:
+                # The caller may still hold a reference to the dict, so treat it as shared.
+                value = StateMap(value)._fork()
+            else:
+                value = value._fork()
+        if self._trail is not None:
+            self._trail.append((self, name, self.__dict__.get(name, _MISSING)))
+        self._bind(name, value)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __delattr__(self, name):
+        if name not in self.__dict__:
+            raise AttributeError(name)
+        if self._trail is not None:
+            self._trail.append((self, name, self.__dict__[name]))
+        self._bind(name, _MISSING)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _bind(self, name, value):
+        """
+        Bind the variable name to value (or remove it if value is _MISSING), updating the fingerprint.
+        """
+        self_dict = self.__dict__
+        old_value = self_dict.get(name, _MISSING)
+        if type(old_value) is StateMap:
+            old_value._owner = None
+        if value is _MISSING:
+            self_dict.pop(name, None)
+        else:
+            if type(value) is StateMap:
+                if value._name != name or self._fp is None:
+                    value._name = name
+                    value._fp = None
+                value._owner = self
+            self_dict[name] = value
+        fp = self._fp
+        if fp is None or name == '__name__':
+            return
+        dirty = self._fp_dirty
+        if dirty and name in dirty:
+            dirty.discard(name)
+            if type(old_value) is StateMap:
+                # The old view may have been modified in place since its fingerprint was computed. So, it is
+                # recomputed if the view is bound again (e.g. by undo_trail()).
+                fp ^= old_value._fp
+                old_value._fp = None
+        else:
+            fp ^= _tracked_fingerprint(name, old_value)
+        new_fp = _tracked_fingerprint(name, value)
+        if new_fp is None:
+            self._mark_dirty(name)
+        else:
+            fp ^= new_fp
+        object.__setattr__(self, '_fp', fp)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _mark_dirty(self, name):
+        """
+        Mark the variable name as possibly modified in place. Its fingerprint is recomputed by fingerprint().
+        """
+        if self._fp_dirty is None:
+            object.__setattr__(self, '_fp_dirty', {name})
+        else:
+            self._fp_dirty.add(name)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def fingerprint(self) -> int:
+        """
+        Get the 64-bit fingerprint of the variable bindings of this state (see ipyhop.fingerprint for the equality
+        contract). It is the same as State.fingerprint() of a State having the same variable bindings.
+
+        The first call computes the fingerprint in O(size of state). After that it is updated on every write in O(1).
+        Only the variables that may have been modified in place (by writing into a list or dict handed out by the
+        state) are rehashed.
+
+        :return: A 64-bit integer.
+        """
+        if self._fp is None:
+            self._start_fingerprint()
+        fp = self._fp
+        dirty = self._fp_dirty
+        if dirty:
+            self_dict = self.__dict__
+            for name in tuple(dirty):
+                val = self_dict[name]
+                if type(val) is StateMap:
+                    new_fp = var_fingerprint(name, val._data)
+                    fp ^= val._fp ^ new_fp
+                    val._fp = new_fp
+                    dirty.discard(name)
+            object.__setattr__(self, '_fp', fp)
+            # The remaining variables are mutable values that are not dicts. They are rehashed on every call.
+            for name in dirty:
+                fp ^= var_fingerprint(name, self_dict[name])
+        return fp
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _start_fingerprint(self):
+        fp = 0
+        dirty = set()
+        for name, val in self.__dict__.items():
+            if name == '__name__':
+                continue
+            if type(val) is StateMap:
+                val._name = name
+                val._fp = var_fingerprint(name, val._data)
+                fp ^= val._fp
+            elif type(val) in _IMMUTABLE_TYPES or type(val) in _RIGID_TYPES:
+                fp ^= var_fingerprint(name, val)
+            else:
+                dirty.add(name)
+        object.__setattr__(self, '_fp_dirty', dirty if dirty else None)
+        object.__setattr__(self, '_fp', fp)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def declare_copy_policy(self, var_name: str, policy: str):
+        val = self.__dict__.get(var_name, _MISSING)
+        if policy == State.RIGID and val is not _MISSING:
+            self._bind(var_name, _freeze(val._data if type(val) is StateMap else val))
+        State.declare_copy_policy(self, var_name, policy)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    @classmethod
+    def from_state(cls, state: State):
+        """
+        Create a PersistentState holding a (deep) copy of the variable bindings of a State.
+
+        :param state: An instance of State class.
+        :return: An instance of PersistentState class.
+        """
+        new_state = cls(state.__name__)
+        new_state._copy_policy = getattr(state, '_copy_policy', None)
+        new_state._adopt_bindings(deepcopy(state.__dict__))
+        return new_state
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _adopt_bindings(self, state_dict):
+        self_dict = self.__dict__
+        for name, val in state_dict.items():
+            if type(val) is dict:
+                val = StateMap(val)
+                val._owner = self
+                val._name = name
+            self_dict[name] = val
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def update(self, state):
+        trail = self._trail
+        for name, val in state.__dict__.items():
+            if type(val) is StateMap:
+                val = val._fork()
+            elif type(val) is dict:
+                val = StateMap(val)._fork()
+            if trail is not None:
+                trail.append((self, name, self.__dict__.get(name, _MISSING)))
+            self._bind(name, val)
+        self._update_copy_policy(state)
+        return self
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def copy(self):
+        copy_policy = self._copy_policy
+        new_state = self.__class__.__new__(self.__class__)
+        object.__setattr__(new_state, '_trail', None)
+        object.__setattr__(new_state, '_fp', self._fp)
+        object.__setattr__(new_state, '_fp_dirty', set(self._fp_dirty) if self._fp_dirty else None)
+        new_state._copy_policy = copy_policy
+        new_dict = new_state.__dict__
+        self_dict = self.__dict__
+        for name, val in self_dict.items():
+            if type(val) is StateMap:
+                view = val._fork()
+                view._fp = val._fp
+                view._owner = new_state
+                new_dict[name] = view
+            elif type(val) in _IMMUTABLE_TYPES or type(val) in _RIGID_TYPES:
+                new_dict[name] = val
+            else:
+                policy = State.DEEP if copy_policy is None else copy_policy.get(name, State.DEEP)
+                if policy == State.DEEP:
+                    new_dict[name] = deepcopy(val)
+                elif policy == State.RIGID:
+                    val = self_dict[name] = _freeze(val)
+                    new_dict[name] = val
+                else:
+                    new_dict[name] = copy(val)
+        return new_state
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def start_trail(self):
+        """
+        Start recording every write made to this state on a (new, empty) trail.
+        """
+        object.__setattr__(self, '_trail', [])
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def stop_trail(self):
+        """
+        Stop recording the writes made to this state and discard the trail.
+        """
+        object.__setattr__(self, '_trail', None)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def trail_mark(self) -> int:
+        """
+        Get a mark for the current position of the trail. Passing the mark to undo_trail() brings the state back to
+        what it is now.
+
+        :return: An integer representing the current position of the trail.
+        """
+        trail = self._trail
+        mark = len(trail)
+        # Variables that are neither dicts nor immutable can be modified in place without notice. Record them as is.
+        for name, val in self.__dict__.items():
+            if type(val) not in _IMMUTABLE_TYPES and type(val) is not StateMap and type(val) not in _RIGID_TYPES:
+                trail.append((self, name, deepcopy(val)))
+        return mark
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def undo_trail(self, mark: int):
+        """
+        Undo all the writes recorded on the trail after the given mark (in the reverse order of the writes).
+
+        :param mark: An integer returned by trail_mark().
+        """
+        trail = self._trail
+        while len(trail) > mark:
+            target, key, old_value = trail.pop()
+            target._undo(key, old_value)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def trail_states(self, marks: Iterable[int]) -> Dict[int, 'PersistentState']:
+        """
+        Get copies of the state as it was at the given marks of the trail. The state and its trail are left unchanged
+        (the writes undone to reach the marks are redone afterwards).
+
+        :param marks: Integers returned by trail_mark().
+        :return: A dictionary mapping every mark to a copy of the state at that mark.
+        """
+        trail = self._trail
+        redo = []
+        states = dict()
+        # Stop recording while undoing and redoing the writes, so that the trail is not modified.
+        object.__setattr__(self, '_trail', None)
+        try:
+            pos = len(trail)
+            for mark in sorted(set(marks), reverse=True):
+                while pos > mark:
+                    pos -= 1
+                    target, key, old_value = trail[pos]
+                    current = target.__dict__ if target is self else target._data
+                    redo.append((target, key, current.get(key, _MISSING)))
+                    target._undo(key, old_value)
+                states[mark] = self.copy()
+        finally:
+            for target, key, value in reversed(redo):
+                target._undo(key, value)
+            object.__setattr__(self, '_trail', trail)
+        return states
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _undo(self, name, old_value):
+        # A restored view holding mutable values may have been modified in place while it was not bound.
+        if type(old_value) is StateMap and not old_value._flat:
+            old_value._fp = None
+        self._bind(name, old_value)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __reduce__(self):
+        return _rebuild_persistent_state, (self.__class__, deepcopy(self.__dict__), self._copy_policy)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# **************************************        Function Declaration        ****************************************** #
+def _tracked_fingerprint(name, value):
+    """
+    Fingerprint of a variable that can be maintained incrementally, or None if the variable can be modified in place
+    without notice (in which case it is rehashed on every call to fingerprint()).
+    """
+    if value is _MISSING:
+        return 0
+    if type(value) is StateMap:
+        if value._fp is None:
+            value._fp = var_fingerprint(name, value._data)
+        return value._fp
+    if type(value) in _IMMUTABLE_TYPES or type(value) in _RIGID_TYPES:
+        return var_fingerprint(name, value)
+    return None
+
+
+# **************************************        Function Declaration        ****************************************** #
+def _rebuild_persistent_state(cls, state_dict, copy_policy):
+    new_state = cls.__new__(cls)
+    object.__setattr__(new_state, '_trail', None)
+    object.__setattr__(new_state, '_fp', None)
+    object.__setattr__(new_state, '_fp_dirty', None)
+    new_state._copy_policy = copy_policy
+    new_state._adopt_bindings(state_dict)
+    return new_state
+
+
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test instantiation of PersistentState class ...")
+    test_state = PersistentState('test_state')
+    test_state.test_var_1 = {'key1': 'val1'}
+    test_state.test_var_2 = {'key1': 0}
+    test_state.test_var_3 = {'key2': {'key3': 5}, 'key3': {'key2': 5}}
+    test_copy = test_state.copy()
+    test_copy.test_var_2['key1'] = 1
+    test_copy.test_var_3['key2']['key3'] = 6
+    print(test_state)
+    print(test_copy)
+
+    test_state.start_trail()
+    test_mark = test_state.trail_mark()
+    test_state.test_var_1['key1'] = 'val2'
+    test_state.test_var_3['key2']['key3'] = 7
+    test_state.test_var_4 = 0
+    test_state.undo_trail(test_mark)
+    print(test_state)
+    print(hex(test_state.fingerprint()))
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
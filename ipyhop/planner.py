@@ -5,15 +5,45 @@ File Description: File used for definition of IPyHOP Class.
 
 # ******************************************    Libraries to be imported    ****************************************** #
 from __future__ import print_function, division
+import asyncio
+import pickle
+from array import array
+from collections import namedtuple
 from itertools import count
-from typing import List, Tuple, Union, Optional
+from time import monotonic, perf_counter
+from typing import List, Tuple, Union, Optional, Iterable, Iterator, Callable
 from ipyhop.methods import Methods
-from ipyhop.actions import Actions
+from ipyhop.actions import Actions, SplitAction
+from ipyhop.dispatch import compile_domain
+from ipyhop.method_cache import MethodCache
+from ipyhop.nogood_memo import NogoodMemo
+from ipyhop.budget import Budget, PlanResult, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN, CANCELLED, TRAIL_ENTRY_BYTES, \
+    approx_state_bytes, search_stats
 from ipyhop.state import State
+from ipyhop.persistent_state import PersistentState
+from ipyhop.planning_context import PlanningContext, _ContextAttribute
+from ipyhop.batch import plan_batch, BatchResult
+from ipyhop.portfolio import plan_portfolio, PortfolioConfig, PortfolioResult
+from ipyhop.cost_bound import CostBound
+from ipyhop.best_first import best_first_search
+from ipyhop.conflict_tracker import ConflictTracker
+from ipyhop.tracked_state import TrackedState, AccessProfile
 from ipyhop.mulitgoal import MultiGoal
-from networkx import DiGraph, dfs_preorder_nodes, descendants, is_tree
+from ipyhop.sol_tree import SolutionTree, SolNode, D, T, A, G, M, VG, VM, NA, OPEN, CLOSED, NO_SNAPSHOT
 from copy import deepcopy
 
+# Version of the format of the bytes returned by IPyHOP.checkpoint().
+CHECKPOINT_VERSION = 1
+# The arrays of the SolutionTree saved in a checkpoint.
+_TREE_ARRAYS = ('parent', 'first_child', 'last_child', 'next_sibling', 'open_child', 'node_type', 'status',
+                'choice_points')
+
+PlanSolution = namedtuple('PlanSolution', ['plan', 'sol_tree', 'cost'])
+PlanSolution.__doc__ = """
+A solution yielded by IPyHOP.iter_plans(): the plan, its solution tree (a networkx DiGraph, as planner.sol_tree) and
+its cost (the sum of the Actions.action_cost of its actions).
+"""
+
 
 # ******************************************    Class Declaration Start     ****************************************** #
 class IPyHOP(object):
@@ -23,25 +53,58 @@ class IPyHOP(object):
 
     *   planner = IPyHOP(methods, actions) tells IPyHOP to create a IPyHOP planner object.
         To plan using the planner, you should use planner.plan(state, task_list).
+
+    *   The constructor options (trail, method_cache, nogood_memo, detect_cycles, backjumping and access_profile)
+        change how the search is run. See the parameters of __init__().
+
+    *   Besides plan() and replan(), the planner can resume() a search paused by its budget (see ipyhop.budget), and
+        search with aplan(), plan_batch(), plan_portfolio(), plan_optimal(), plan_best_first() and iter_plans().
+        Everything a search changes is held in a PlanningContext (see ipyhop.planning_context).
     """
 
-    def __init__(self, methods: Methods, actions: Actions):
+    def __init__(self, methods: Methods, actions: Actions, trail: bool = False,
+                 method_cache: Optional[MethodCache] = None, nogood_memo: Optional[NogoodMemo] = None,
+                 detect_cycles: bool = False, backjumping: bool = False,
+                 access_profile: Optional[AccessProfile] = None):
         """
         IPyHOP Constructor.
 
         :param methods: An instance of Methods class containing the collection of methods in the planning domain.
         :param actions: An instance of Actions class containing the collection of actions in the planning domain.
+        :param trail: [Optional] If True, the state is restored on backtracking by undoing the writes recorded on a
+            trail instead of restoring a copy of the state saved in the node.
+        :param method_cache: [Optional] An instance of MethodCache class used to reuse the results of the method calls
+            made in states having the same fingerprint.
+        :param nogood_memo: [Optional] An instance of NogoodMemo class giving the maxsize of the memo of the task/goal/
+            multigoal nodes that could not be accomplished from a given state, used to fail such nodes immediately on
+            re-entry. Every search learns its nogoods in its own memo (context.nogood_memo).
+        :param detect_cycles: [Optional] If True, a task/goal/multigoal node fails if one of its ancestors has the same
+            info and was visited in a state with the same fingerprint (i.e., if the decomposition is looping).
+        :param backjumping: [Optional] If True, the planner backtracks from a failure explained by the state to the
+            latest choice point blamed for it (see ipyhop.conflict_tracker). The method cache is then not used.
+        :param access_profile: [Optional] An instance of AccessProfile class recording the accesses of the method and
+            action calls. The method cache is then not used.
         """
         self.methods = methods
         self.actions = actions
-        self.state = None
-        self.task_list = []
-        self.sol_plan = []
-        self.sol_tree = DiGraph()
+        self.trail = trail
+        self.method_cache = method_cache
+        self.nogood_memo = nogood_memo
+        self.detect_cycles = detect_cycles
+        self.backjumping = backjumping
+        self.access_profile = access_profile
         self.blacklist = set()
-        self.iterations = None
+        self.context = PlanningContext()
+        self._dispatch = None
+        self._dispatch_key = None
 
-        self._verbose = 0
+    # The attributes of the current planning context (see ipyhop.planning_context).
+    state = _ContextAttribute('state')
+    task_list = _ContextAttribute('task_list')
+    sol_plan = _ContextAttribute('sol_plan')
+    sol_tree = _ContextAttribute('sol_tree')
+    iterations = _ContextAttribute('iterations')
+    result = _ContextAttribute('result')
 
     _t_type = List[Tuple[str]]
     _m_type = Optional[Methods]
@@ -50,7 +113,8 @@ class IPyHOP(object):
 
     # ******************************        Class Method Declaration        ****************************************** #
     def plan(self, state: State, task_list: _t_type, methods: _m_type = None, actions: _op_type = None,
-             verbose: Optional[int] = 0) -> _p_type:
+             verbose: Optional[int] = 0, budget: Optional[Budget] = None,
+             context: Optional[PlanningContext] = None) -> _p_type:
         """
         IPyHOP.plan(state_1, tasks) tells IPyHOP to find a plan for accomplishing the task_list (a list of tasks)
         *tasks*, starting from an initial state *state_1*, using whatever methods and actions IPyHOP was constructed
@@ -74,204 +138,643 @@ class IPyHOP(object):
         :param actions: [Optional] An instance of Actions class containing the collection of actions in the
             planning domain.
         :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
-        :return: A list containing the solution plan.
+        :param budget: [Optional] An instance of Budget class limiting the search.
+        :param context: [Optional] An instance of PlanningContext class to search in. If None, a new one is created and
+            stored in planner.context (see ipyhop.planning_context).
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
         """
-        self.state = state.copy()
-        self.task_list = deepcopy(task_list)
+        if context is None:
+            context = self.context = PlanningContext()
         self.methods = self.methods if methods is None else methods
         self.actions = self.actions if actions is None else actions
-        self._verbose = verbose
+        parent_node_id = self._start_search(context, state, task_list, verbose, None)
+        self._search(context, parent_node_id, budget)
+        return context.sol_plan if budget is None else context.result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def plan_optimal(self, state: State, task_list: _t_type, lower_bound: Optional[Callable] = None,
+                     on_solution: Optional[Callable[[List[Tuple], float], None]] = None, verbose: Optional[int] = 0,
+                     budget: Optional[Budget] = None, context: Optional[PlanningContext] = None) -> _p_type:
+        """
+        IPyHOP.plan_optimal(state_1, tasks) tells IPyHOP to find a plan of minimum total cost for accomplishing tasks
+        from state_1, the cost of a plan being the sum of the costs of its actions (Actions.action_cost, set using
+        Actions.declare_action_models(); 1.0 by default). The costs must be non-negative.
+
+        The search is a branch and bound over the same decompositions as plan(). After each plan, it backtracks as if
+        the plan had failed and goes on, pruning every action that would make the cost of the plan reach the cost of
+        the best plan found so far, and every task/goal/multigoal node for which the cost of the plan so far plus
+        lower_bound(state, node_info) does. It ends when no alternative is left, which proves the best plan optimal.
+        So it explores at least as many nodes as plan(), and usually many more.
+
+        With a budget, the search stops when the budget runs out (and can be resumed, see resume()). The PlanResult
+        then has the status BUDGET_EXHAUSTED and holds the best plan found so far (None if none was found). In both
+        cases stats holds cost (the cost of the best plan, or None) and solutions (the number of improving plans).
+
+        :param state: An instance of State class containing the collection of variable bindings representing
+            the current/initial state in the planning problem.
+        :param task_list: A list of tasks that need to be accomplished in the planning problem.
+        :param lower_bound: [Optional] A function lower_bound(state, node_info) returning an admissible (never
+            overestimating) lower bound of the cost of accomplishing the task/goal/multigoal node_info from state.
+        :param on_solution: [Optional] A function on_solution(plan, cost) called with every improving plan, as soon as
+            it is found.
+        :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
+        :param budget: [Optional] An instance of Budget class limiting the search.
+        :param context: [Optional] An instance of PlanningContext class to search in (see plan()).
+        :return: A list containing the cheapest plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
+        """
+        if context is None:
+            context = self.context = PlanningContext()
+        cost_bound = CostBound(self.actions.action_cost, lower_bound, on_solution)
+        parent_node_id = self._start_search(context, state, task_list, verbose, cost_bound)
+        self._search(context, parent_node_id, budget)
+        return context.sol_plan if budget is None else context.result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def iter_plans(self, state: State, task_list: _t_type, dedup: bool = False, max_plans: Optional[int] = None,
+                   verbose: Optional[int] = 0, budget: Optional[Budget] = None,
+                   context: Optional[PlanningContext] = None) -> Iterator[PlanSolution]:
+        """
+        IPyHOP.iter_plans(state_1, tasks) is a generator of the solutions for accomplishing tasks from state_1, in the
+        order the depth first search of plan() discovers them (so the first one is the plan of plan()). Each solution
+        is a PlanSolution (plan, sol_tree, cost). The search is not restarted between two solutions: after a solution
+        is yielded, the search backtracks as if its last choice had failed and goes on from there. So enumerating n
+        solutions costs about as much as the search for the n-th one.
+
+        While the generator is suspended, planner.sol_plan and planner.sol_tree (or those of context) describe the last
+        solution yielded. The generator ends when the search has no alternative left, when max_plans solutions were
+        yielded, or when the budget runs out (planner.result then has the status BUDGET_EXHAUSTED).
+
+        :param state: An instance of State class containing the collection of variable bindings representing
+            the current/initial state in the planning problem.
+        :param task_list: A list of tasks that need to be accomplished in the planning problem.
+        :param dedup: [Optional] If True, a plan with the same actions as a plan yielded before is skipped (different
+            decompositions can lead to the same actions).
+        :param max_plans: [Optional] The maximum number of solutions yielded (no limit if None).
+        :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
+        :param budget: [Optional] An instance of Budget class limiting the whole enumeration.
+        :param context: [Optional] An instance of PlanningContext class to search in (see plan()).
+        :return: An iterator over the PlanSolution of every solution.
+        """
+        assert max_plans is None or max_plans >= 0, "max_plans must be a non-negative integer."
+        if context is None:
+            context = self.context = PlanningContext()
+        ctx = context
+        parent_node_id = self._start_search(ctx, state, task_list, verbose, None)
+        # The trail must outlive each solution, to backtrack from it.
+        ctx._enumerating = True
+        seen = set()
+        n_plans, iterations = 0, 0
+        try:
+            while max_plans is None or n_plans < max_plans:
+                slice_budget = budget
+                if budget is not None and budget.max_iterations is not None:
+                    slice_budget = Budget(budget.max_iterations - iterations, budget.deadline, budget.max_nodes,
+                                          budget.max_snapshot_bytes, budget.check_interval)
+                self._search(ctx, parent_node_id, slice_budget)
+                iterations += ctx.iterations
+                if ctx.result.status != SUCCESS:
+                    return
+                plan = list(ctx.sol_plan)
+                if dedup:
+                    key = _plan_key(plan)
+                    if key in seen:
+                        plan = None
+                    seen.add(key)
+                if plan is not None:
+                    n_plans += 1
+                    yield PlanSolution(plan, ctx.sol_tree, sum(self.actions.action_cost[a[0]] for a in plan))
+                parent_node_id, _ = self._backtrack(ctx, 0, 0)
+                ctx._sol_graph = None
+        finally:
+            ctx._enumerating = False
+            if self.trail and ctx._parent_node_id is None:
+                ctx.state.stop_trail()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def plan_best_first(self, state: State, task_list: _t_type, heuristic: Optional[Callable] = None,
+                        verbose: Optional[int] = 0, budget: Optional[Budget] = None,
+                        context: Optional[PlanningContext] = None) -> _p_type:
+        """
+        IPyHOP.plan_best_first(state_1, tasks) tells IPyHOP to find a plan for accomplishing tasks from state_1 with a
+        best first search instead of the depth first search of plan(). The search keeps a priority queue of partial
+        decompositions (the actions applied so far, and the tasks/goals/multigoals/actions left to accomplish, in
+        order). It always refines the first node left of the partial decomposition with the lowest estimate, the cost
+        so far (the sum of the Actions.action_cost of its actions) plus heuristic(state, tasks). A task/goal/multigoal
+        is refined with every method that applies, each giving a new partial decomposition. So a poor method order
+        does not trap the search in a large failing subtree.
+
+        Without a heuristic (or with an admissible one, never overestimating the cost left), the plan found has the
+        minimum cost. The partial decompositions share their common parts, but the search keeps many of them alive,
+        and copies the state for every action applied (cheaply, if the planner was constructed with trail=True).
+
+        planner.sol_tree holds the decompositions of the plan in the format of plan(), and the method cursors of its
+        nodes follow the method selected. So replan() and planar_plot() work on it. The nogood memo and the cycle
+        detection of the planner are not used, and a search stopped by its budget can not be resumed.
+
+        :param state: An instance of State class containing the collection of variable bindings representing
+            the current/initial state in the planning problem.
+        :param task_list: A list of tasks that need to be accomplished in the planning problem.
+        :param heuristic: [Optional] A function heuristic(state, tasks) estimating the cost of accomplishing the list
+            tasks (of the infos of the tasks/goals/multigoals/actions left, in order) from state. 0 if None.
+        :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
+        :param budget: [Optional] An instance of Budget class limiting the search, checked as in plan(). max_iterations
+            limits the number of partial decompositions refined, max_nodes the size of the solution tree of the one
+            refined, and max_snapshot_bytes the size of the states of the partial decompositions in the queue.
+        :param context: [Optional] An instance of PlanningContext class to search in (see plan()).
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget),
+            whose stats are the ones of plan() (backtracks being the partial decompositions that failed, and snapshots
+            the distinct states in the queue), plus queued (the size of the queue) and cost (the cost of the plan, or
+            None).
+        """
+        if context is None:
+            context = self.context = PlanningContext()
+        ctx = context
+        self._start_search(ctx, state, task_list, verbose, None)
+        # The states are copied, never backtracked. A PersistentState only makes the copies cheap.
+        ctx._conflicts = None
+        if self.trail:
+            ctx.state.stop_trail()
+        steps, cost, final_state, stats = best_first_search(self, ctx, ctx.state, ctx.task_list, heuristic, budget)
+        stats['cost'] = cost
+        ctx.iterations = stats['iterations']
+        if steps is not None:
+            self._replay_steps(ctx, steps)
+            ctx.state = final_state
+            status = SUCCESS
+        else:
+            ctx._tree.remove_descendants(0)
+            status = NO_PLAN if stats['exhausted'] is None else BUDGET_EXHAUSTED
+        ctx.result = PlanResult(status, ctx.sol_plan, stats)
+        return ctx.sol_plan if budget is None else ctx.result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _replay_steps(self, ctx, steps):
+        # Build the solution tree of a best first search by making its refinements in order, as plan() would have.
+        tree = ctx._tree
+        t_type, t_nodes = tree.node_type, tree.nodes
+        for node_id, method_index, subtasks in steps:
+            node = t_nodes[node_id]
+            tree.close(node_id)
+            if method_index is not None:
+                node.selected_method = node.methods[method_index]
+                node.method_index = method_index + 1
+                self._add_nodes_and_edges(ctx, node_id, subtasks)
+            elif t_type[node_id] == A:
+                ctx.sol_plan.append(node.info)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _start_search(self, ctx, state, task_list, verbose, cost_bound):
+        # Set up a new search of task_list from state in ctx. Returns the id of the root of its solution tree.
+        ctx.state = self._copy_state(state)
+        ctx.task_list = deepcopy(task_list)
+        ctx._verbose = verbose
+        ctx._dispatch = self._compile_domain()
+        ctx._cost_bound = cost_bound
+        ctx._conflicts = ConflictTracker() if self.backjumping else None
+        self._reset_search(ctx)
 
-        if self._verbose > 0:
+        if ctx._verbose > 0:
             run_info = '**IPyHOP, verbose = {verbosity}: **\n\tstate = {state}\n\ttasks/goals = {task_list}.'
-            print(run_info.format(verbosity=self._verbose, state=self.state.__name__, task_list=task_list))
+            print(run_info.format(verbosity=ctx._verbose, state=ctx.state.__name__, task_list=task_list))
 
-        self.sol_plan = []
-        self.sol_tree = DiGraph()
+        ctx.sol_plan = []
+        ctx._plan_marks = array('i')
+        ctx._tree = SolutionTree()
+        ctx._sol_graph = None
 
-        _id = 0
-        parent_node_id = _id
-        self.sol_tree.add_node(_id, info=('root',), type='D', status='NA')
-        _id = self._add_nodes_and_edges(_id, _id, self.task_list)
+        parent_node_id = ctx._tree.add_node(-1, D, NA, SolNode(('root',)))
+        self._add_nodes_and_edges(ctx, parent_node_id, ctx.task_list)
+        return parent_node_id
 
-        self.iterations = self._planning(_id, parent_node_id)
-        assert is_tree(self.sol_tree), "Error! Solution graph is not a tree."
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _search(self, ctx, parent_node_id, budget):
+        ctx._budget = budget
+        ctx._exhausted = None
+        ctx._parent_node_id = None
+        start_time = perf_counter()
+        ctx.iterations = self._planning(ctx, parent_node_id)
+        stats = search_stats(ctx.iterations, ctx._backtracks, start_time, len(ctx._tree), self._saved_states(ctx),
+                             self._snapshot_bytes(ctx), ctx._exhausted)
+        plan = ctx.sol_plan
+        cost_bound = ctx._cost_bound
+        if cost_bound is not None:
+            stats['cost'] = None if cost_bound.best_plan is None else cost_bound.best_cost
+            stats['solutions'] = cost_bound.solutions
+            plan = cost_bound.best_plan
+            # A cost-optimal search ends with its tree exhausted. Its outcome is the best plan found.
+            if ctx._exhausted is None and plan is not None:
+                ctx._no_plan = False
+                ctx.state, ctx.sol_plan, ctx.sol_tree = cost_bound.best_state, plan, cost_bound.best_tree
+        # A paused search keeps its trail, so that it can be resumed (as does a search enumerating solutions).
+        if self.trail and ctx._exhausted is None and not ctx._enumerating:
+            ctx.state.stop_trail()
+
+        if ctx._exhausted is not None:
+            status = BUDGET_EXHAUSTED
+        else:
+            status = NO_PLAN if ctx._no_plan else SUCCESS
+            plan = ctx.sol_plan
+        ctx.result = PlanResult(status, plan, stats)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _saved_states(self, ctx):
+        # The choice points without alternative methods (see NO_SNAPSHOT) do not save the state.
+        nodes = ctx._tree.nodes
+        return sum(nodes[node_id].state is not NO_SNAPSHOT for node_id in ctx._tree.choice_points)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _snapshot_bytes(self, ctx):
+        # With a trail, the saved states are the trail. Else, they are (about) one copy of the state per saved state.
+        if self.trail:
+            return ctx.state.trail_mark() * TRAIL_ENTRY_BYTES
+        if ctx._state_bytes is None:
+            ctx._state_bytes = approx_state_bytes(ctx.state)
+        return self._saved_states(ctx) * ctx._state_bytes
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _compile_domain(self):
+        # The dispatch table is rebuilt only if the methods or actions were replaced or declared anew.
+        key = (self.methods, self.methods.revision, self.actions, self.actions.revision)
+        if key != self._dispatch_key:
+            self._dispatch = compile_domain(self.methods, self.actions)
+            self._dispatch_key = key
+        return self._dispatch
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _copy_state(self, state: State) -> State:
+        if not self.trail:
+            # The fingerprint of a State is recomputed on every call. A PersistentState maintains it incrementally, so
+            # it is used whenever the fingerprint is a cache or memo key.
+            if self.method_cache is None and self.nogood_memo is None and not self.detect_cycles:
+                return state.copy()
+            return state.copy() if isinstance(state, PersistentState) else PersistentState.from_state(state)
+        new_state = state.copy() if isinstance(state, PersistentState) else PersistentState.from_state(state)
+        new_state.start_trail()
+        return new_state
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _save_state(self, ctx):
+        # With a trail, a mark on the trail is enough to restore the current state.
+        return ctx.state.trail_mark() if self.trail else ctx.state.copy()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _restore_state(self, ctx, saved_state):
+        # With a trail, the nodes restored from a checkpoint hold copies of the state instead of trail marks.
+        if self.trail and type(saved_state) is int:
+            ctx.state.undo_trail(saved_state)
+        else:
+            ctx.state.update(saved_state.copy())
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _reset_search(self, ctx):
+        ctx.reset()
+        # Every search learns its own nogoods, so the searches running at once in other contexts are not affected.
+        if self.nogood_memo is None:
+            ctx.nogood_memo = None
+        elif ctx.nogood_memo is None or ctx.nogood_memo.maxsize != self.nogood_memo.maxsize:
+            ctx.nogood_memo = NogoodMemo(self.nogood_memo.maxsize)
+        else:
+            ctx.nogood_memo.clear()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _node_key(self, ctx, node_info, node_type):
+        try:
+            info = node_info.fingerprint() if node_type == M else node_info
+            key = (info, ctx.state.fingerprint())
+            hash(key)
+        except TypeError:  # Nodes with unhashable arguments are not memoized.
+            return None
+        return key
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _sync_path(self, ctx, node_id):
+        # Make the path hold the ancestors of the refined node (i.e., the nodes from the root to node_id), by popping
+        # the nodes that are not ancestors of node_id anymore and pushing its ancestors that are not on the path yet.
+        path, path_keys, path_set, counts = ctx._path, ctx._path_keys, ctx._path_set, ctx._path_counts
+        parent = ctx._tree.parent
+        below = []
+        while node_id >= 0 and node_id not in path_set:
+            below.append(node_id)
+            node_id = parent[node_id]
+        while path and path[-1] != node_id:
+            path_set.discard(path.pop())
+            key = path_keys.pop()
+            if key is not None:
+                if counts[key] == 1:
+                    del counts[key]
+                else:
+                    counts[key] -= 1
+        for node_id in reversed(below):
+            key = ctx._node_keys.get(node_id)
+            path.append(node_id)
+            path_keys.append(key)
+            path_set.add(node_id)
+            if key is not None:
+                counts[key] = counts.get(key, 0) + 1
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _call_method(self, ctx, method, args):
+        if ctx._conflicts is not None or self.access_profile is not None:
+            # The accesses of the method are recorded. So, it must be called even if its result is cached.
+            return self._call_tracked(ctx, method, ctx.state, args)
+        if self.method_cache is None:
+            return method(ctx.state, *args)
+        return self.method_cache.call(method, ctx.state, args)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _call_tracked(self, ctx, func, state, args):
+        # Call func(state, *args) on a TrackedState, recording its accesses for backjumping and/or the access profile.
+        conflicts, profile = ctx._conflicts, self.access_profile
+        if profile is None:
+            return conflicts.call(func, state, args)
+        if conflicts is None:
+            return profile.call(func, state, args)
+        return profile.call(func, state, args, conflicts.reads, conflicts.writes)
 
-        # Store the planning solution as a list of actions to be executed.
-        for node_id in dfs_preorder_nodes(self.sol_tree, source=0):
-            if self.sol_tree.nodes[node_id]['type'] == 'A':
-                self.sol_plan.append(self.sol_tree.nodes[node_id]['info'])
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _apply_action(self, ctx, action, action_info):
+        # With backjumping or an access profile, the accesses of the action are recorded (see _call_tracked()).
+        tracked = ctx._conflicts is not None or self.access_profile is not None
+        if type(action) is SplitAction:
+            # The precondition only reads the state. So, the effect can be applied to the current state directly.
+            if tracked:
+                if not self._call_tracked(ctx, action.precondition, ctx.state, action_info[1:]):
+                    return None
+                self._call_tracked(ctx, action.effect, ctx.state, action_info[1:])
+                return ctx.state
+            if not action.precondition(ctx.state, *action_info[1:]):
+                return None
+            action.effect(ctx.state, *action_info[1:])
+            return ctx.state
+
+        if not self.trail:
+            if not tracked:
+                new_state = action(ctx.state.copy(), *action_info[1:])
+            else:
+                new_state = self._call_tracked(ctx, action, ctx.state.copy(), action_info[1:])
+            if new_state is not None:
+                ctx.state.update(new_state)
+            return new_state
 
-        return self.sol_plan
+        mark = ctx.state.trail_mark()
+        if not tracked:
+            new_state = action(ctx.state, *action_info[1:])
+        else:
+            new_state = self._call_tracked(ctx, action, ctx.state, action_info[1:])
+        if new_state is not ctx.state:
+            # The action either failed or returned some other state object. Either way discard its writes.
+            ctx.state.undo_trail(mark)
+            if new_state is not None:
+                ctx.state.update(new_state)
+        return new_state
 
     # ******************************        Class Method Declaration        ****************************************** #
-    def _planning(self, _id, parent_node_id):
+    def _planning(self, ctx, parent_node_id):
+        tree = ctx._tree
+        t_type, t_nodes, open_child = tree.node_type, tree.nodes, tree.open_child
 
+        detect_cycles = self.detect_cycles
+        path = ctx._path
+        cost_bound = ctx._cost_bound
+        conflicts = ctx._conflicts
+        # The budget is checked only at some iterations (never, if there is no budget).
+        next_check = -1 if ctx._budget is None else 0
         _iter = 0
         for _iter in count(0):
-            curr_node_id = None
-            # Get the first Open node from the immediate successors of parent node. (using BFS)
-            for node_id in self.sol_tree.successors(parent_node_id):
-                if self.sol_tree.nodes[node_id]['status'] == 'O':
-                    curr_node_id = node_id
-                    if self._verbose > 1:
-                        print('Iteration {}, Refining node {}.'.format(
-                            _iter, repr(self.sol_tree.nodes[node_id]['info'])))
+            if _iter == next_check:
+                ctx._exhausted, next_check = ctx._budget.check(_iter, len(ctx._tree),
+                                                               lambda: self._snapshot_bytes(ctx))
+                if ctx._exhausted is not None:
+                    # Pause the search. It is resumed from parent_node_id (see resume()).
+                    ctx._parent_node_id = parent_node_id
+                    if ctx._verbose > 1:
+                        print('Iteration {}, Budget {} exhausted.'.format(_iter, ctx._exhausted))
                     break
+            if detect_cycles and (not path or path[-1] != parent_node_id):
+                self._sync_path(ctx, parent_node_id)
+            # Get the first Open node from the immediate successors of parent node (tracked by its open child cursor).
+            curr_node_id = open_child[parent_node_id]
+            if curr_node_id >= 0 and ctx._verbose > 1:
+                print('Iteration {}, Refining node {}.'.format(_iter, repr(t_nodes[curr_node_id].info)))
 
             # If Open node wasn't found from the immediate successors
-            if curr_node_id is None:
+            if curr_node_id < 0:
+                # All the descendants of parent_node_id were refined. So, it was accomplished.
+                if ctx.nogood_memo is not None:
+                    ctx._completed.add(parent_node_id)
                 # Set the parent_node_id as predecessor of parent_node_id if available.
-                try:
-                    parent_node_id = next(self.sol_tree.predecessors(parent_node_id))
-                except StopIteration:  # if the parent_node_id has no predecessors (i.e. it is root) end refinement.
-                    if self._verbose > 2:
+                if tree.parent[parent_node_id] < 0:  # if the parent_node_id is root end refinement.
+                    # A cost-optimal search records the plan as the best one, and backtracks to look for a cheaper one.
+                    if cost_bound is not None and not ctx._no_plan:
+                        cost_bound.improve(ctx.sol_plan, ctx.state, tree)
+                        if ctx._verbose > 1:
+                            print('Iteration {}, Plan of cost {} found.'.format(_iter, cost_bound.best_cost))
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, parent_node_id)
+                        continue
+                    if ctx._verbose > 2:
                         print('Iteration {}, Planning Complete.'.format(_iter))
                     break
-                if self._verbose > 2:
-                    print('Iteration {}, Parent node modified to {}.'.format(
-                        _iter, repr(self.sol_tree.nodes[parent_node_id]['info'])))
+                parent_node_id = tree.parent[parent_node_id]
+                if ctx._verbose > 2:
+                    print('Iteration {}, Parent node modified to {}.'.format(_iter, repr(t_nodes[parent_node_id].info)))
 
             # Else, it means that an Open node was found in the subgraph. Refine the node.
             else:
-                curr_node = self.sol_tree.nodes[curr_node_id]
-                if 'state' in curr_node:
-                    # If curr_node already has a value for state, it means that the algorithm backtracked to this node.
-                    if curr_node['state']:
-                        # Modify the current state as the saved state at that node.
-                        self.state.update(curr_node['state'].copy())
+                curr_node = t_nodes[curr_node_id]
+                curr_type = t_type[curr_node_id]
+                curr_node_info = curr_node.info
+                if conflicts is not None:
+                    # Record the state variables read (and written) to refine the node, to explain its failure.
+                    conflicts.focus(curr_node_id, curr_node.state is None)
+                if curr_type == T or curr_type == G or curr_type == M:
                     # If curr_node doesn't have value for state, it means that the node is visited for the first time.
+                    if curr_node.state is None:
+                        if detect_cycles or ctx.nogood_memo is not None:
+                            key = self._node_key(ctx, curr_node_info, curr_type)
+                            ctx._node_keys[curr_node_id] = key
+                            # A leaf re-opened by backtracking (see _pop_choice_point()) only tries the methods after
+                            # its cursor. So, running out of them does not make it a nogood.
+                            if curr_node.method_index > 0:
+                                ctx._completed.add(curr_node_id)
+                            else:
+                                ctx._completed.discard(curr_node_id)
+                            # If an ancestor has the same info and state, the decomposition is looping. Fail the node.
+                            if detect_cycles and key is not None and key in ctx._path_counts:
+                                # The failure depends on the ancestors. So, it must not be recorded as a nogood.
+                                ctx._completed.add(curr_node_id)
+                                ctx._completed.update(path)
+                                parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id)
+                                if ctx._verbose > 2:
+                                    print('Iteration {}, {} is a cycle.'.format(_iter, repr(curr_node_info)))
+                                    print('Iteration {}, Backtracking to {}.'.format(
+                                        _iter, repr(t_nodes[curr_node_id].info)))
+                                continue
+                            # If the node could not be accomplished from this state before, it fails again.
+                            if ctx.nogood_memo is not None and key is not None and key in ctx.nogood_memo:
+                                parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id)
+                                if ctx._verbose > 2:
+                                    print('Iteration {}, {} is a known nogood.'.format(_iter, repr(curr_node_info)))
+                                    print('Iteration {}, Backtracking to {}.'.format(
+                                        _iter, repr(t_nodes[curr_node_id].info)))
+                                continue
+                        # If the node can not lead to a plan cheaper than the best one, prune it.
+                        if cost_bound is not None and not cost_bound.admits_node(len(ctx.sol_plan), ctx.state,
+                                                                                 curr_node_info):
+                            self._bound_failure(ctx, curr_node_id)
+                            parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id)
+                            if ctx._verbose > 2:
+                                print('Iteration {}, {} is pruned by the cost bound.'.format(_iter,
+                                                                                           repr(curr_node_info)))
+                                print('Iteration {}, Backtracking to {}.'.format(_iter,
+                                                                                 repr(t_nodes[curr_node_id].info)))
+                            continue
+                        # Save the current state in the node, if it has alternative methods to backtrack to.
+                        curr_node.state = self._save_state(ctx) if len(curr_node.methods) > 1 else NO_SNAPSHOT
+                    # Else, the algorithm backtracked to this node. If it has no alternative methods, it fails again.
+                    elif curr_node.state is NO_SNAPSHOT:
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id, True)
+                        if ctx._verbose > 2:
+                            print('Iteration {}, {} has no alternative methods.'.format(_iter, repr(curr_node_info)))
+                            print('Iteration {}, Backtracking to {}.'.format(_iter, repr(t_nodes[curr_node_id].info)))
+                        continue
+                    # Else, modify the current state as the saved state at that node.
                     else:
-                        # Save the current state in the node.
-                        curr_node['state'] = self.state.copy()
-                curr_node_info = curr_node['info']
+                        self._restore_state(ctx, curr_node.state)
 
                 # If current node is a Task
-                if curr_node['type'] == 'T':
+                if curr_type == T:
                     subtasks = None
                     # If methods are available for refining the task, use them.
-                    for method in curr_node['available_methods']:
-                        curr_node['selected_method'] = method
-                        subtasks = method(self.state, *curr_node_info[1:])
+                    for method in _methods_left(curr_node):
+                        curr_node.selected_method = method
+                        subtasks = self._call_method(ctx, method, curr_node_info[1:])
                         if subtasks is not None:
-                            curr_node['status'] = 'C'
-                            _id = self._add_nodes_and_edges(_id, curr_node_id, subtasks)
+                            tree.close(curr_node_id)
+                            self._add_nodes_and_edges(ctx, curr_node_id, subtasks)
                             parent_node_id = curr_node_id
-                            if self._verbose > 2:
+                            if ctx._verbose > 2:
                                 print('Iteration {}, Task {} successfully refined'.format(_iter,
                                                                                           repr(curr_node_info)))
                                 print('Iteration {}, Parent node modified to {}.'.format(
-                                    _iter, repr(self.sol_tree.nodes[parent_node_id]['info'])))
+                                    _iter, repr(t_nodes[parent_node_id].info)))
                             break
                     if subtasks is None:
-                        parent_node_id, curr_node_id = self._backtrack(parent_node_id, curr_node_id)
-                        if self._verbose > 2:
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id, True)
+                        if ctx._verbose > 2:
                             print('Iteration {}, Task {} refinement failed'.format(_iter, repr(curr_node_info)))
-                            print('Iteration {}, Backtracking to {}.'.format(
-                                _iter, repr(self.sol_tree.nodes[curr_node_id]['info'])))
+                            print('Iteration {}, Backtracking to {}.'.format(_iter, repr(t_nodes[curr_node_id].info)))
 
                 # If current node is an Action
-                elif curr_node['type'] == 'A':
+                elif curr_type == A:
                     new_state = None
-                    # If the Action is not blacklisted
+                    # If the Action is not blacklisted (nor pruned by the cost bound)
                     if curr_node_info not in self.blacklist:
-                        new_state = curr_node['action'](self.state.copy(), *curr_node_info[1:])
-                        # If Action was successful, update the state.
+                        if cost_bound is not None and not cost_bound.admits_action(len(ctx.sol_plan),
+                                                                                   curr_node_info[0]):
+                            self._bound_failure(ctx, curr_node_id)
+                        else:
+                            new_state = self._apply_action(ctx, curr_node.action, curr_node_info)
+                        # If Action was successful, the state has been updated.
                         if new_state is not None:
-                            curr_node['status'] = 'C'
-                            self.state.update(new_state)
-                            if self._verbose > 2:
+                            tree.close(curr_node_id)
+                            if conflicts is not None:
+                                conflicts.add_action(tree, curr_node_id, len(ctx.sol_plan))
+                            ctx.sol_plan.append(curr_node_info)
+                            if ctx._verbose > 2:
                                 print('Iteration {}, Action {} successful.'.format(_iter, repr(curr_node_info)))
                     if new_state is None:
-                        parent_node_id, curr_node_id = self._backtrack(parent_node_id, curr_node_id)
-                        if self._verbose > 2:
+                        # With a cost bound, the action might have been pruned. The failure is then not explained.
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id,
+                                                                       cost_bound is None)
+                        if ctx._verbose > 2:
                             print('Iteration {}, Action {} failed.'.format(_iter, repr(curr_node_info)))
-                            print('Iteration {}, Backtracking to {}.'.format(
-                                _iter, repr(self.sol_tree.nodes[curr_node_id]['info'])))
+                            print('Iteration {}, Backtracking to {}.'.format(_iter, repr(t_nodes[curr_node_id].info)))
 
                 # If current node is a Goal
-                elif curr_node['type'] == 'G':
+                elif curr_type == G:
                     subgoals = None
                     state_var, arg, desired_val = curr_node_info
+                    if conflicts is not None:
+                        conflicts.reads.add((state_var, arg))
                     # Skip goal refinement if already achieved
-                    if self.state.__dict__[state_var][arg] == desired_val:
-                        curr_node['status'] = 'C'
+                    if ctx.state.__dict__[state_var][arg] == desired_val:
+                        tree.close(curr_node_id)
                         subgoals = []
-                        if self._verbose > 2:
+                        if ctx._verbose > 2:
                             print('Iteration {}, Goal {} already achieved'.format(_iter, repr(curr_node_info)))
                     else:
                         # If methods are available for refining the goal, use them.
-                        for method in curr_node['available_methods']:
-                            curr_node['selected_method'] = method
-                            subgoals = method(self.state, *curr_node_info[1:])
+                        for method in _methods_left(curr_node):
+                            curr_node.selected_method = method
+                            subgoals = self._call_method(ctx, method, curr_node_info[1:])
                             if subgoals is not None:
-                                curr_node['status'] = 'C'
-                                _id = self._add_nodes_and_edges(_id, curr_node_id, subgoals)
+                                tree.close(curr_node_id)
+                                self._add_nodes_and_edges(ctx, curr_node_id, subgoals)
                                 parent_node_id = curr_node_id
-                                if self._verbose > 2:
+                                if ctx._verbose > 2:
                                     print('Iteration {}, Goal {} successfully refined'.format(
                                         _iter, repr(curr_node_info)))
                                     print('Iteration {}, Parent node modified to {}.'.format(
-                                        _iter, repr(self.sol_tree.nodes[parent_node_id]['info'])))
+                                        _iter, repr(t_nodes[parent_node_id].info)))
                                 break
                     if subgoals is None:
-                        parent_node_id, curr_node_id = self._backtrack(parent_node_id, curr_node_id)
-                        if self._verbose > 2:
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id, True)
+                        if ctx._verbose > 2:
                             print('Iteration {}, Goal {} refinement failed'.format(_iter, repr(curr_node_info)))
-                            print('Iteration {}, Backtracking to {}.'.format(
-                                _iter, repr(self.sol_tree.nodes[curr_node_id]['info'])))
+                            print('Iteration {}, Backtracking to {}.'.format(_iter, repr(t_nodes[curr_node_id].info)))
 
                 # If current node is a MultiGoal
-                elif curr_node['type'] == 'M':
+                elif curr_type == M:
                     subgoals = None
-                    unachieved_goals = self._goals_not_achieved(curr_node_id)
+                    unachieved_goals = self._goals_not_achieved(ctx, curr_node_id)
                     if not unachieved_goals:
-                        curr_node['status'] = "C"
+                        tree.close(curr_node_id)
                         subgoals = []
-                        if self._verbose > 2:
+                        if ctx._verbose > 2:
                             print('Iteration {}, MultiGoal {} already achieved'.format(_iter, repr(curr_node_info)))
                     else:
                         # If methods are available for refining the goal, use them.
-                        for method in curr_node['available_methods']:
-                            curr_node['selected_method'] = method
-                            subgoals = method(self.state, curr_node_info)
+                        for method in _methods_left(curr_node):
+                            curr_node.selected_method = method
+                            subgoals = self._call_method(ctx, method, (curr_node_info,))
                             if subgoals is not None:
-                                curr_node['status'] = 'C'
-                                _id = self._add_nodes_and_edges(_id, curr_node_id, subgoals)
+                                tree.close(curr_node_id)
+                                self._add_nodes_and_edges(ctx, curr_node_id, subgoals)
                                 parent_node_id = curr_node_id
-                                if self._verbose > 2:
+                                if ctx._verbose > 2:
                                     print('Iteration {}, MultiGoal {} successfully refined'.format(
                                         _iter, repr(curr_node_info)))
                                     print('Iteration {}, Parent node modified to {}.'.format(
-                                        _iter, repr(self.sol_tree.nodes[parent_node_id]['info'])))
+                                        _iter, repr(t_nodes[parent_node_id].info)))
                                 break
                     if subgoals is None:
-                        parent_node_id, curr_node_id = self._backtrack(parent_node_id, curr_node_id)
-                        if self._verbose > 2:
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id, True)
+                        if ctx._verbose > 2:
                             print(
                                 'Iteration {}, MultiGoal {} refinement failed'.format(_iter, repr(curr_node_info)))
-                            print('Iteration {}, Backtracking to {}.'.format(
-                                _iter, repr(self.sol_tree.nodes[curr_node_id]['info'])))
+                            print('Iteration {}, Backtracking to {}.'.format(_iter, repr(t_nodes[curr_node_id].info)))
 
-                elif curr_node['type'] == 'VG':
-                    state_var, arg, desired_val = self.sol_tree.nodes[parent_node_id]['info']
-                    if self.state.__dict__[state_var][arg] == desired_val:
-                        curr_node['status'] = "C"
+                elif curr_type == VG:
+                    state_var, arg, desired_val = t_nodes[parent_node_id].info
+                    if conflicts is not None:
+                        conflicts.reads.add((state_var, arg))
+                    if ctx.state.__dict__[state_var][arg] == desired_val:
+                        tree.close(curr_node_id)
                     else:
-                        parent_node_id, curr_node_id = self._backtrack(parent_node_id, curr_node_id)
-                        if self._verbose > 2:
-                            curr_node_info = self.sol_tree.nodes[curr_node_id]['info']
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id, True)
+                        if ctx._verbose > 2:
+                            curr_node_info = t_nodes[curr_node_id].info
                             print('Iteration {}, Goal {} Verification failed.'.format(_iter, repr(curr_node_info)))
                             print('Iteration {}, Backtracking to {}.'.format(_iter, repr(curr_node_info)))
 
-                elif curr_node['type'] == 'VM':
-                    unachieved_goals = self._goals_not_achieved(parent_node_id)
+                elif curr_type == VM:
+                    unachieved_goals = self._goals_not_achieved(ctx, parent_node_id)
                     if not unachieved_goals:
-                        curr_node['status'] = "C"
+                        tree.close(curr_node_id)
                     else:
-                        parent_node_id, curr_node_id = self._backtrack(parent_node_id, curr_node_id)
-                        if self._verbose > 2:
-                            curr_node_info = self.sol_tree.nodes[curr_node_id]['info']
+                        parent_node_id, curr_node_id = self._backtrack(ctx, parent_node_id, curr_node_id, True)
+                        if ctx._verbose > 2:
+                            curr_node_info = t_nodes[curr_node_id].info
                             print('Iteration {}, MultiGoal {} Verification failed.'.format(_iter,
                                                                                            repr(curr_node_info)))
                             print('Iteration {}, Backtracking to {}.'.format(_iter, repr(curr_node_info)))
@@ -279,7 +782,8 @@ class IPyHOP(object):
         return _iter
 
     # ******************************        Class Method Declaration        ****************************************** #
-    def replan(self, state: State, fail_node_id: int, verbose: Optional[int] = 0) -> _p_type:
+    def replan(self, state: State, fail_node_id: int, verbose: Optional[int] = 0,
+               budget: Optional[Budget] = None, context: Optional[PlanningContext] = None) -> _p_type:
         """
         IPyHOP.replan(state_1, fail_node_id) tells IPyHOP to re-plan the solution tree given that the node with id
         *fail_node_id* has failed. The planning should be accomplished from a new initial state *state_1*,
@@ -296,134 +800,495 @@ class IPyHOP(object):
             the current/initial state in the planning problem.
         :param fail_node_id: The id of the failure node.
         :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
-        :return: A list containing the solution plan.
+        :param budget: [Optional] An instance of Budget class limiting the search.
+        :param context: [Optional] The PlanningContext class instance holding the solution tree to re-plan. If None,
+            planner.context is used.
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
         """
+        ctx = self.context if context is None else context
+        ctx.state = self._copy_state(state)
+        ctx._sol_graph = None
+        ctx._dispatch = self._compile_domain()
+        ctx._cost_bound = None
+        ctx._conflicts = ConflictTracker() if self.backjumping else None
+        self._reset_search(ctx)
 
-        self.state = state.copy()
+        # The plan only holds the actions completed during re-planning (the 'new' actions).
+        ctx.sol_plan = []
+        self._post_failure_modify(ctx, fail_node_id)
+        parent_node_id, curr_node_id = self._backtrack(ctx, ctx._tree.parent[fail_node_id], fail_node_id)
 
-        max_id = self._post_failure_modify(fail_node_id)
-        parent_node_id, curr_node_id = self._backtrack(list(self.sol_tree.predecessors(fail_node_id))[0], fail_node_id)
+        self._search(ctx, parent_node_id, budget)
+        return ctx.sol_plan if budget is None else ctx.result
 
-        self.iterations = self._planning(max_id, parent_node_id)
-        assert is_tree(self.sol_tree), "Error! Solution graph is not a tree."
+    # ******************************        Class Method Declaration        ****************************************** #
+    def plan_batch(self, problems: Iterable[Tuple[State, _t_type]], workers: Optional[int] = None, chunksize: int = 1,
+                   ordered: bool = True, budget: Optional[Budget] = None) -> Iterator[BatchResult]:
+        """
+        IPyHOP.plan_batch(problems) tells IPyHOP to plan many problems of its domain in a pool of worker processes.
+        The domain (the methods, the actions, the options and the blacklist of the planner) is sent to every worker
+        once, and each worker plans with a planner of its own. The results are streamed back as they are available.
 
-        self.sol_plan = []
-        # Store the planning solution as a list of actions to be executed.
-        for node_id in dfs_preorder_nodes(self.sol_tree, source=0):
-            if self.sol_tree.nodes[node_id]['type'] == 'A':
-                if self.sol_tree.nodes[node_id]['tag'] == 'new':
-                    self.sol_plan.append(self.sol_tree.nodes[node_id]['info'])
+        A problem raising an exception does not stop the batch: its result has the status ERROR and holds the
+        formatted traceback (see ipyhop.batch). The methods and actions must be picklable, i.e., defined at the top
+        level of a module.
 
-        return self.sol_plan
+        :param problems: An iterable of (state, task_list) pairs.
+        :param workers: [Optional] The number of worker processes (os.cpu_count() if None). If 0, the problems are
+            planned one after the other in the calling process.
+        :param chunksize: [Optional] The number of problems sent to a worker at once.
+        :param ordered: [Optional] If True, the results are yielded in the order of the problems. Else, in the order
+            they complete.
+        :param budget: [Optional] An instance of Budget class limiting the search of each problem.
+        :return: An iterator over the BatchResult (index, status, plan, stats, error) of every problem.
+        """
+        return plan_batch(self, problems, workers, chunksize, ordered, budget)
 
     # ******************************        Class Method Declaration        ****************************************** #
-    def _add_nodes_and_edges(self, _id: int, parent_node_id: int, children_node_info_list: List[Tuple[str]]):
+    def plan_portfolio(self, state: State, task_list: _t_type, k: Optional[int] = None, seed: int = 0,
+                       restart_base: Optional[int] = None, configs: Optional[List[PortfolioConfig]] = None,
+                       budget: Optional[Budget] = None, slice_iterations: int = 256) -> PortfolioResult:
+        """
+        IPyHOP.plan_portfolio(state, task_list) tells IPyHOP to race several configurations of the search of a
+        problem in parallel worker processes. A configuration (see ipyhop.portfolio.PortfolioConfig) is a seed for
+        random permutations of the method lists of the tasks and goals, and an optional Luby restart policy. The first
+        worker to complete its search (finding a plan, or proving there is none) wins, and the other workers are
+        stopped. Since the run time of a search depends heavily on the method order, this is often much faster than
+        any single order, and the winning configuration tells which orders suit the domain.
+
+        By default the first configuration uses the declared method order, so the portfolio is never much slower than
+        plan() given enough processor cores. The methods and actions must be picklable (see plan_batch()).
+
+        :param state: An instance of State class containing the collection of variable bindings representing
+            the current/initial state in the planning problem.
+        :param task_list: A list of tasks that need to be accomplished in the planning problem.
+        :param k: [Optional] The number of workers if configs is None (os.cpu_count() if None).
+        :param seed: [Optional] The seed of the random method orders of the default configurations.
+        :param restart_base: [Optional] The restart_base of the default configurations with a random method order
+            (None for no restarts).
+        :param configs: [Optional] The PortfolioConfig (seed, restart_base) of every worker.
+        :param budget: [Optional] An instance of Budget class limiting the search of each worker.
+        :param slice_iterations: [Optional] The number of iterations between two checks of the stop flag by a worker.
+        :return: A PortfolioResult (status, plan, stats, winner, config, error).
+        """
+        return plan_portfolio(self, state, task_list, k, seed, restart_base, configs, budget, slice_iterations)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    async def aplan(self, state: State, task_list: _t_type, methods: _m_type = None, actions: _op_type = None,
+                    verbose: Optional[int] = 0, budget: Optional[Budget] = None, yield_iterations: Optional[int] = 64,
+                    yield_ms: Optional[float] = 10.0, context: Optional[PlanningContext] = None) -> _p_type:
+        """
+        The asyncio variant of IPyHOP.plan(). The search yields to the event loop every yield_iterations iterations or
+        every yield_ms milliseconds (whichever comes first), so it never blocks the event loop for long.
+
+        If the task running aplan() is cancelled, asyncio.CancelledError is raised at the next yield. The search is
+        then left paused in a consistent state: planner.result has the status CANCELLED, planner.sol_plan holds the
+        actions completed so far, and planner.resume() can continue the search.
+
+        :param state: An instance of State class containing the collection of variable bindings representing
+            the current/initial state in the planning problem.
+        :param task_list: A list of tasks that need to be accomplished in the planning problem.
+        :param methods: [Optional] An instance of Methods class containing the collection of methods in the
+            planning domain.
+        :param actions: [Optional] An instance of Actions class containing the collection of actions in the
+            planning domain.
+        :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
+        :param budget: [Optional] An instance of Budget class limiting the search.
+        :param yield_iterations: [Optional] The number of iterations between two yields (None for no limit).
+        :param yield_ms: [Optional] The time in milliseconds between two yields (None for no limit). It is checked
+            every budget.check_interval iterations.
+        :param context: [Optional] An instance of PlanningContext class to search in (see plan()).
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
+        """
+        if context is None:
+            context = self.context = PlanningContext()
+        return await self._asearch(context, lambda slice_budget: self.plan(state, task_list, methods, actions,
+                                                                           verbose, slice_budget, context),
+                                   budget, yield_iterations, yield_ms)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    async def areplan(self, state: State, fail_node_id: int, verbose: Optional[int] = 0,
+                      budget: Optional[Budget] = None, yield_iterations: Optional[int] = 64,
+                      yield_ms: Optional[float] = 10.0, context: Optional[PlanningContext] = None) -> _p_type:
+        """
+        The asyncio variant of IPyHOP.replan(). It yields to the event loop and handles cancellation like aplan().
+
+        :param state: An instance of State class containing the collection of variable bindings representing
+            the current/initial state in the planning problem.
+        :param fail_node_id: The id of the failure node.
+        :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
+        :param budget: [Optional] An instance of Budget class limiting the search.
+        :param yield_iterations: [Optional] The number of iterations between two yields (None for no limit).
+        :param yield_ms: [Optional] The time in milliseconds between two yields (None for no limit).
+        :param context: [Optional] The PlanningContext class instance holding the solution tree to re-plan (see
+            replan()).
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
+        """
+        if context is None:
+            context = self.context
+        return await self._asearch(context, lambda slice_budget: self.replan(state, fail_node_id, verbose,
+                                                                             slice_budget, context),
+                                   budget, yield_iterations, yield_ms)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    async def _asearch(self, ctx, start, budget, yield_iterations, yield_ms):
+        # Run the search in slices of at most budget.check_interval iterations. start(slice_budget) runs the first slice
+        # and resume(slice_budget) the next ones. Between two slices the search is paused (so it is consistent), and it
+        # yields to the event loop there once yield_iterations iterations or yield_ms milliseconds have passed.
+        assert yield_iterations is None or yield_iterations > 0, "yield_iterations must be a positive integer."
+        user_budget = Budget() if budget is None else budget
+        totals = {'iterations': 0, 'backtracks': 0, 'elapsed': 0.0}
+        run_slice = start
+        since_yield, last_yield = 0, monotonic()
+        while True:
+            max_iterations = user_budget.check_interval
+            if yield_iterations is not None:
+                max_iterations = min(max_iterations, yield_iterations - since_yield)
+            if user_budget.max_iterations is not None:
+                max_iterations = min(max_iterations, user_budget.max_iterations - totals['iterations'])
+            run_slice(Budget(max_iterations, user_budget.deadline, user_budget.max_nodes,
+                             user_budget.max_snapshot_bytes, user_budget.check_interval))
+            run_slice = lambda slice_budget: self.resume(slice_budget, ctx)
+
+            stats = ctx.result.stats
+            for key in totals:
+                totals[key] += stats[key]
+            stats.update(totals)
+            ctx.iterations = totals['iterations']
+            since_yield += stats['iterations']
+            # If only the iterations of the slice ran out, the budget of the caller did not.
+            if stats['exhausted'] == 'max_iterations' and (user_budget.max_iterations is None or
+                                                           totals['iterations'] < user_budget.max_iterations):
+                stats['exhausted'] = None
+            if stats['exhausted'] is not None or ctx.result.status != BUDGET_EXHAUSTED:
+                break
+
+            if (yield_iterations is not None and since_yield >= yield_iterations) or \
+                    (yield_ms is not None and (monotonic() - last_yield) * 1000 >= yield_ms):
+                try:
+                    await asyncio.sleep(0)
+                except asyncio.CancelledError:
+                    ctx.result = PlanResult(CANCELLED, ctx.sol_plan, stats)
+                    raise
+                since_yield, last_yield = 0, monotonic()
+        return ctx.sol_plan if budget is None else ctx.result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def resume(self, budget: Optional[Budget] = None, context: Optional[PlanningContext] = None) -> _p_type:
+        """
+        IPyHOP.resume() tells IPyHOP to continue the search of the last call to plan(), replan() or resume() that was
+        paused because its budget ran out (or the search restored using restore()). The search continues exactly as
+        if it had never been paused, so it finds the same plan.
+
+        :param budget: [Optional] An instance of Budget class limiting the resumed search.
+        :param context: [Optional] The PlanningContext class instance holding the paused search. If None,
+            planner.context is used.
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
+        """
+        ctx = self.context if context is None else context
+        if ctx._parent_node_id is None:
+            raise ValueError("There is no paused search to resume.")
+        ctx._dispatch = self._compile_domain()
+        ctx._backtracks = 0
+        self._search(ctx, ctx._parent_node_id, budget)
+        return ctx.sol_plan if budget is None else ctx.result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def checkpoint(self, context: Optional[PlanningContext] = None) -> bytes:
+        """
+        Serialize the paused search (see resume()) to bytes: the solution tree with the method cursors and the saved
+        states of its nodes, the current state, the plan so far and the blacklist. The methods and actions are not
+        serialized. They are looked up by name in the domain of the planner restoring the checkpoint. The checkpoint of
+        a search of plan_optimal() also holds its CostBound (the best plan so far and the hooks, which must then be
+        picklable).
+
+        :param context: [Optional] The PlanningContext class instance holding the paused search. If None,
+            planner.context is used.
+        :return: The checkpoint as bytes (a pickle). It can be given to restore().
+        """
+        ctx = self.context if context is None else context
+        if ctx._parent_node_id is None:
+            raise ValueError("There is no paused search to checkpoint.")
+        tree = ctx._tree
+        saved_states = dict()
+        if self.trail:
+            # A trail mark is meaningless without the trail. So, save the state each mark stands for.
+            saved_states = ctx.state.trail_states({node.state for node in tree.nodes
+                                                    if node is not None and type(node.state) is int})
+        nodes = []
+        for node in tree.nodes:
+            if node is None:
+                nodes.append(None)
+                continue
+            saved_state = node.state
+            if type(saved_state) is int:
+                saved_state = saved_states[saved_state]
+            nodes.append((node.info, saved_state, node.method_index, node.tag))
+        search = {'version': CHECKPOINT_VERSION, 'trail': self.trail, 'state': ctx.state,
+                  'task_list': ctx.task_list, 'blacklist': self.blacklist, 'sol_plan': ctx.sol_plan,
+                  'plan_marks': ctx._plan_marks, 'parent_node_id': ctx._parent_node_id, 'cost_bound': ctx._cost_bound,
+                  'conflicts': ctx._conflicts, 'size': tree.size,
+                  'tree': {name: getattr(tree, name) for name in _TREE_ARRAYS}, 'nodes': nodes}
+        return pickle.dumps(search, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def restore(self, data: bytes, budget: Optional[Budget] = None, verbose: Optional[int] = 0,
+                context: Optional[PlanningContext] = None) -> _p_type:
+        """
+        IPyHOP.restore(data) tells IPyHOP to resume the search serialized by checkpoint(). The planner must have been
+        constructed with the same methods and actions (and trail option) as the planner that made the checkpoint. The
+        commands blacklisted in the checkpoint are added to the blacklist of the planner.
+
+        :param data: The bytes returned by checkpoint().
+        :param budget: [Optional] An instance of Budget class limiting the resumed search.
+        :param verbose: [Optional] An integer specifying the level of verbosity for IPyHOP.
+        :param context: [Optional] An instance of PlanningContext class to restore the search in. If None, a new one is
+            created and stored in planner.context.
+        :return: A list containing the solution plan. If a budget is given, a PlanResult instead (see ipyhop.budget).
+        """
+        search = pickle.loads(data)
+        if search.get('version') != CHECKPOINT_VERSION:
+            raise ValueError("Unsupported checkpoint version {}.".format(repr(search.get('version'))))
+        if search['trail'] != self.trail:
+            raise ValueError("The checkpoint was made by a planner with trail={}.".format(search['trail']))
+        if context is None:
+            context = self.context = PlanningContext()
+        ctx = context
+        ctx._verbose = verbose
+        ctx._dispatch = self._compile_domain()
+        self._reset_search(ctx)
+
+        tree = SolutionTree()
+        for name in _TREE_ARRAYS:
+            setattr(tree, name, search['tree'][name])
+        tree.size = search['size']
+        t_type = tree.node_type
+        for node_id, saved_node in enumerate(search['nodes']):
+            if saved_node is None:
+                tree.nodes.append(None)
+                continue
+            info, saved_state, method_index, tag = saved_node
+            node = self._restore_node(ctx, info, t_type[node_id])
+            node.state, node.method_index, node.tag = saved_state, method_index, tag
+            if method_index > 0:
+                node.selected_method = node.methods[method_index - 1]
+            tree.nodes.append(node)
+
+        ctx.state = search['state']
+        if self.trail:
+            ctx.state.start_trail()
+        ctx.task_list = search['task_list']
+        self.blacklist.update(search['blacklist'])
+        ctx.sol_plan = search['sol_plan']
+        ctx._plan_marks = search['plan_marks']
+        ctx._tree = tree
+        ctx._sol_graph = None
+        ctx._parent_node_id = search['parent_node_id']
+        ctx._cost_bound = search.get('cost_bound')
+        ctx._conflicts = search.get('conflicts')
+        return self.resume(budget, ctx)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _restore_node(self, ctx, info, node_type):
+        # Look up the methods (or the action) of a node of a checkpoint in the domain of the planner.
+        if node_type == M:
+            methods = self.methods.multigoal_method_dict.get(info.goal_tag)
+            if methods is None:
+                raise ValueError("No multigoal methods are declared for the goal_tag {} of {} (in the checkpoint)."
+                                 .format(repr(info.goal_tag), repr(info)))
+            return SolNode(info, methods=methods)
+        if node_type == T or node_type == G or node_type == A:
+            entry = ctx._dispatch.get(info[0])
+            if entry is None or entry[0] != node_type:
+                raise ValueError("{} (in the checkpoint) is not a declared {} of the planner.".format(
+                    repr(info), {T: 'task', G: 'goal', A: 'action'}[node_type]))
+            if node_type == A:
+                return SolNode(info, action=entry[1][0])
+            return SolNode(info, methods=entry[1])
+        return SolNode(info)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _bound_failure(self, ctx, node_id):
+        # A node pruned by the cost bound might be accomplishable. So, neither it nor its ancestors are nogoods.
+        if ctx.nogood_memo is not None:
+            parent = ctx._tree.parent
+            while node_id > 0:
+                ctx._completed.add(node_id)
+                node_id = parent[node_id]
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _add_nodes_and_edges(self, ctx, parent_node_id: int, children_node_info_list: List[Tuple[str]]):
+        tree = ctx._tree
+        dispatch = ctx._dispatch
         for child_node_info in children_node_info_list:
-            _id += 1
             if isinstance(child_node_info, MultiGoal):  # equivalent to type(child_node_info) == MultiGoal
-                relevant_methods = self.methods.multigoal_method_dict[child_node_info.goal_tag]
-                self.sol_tree.add_node(_id, info=child_node_info, type='M', status='O', state=None,
-                                       selected_method=None, available_methods=iter(relevant_methods),
-                                       methods=relevant_methods, tag='new')
-                self.sol_tree.add_edge(parent_node_id, _id)
-            elif child_node_info[0] in self.methods.task_method_dict:
-                relevant_methods = self.methods.task_method_dict[child_node_info[0]]
-                self.sol_tree.add_node(_id, info=child_node_info, type='T', status='O', state=None,
-                                       selected_method=None, available_methods=iter(relevant_methods),
-                                       methods=relevant_methods, tag='new')
-                self.sol_tree.add_edge(parent_node_id, _id)
-            elif child_node_info[0] in self.actions.action_dict:
-                action = self.actions.action_dict[child_node_info[0]]
-                self.sol_tree.add_node(_id, info=child_node_info, type='A', status='O', action=action, tag='new')
-                self.sol_tree.add_edge(parent_node_id, _id)
-            elif child_node_info[0] in self.methods.goal_method_dict:
-                relevant_methods = self.methods.goal_method_dict[child_node_info[0]]
-                self.sol_tree.add_node(_id, info=child_node_info, type='G', status='O', state=None,
-                                       selected_method=None, available_methods=iter(relevant_methods),
-                                       methods=relevant_methods, tag='new')
-                self.sol_tree.add_edge(parent_node_id, _id)
-
-        if self.sol_tree.nodes[parent_node_id]['type'] == 'G':
-            _id += 1
-            self.sol_tree.add_node(_id, info='VerifyGoal', type='VG', status='O', tag='new')
-            self.sol_tree.add_edge(parent_node_id, _id)
-        elif self.sol_tree.nodes[parent_node_id]['type'] == 'M':
-            _id += 1
-            self.sol_tree.add_node(_id, info='VerifyMultiGoal', type='VM', status='O', tag='new')
-            self.sol_tree.add_edge(parent_node_id, _id)
-
-        return _id
-
-    # ******************************        Class Method Declaration        ****************************************** #
-    def _post_failure_modify(self, fail_node_id):
-
-        rev_pre_ord_nodes = reversed(list(dfs_preorder_nodes(self.sol_tree, source=0)))
-
-        for node_id in rev_pre_ord_nodes:
-
-            c_node = self.sol_tree.nodes[node_id]
-            c_node['status'] = 'O'
+                relevant_methods = self.methods.multigoal_method_dict.get(child_node_info.goal_tag)
+                if relevant_methods is None:
+                    raise ValueError(self._subtask_error(child_node_info, None, tree.nodes[parent_node_id].info))
+                tree.add_node(parent_node_id, M, OPEN, SolNode(child_node_info, methods=relevant_methods))
+                continue
+            # A single lookup gives the kind, the methods (or action) and the arity of the subtask.
+            entry = dispatch.get(child_node_info[0])
+            if entry is None or (entry[2] is not None and len(child_node_info) != entry[2] + 1):
+                raise ValueError(self._subtask_error(child_node_info, entry, tree.nodes[parent_node_id].info))
+            if entry[0] == A:
+                tree.add_node(parent_node_id, A, OPEN, SolNode(child_node_info, action=entry[1][0]))
+            else:
+                tree.add_node(parent_node_id, entry[0], OPEN, SolNode(child_node_info, methods=entry[1]))
+
+        if tree.node_type[parent_node_id] == G:
+            tree.add_node(parent_node_id, VG, OPEN, SolNode('VerifyGoal'))
+        elif tree.node_type[parent_node_id] == M:
+            tree.add_node(parent_node_id, VM, OPEN, SolNode('VerifyMultiGoal'))
+
+        if tree.first_child[parent_node_id] >= 0 and tree.node_type[parent_node_id] != D:
+            tree.choice_points.append(parent_node_id)
+            ctx._plan_marks.append(len(ctx.sol_plan))
+            if ctx._conflicts is not None:
+                ctx._conflicts.keep(parent_node_id)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _subtask_error(self, child_node_info, entry, parent_info):
+        parent_info = repr(parent_info)
+        if isinstance(child_node_info, MultiGoal):
+            return "No multigoal methods are declared for the goal_tag {} of {} (in the subtasks of {}).".format(
+                repr(child_node_info.goal_tag), repr(child_node_info), parent_info)
+        if entry is None:
+            return "{} (in the subtasks of {}) is not a declared task, action or goal.".format(
+                repr(child_node_info), parent_info)
+        return "{} (in the subtasks of {}) has {} arguments, but {} expects {}.".format(
+            repr(child_node_info), parent_info, len(child_node_info) - 1, repr(child_node_info[0]), entry[2])
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _post_failure_modify(self, ctx, fail_node_id):
+        tree = ctx._tree
+        t_type, t_status, t_nodes = tree.node_type, tree.status, tree.nodes
+
+        for node_id in reversed(tree.preorder(0)):
+
+            tree.reopen(node_id)
 
             if node_id == fail_node_id:
                 break
 
-            c_type = c_node['type']
-            if c_type == 'T' or c_type == 'G' or c_type == 'M':
-                c_node['state'] = None
-                c_node['selected_method'] = None
-                c_node['available_methods'] = iter(c_node['methods'])
-                descendant_list = list(descendants(self.sol_tree, node_id))
-                self.sol_tree.remove_nodes_from(descendant_list)
+            c_type = t_type[node_id]
+            if c_type == T or c_type == G or c_type == M:
+                c_node = t_nodes[node_id]
+                c_node.state = None
+                c_node.selected_method = None
+                c_node.method_index = 0
+                tree.remove_descendants(node_id)
 
         max_id = -1
-        for node_id in self.sol_tree.nodes:
-            if node_id >= max_id:
-                max_id = node_id + 1
-            if 'state' in self.sol_tree.nodes[node_id]:
-                if self.sol_tree.nodes[node_id]['status'] == 'C':
-                    self.sol_tree.nodes[node_id]['state'] = self.state.copy()
+        for node_id in tree.node_ids():
+            max_id = node_id + 1
+            c_type = t_type[node_id]
+            if c_type == T or c_type == G or c_type == M:
+                if t_status[node_id] == CLOSED:
+                    t_nodes[node_id].state = self._save_state(ctx) if len(t_nodes[node_id].methods) > 1 else NO_SNAPSHOT
                 else:
-                    self.sol_tree.nodes[node_id]['state'] = None
-            if self.sol_tree.nodes[node_id]['status'] == 'C':
-                self.sol_tree.nodes[node_id]['tag'] = 'old'
+                    t_nodes[node_id].state = None
+            if t_status[node_id] == CLOSED and c_type != D:
+                t_nodes[node_id].tag = 'old'
 
+        # The nodes added during re-planning get ids from max_id + 1 onwards.
+        tree.reserve_ids(max_id + 1)
+        tree.rebuild_choice_points()
+        # None of the actions of the new plan precede the kept choice points.
+        ctx._plan_marks = array('i', bytes(len(tree.choice_points) * ctx._plan_marks.itemsize))
         return max_id
 
     # ******************************        Class Method Declaration        ****************************************** #
-    def _backtrack(self, p_node_id: int, c_node_id: int):
-        c_node = self.sol_tree.nodes[c_node_id]
-        c_type = c_node['type']
-        if c_type == 'T' or c_type == 'G' or c_type == 'M':
-            c_node['state'] = None
-            c_node['selected_method'] = None
-            c_node['available_methods'] = iter(c_node['methods'])
-
-        dfs_list = list(dfs_preorder_nodes(self.sol_tree, source=p_node_id))
-        for node_id in reversed(dfs_list):
-            node = self.sol_tree.nodes[node_id]
-            if node['status'] == 'C':
-                node['status'] = 'O'
-                descendant_list = list(descendants(self.sol_tree, node_id))
-                if descendant_list:
-                    self.sol_tree.remove_nodes_from(descendant_list)
-                    p_node_id = next(self.sol_tree.predecessors(node_id))
-                    return p_node_id, node_id
-                if 'state' in node:
-                    node['state'] = None
-
-        self.sol_tree.remove_nodes_from(list(descendants(self.sol_tree, 0)))
-        return 0, 0
-
-    # ******************************        Class Method Declaration        ****************************************** #
-    def _goals_not_achieved(self, multigoal_node_id):
-        multigoal = self.sol_tree.nodes[multigoal_node_id]['info']
+    def _backtrack(self, ctx, p_node_id: int, c_node_id: int, explained: bool = False):
+        # explained is True if the failure of c_node_id only depends on the state it read (for backjumping).
+        tree = ctx._tree
+        t_type, t_status, t_nodes = tree.node_type, tree.status, tree.nodes
+        conflicts = ctx._conflicts
+        # With backjumping, the choice points that could have prevented the failure (None if all of them could).
+        culprits = None
+        if conflicts is not None:
+            culprits = conflicts.culprits(tree, len(ctx.sol_plan), c_node_id, explained)
+        c_type = t_type[c_node_id]
+        if c_type == T or c_type == G or c_type == M:
+            # The node ran out of methods. If it was never accomplished, it can not be accomplished from its state.
+            if ctx.nogood_memo is not None and c_node_id not in ctx._completed:
+                key = ctx._node_keys.pop(c_node_id, None)
+                if key is not None:
+                    ctx.nogood_memo.add(key)
+            c_node = t_nodes[c_node_id]
+            c_node.state = None
+            c_node.selected_method = None
+            c_node.method_index = 0
+            if conflicts is not None:
+                conflicts.forget(c_node_id)
+
+        ctx._backtracks += 1
+        # Jump over the choice points refined after the latest culprit, without trying their methods left.
+        if culprits is not None:
+            while tree.choice_points and tree.choice_points[-1] not in culprits:
+                s_node_id = self._pop_choice_point(ctx, p_node_id)
+                s_node = t_nodes[s_node_id]
+                s_node.state = None
+                s_node.selected_method = None
+                s_node.method_index = 0
+                conflicts.forget(s_node_id)
+                p_node_id = tree.parent[s_node_id]
+        # The node to backtrack to is the most recently refined node left. If there is none, the planning has failed.
+        if not tree.choice_points:
+            ctx._no_plan = True
+            tree.remove_descendants(0)
+            del ctx.sol_plan[:]
+            return 0, 0
+        b_node_id = self._pop_choice_point(ctx, p_node_id)
+        if conflicts is not None:
+            conflicts.blame(b_node_id, culprits)
+        return tree.parent[b_node_id], b_node_id
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _pop_choice_point(self, ctx, p_node_id):
+        # Pop the most recently refined choice point, and re-open it.
+        tree = ctx._tree
+        t_type, t_status, t_nodes = tree.node_type, tree.status, tree.nodes
+        b_node_id = tree.choice_points.pop()
+        # The actions completed after b_node_id was refined are all undone (they come after it in depth first order).
+        del ctx.sol_plan[ctx._plan_marks.pop():]
+
+        # Re-open the completed leaves that come after b_node_id in depth first order. They are the closed siblings
+        # following b_node_id and each of its ancestors below p_node_id.
+        # A search looking past its first plan (for a cheaper one, or for all of them) may re-open them without a
+        # failure. So, their method cursors are reset, for them to be refined anew with all their methods.
+        reset_cursors = ctx._cost_bound is not None or ctx._enumerating
+        parent, next_sibling = tree.parent, tree.next_sibling
+        node_id = b_node_id
+        while node_id != p_node_id and node_id > 0:
+            sibling_id = next_sibling[node_id]
+            while sibling_id >= 0 and t_status[sibling_id] == CLOSED:
+                tree.reopen(sibling_id)
+                s_type = t_type[sibling_id]
+                if s_type == T or s_type == G or s_type == M:
+                    s_node = t_nodes[sibling_id]
+                    s_node.state = None
+                    if reset_cursors:
+                        s_node.selected_method = None
+                        s_node.method_index = 0
+                sibling_id = next_sibling[sibling_id]
+            node_id = parent[node_id]
+
+        tree.reopen(b_node_id)
+        tree.remove_descendants(b_node_id)
+        return b_node_id
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _goals_not_achieved(self, ctx, multigoal_node_id):
+        multigoal = ctx._tree.nodes[multigoal_node_id].info
+        state = ctx.state if ctx._conflicts is None else TrackedState(ctx.state, ctx._conflicts.reads)
         unachieved = {}
         for name in vars(multigoal):
             if name == '__name__' or name == 'goal_tag':
                 continue
             for arg in vars(multigoal).get(name):
                 val = vars(multigoal).get(name).get(arg)
-                if val != vars(self.state).get(name).get(arg):
+                if val != vars(state).get(name).get(arg):
                     # want arg_value_pairs.name[arg] = val
                     if not unachieved.get(name):
                         unachieved.update({name: {}})
@@ -431,18 +1296,21 @@ class IPyHOP(object):
         return unachieved
 
     # ******************************        Class Method Declaration        ****************************************** #
-    def simulate(self, state: State, start_ind=0) -> List:
+    def simulate(self, state: State, start_ind=0, context: Optional[PlanningContext] = None) -> List:
         """
         Simulates the generated plan on the given state
 
         :param state: An instance of State class containing the collection of variable bindings representing
             the current in the planning problem.
         :param start_ind: An integer specifying the index of the command in the generated plan to simulate from.
+        :param context: [Optional] The PlanningContext class instance holding the plan. If None, planner.context is
+            used.
         :return: A list of states that the system transitions through during simulation of the plan.
         """
+        ctx = self.context if context is None else context
         state_list = [state.copy()]
         state_copy = state.copy()
-        plan = self.sol_plan[start_ind:]
+        plan = ctx.sol_plan[start_ind:]
         for action in plan:
             self.actions.action_dict[action[0]](state_copy, *action[1:])
             state_list.append(state_copy.copy())
@@ -459,6 +1327,31 @@ class IPyHOP(object):
 
 
 # ******************************************    Class Declaration End       ****************************************** #
+# ****************************************        Function Declaration        **************************************** #
+def _plan_key(plan: List[Tuple]):
+    """
+    Get a hashable key identifying the actions of a plan (its repr if an action has unhashable arguments).
+    """
+    key = tuple(plan)
+    try:
+        hash(key)
+    except TypeError:
+        return repr(plan)
+    return key
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _methods_left(node: SolNode):
+    """
+    Iterate over the methods of a node that were not tried yet, moving its integer method cursor along.
+    """
+    methods = node.methods
+    while node.method_index < len(methods):
+        method = methods[node.method_index]
+        node.method_index += 1
+        yield method
+
+
 # ******************************************    Demo / Test Routine         ****************************************** #
 if __name__ == '__main__':
     raise NotImplementedError("Test run / Demo routine for IPyHOP isn't implemented.")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of PlanningContext Class (the state of one search of IPyHOP).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from array import array
+from typing import Optional
+from ipyhop.sol_tree import SolutionTree
+from networkx import DiGraph
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class PlanningContext(object):
+    """
+    A PlanningContext holds everything a search of IPyHOP changes: the state, the solution tree, the plan and the
+    search statistics. The planner itself only holds the domain (the methods, the actions and the tables compiled from
+    them) and the options it was constructed with, which are never changed by a search.
+
+    *   context = PlanningContext() creates an empty context. Passing it to planner.plan(..., context=context) makes
+        the planner search in it, so that one planner can run several searches at once (e.g., from the threads of a
+        ThreadPoolExecutor), each in its own context. The context can then be passed to replan(), resume(),
+        checkpoint() and simulate().
+    *   context.state, context.task_list, context.sol_plan, context.sol_tree, context.iterations and context.result
+        are the attributes of the same names of IPyHOP, for the search run in the context.
+    *   context.nogood_memo is the NogoodMemo of the search run in the context, if the planner learns nogoods. The
+        method cache and the access profile of a planner are shared by all its searches instead (they can be shared
+        between threads).
+
+    The calls made without a context create one (or, for replan() and the like, use the last one created), stored in
+    planner.context. The attributes planner.state, planner.sol_plan, planner.sol_tree, ... are those of
+    planner.context. So they describe the last search started without a context.
+    """
+
+    def __init__(self, verbose: Optional[int] = 0):
+        self.state = None
+        self.task_list = []
+        self.sol_plan = []
+        self.iterations = None
+        self.result = None
+        self.nogood_memo = None
+        self._verbose = verbose
+        self._tree = SolutionTree()
+        self._sol_graph = None
+        self._plan_marks = array('i')
+        self._dispatch = None
+        self._budget = None
+        self._cost_bound = None
+        self._conflicts = None
+        self._enumerating = False
+        self._exhausted = None
+        self._backtracks = 0
+        self._no_plan = False
+        self._state_bytes = None
+        self._parent_node_id = None
+        self._node_keys = dict()
+        self._completed = set()
+        self._path = []
+        self._path_keys = []
+        self._path_set = set()
+        self._path_counts = dict()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    @property
+    def sol_tree(self) -> DiGraph:
+        """
+        The solution tree as a networkx DiGraph. It is exported from the internal SolutionTree the first time it is
+        accessed after planning. Assigning a DiGraph to it replaces the internal SolutionTree.
+        """
+        if self._sol_graph is None:
+            self._sol_graph = self._tree.to_digraph()
+        return self._sol_graph
+
+    @sol_tree.setter
+    def sol_tree(self, graph: DiGraph):
+        self._tree = SolutionTree.from_digraph(graph)
+        self._sol_graph = graph
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def reset(self):
+        """
+        Reset the search statistics and the memo of the visited nodes, before a new search.
+        """
+        self._backtracks = 0
+        self._no_plan = False
+        self._state_bytes = None
+        self._parent_node_id = None
+        self._node_keys.clear()
+        self._completed.clear()
+        del self._path[:], self._path_keys[:]
+        self._path_set.clear()
+        self._path_counts.clear()
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class _ContextAttribute(object):
+    """
+    An attribute of IPyHOP that is stored in its current PlanningContext (planner.context).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, planner, owner=None):
+        if planner is None:
+            return self
+        return getattr(planner.context, self.name)
+
+    def __set__(self, planner, value):
+        setattr(planner.context, self.name, value)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test instantiation of PlanningContext class ...")
+    test_context = PlanningContext()
+    print(test_context.sol_plan, test_context.sol_tree.nodes)
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of the portfolio planning functions of IPyHOP (racing several copies of a
+search, each with its own method order and restart policy, in parallel processes).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+import multiprocessing
+import os
+import queue
+from collections import namedtuple
+from random import Random
+from time import monotonic
+from traceback import format_exc
+from typing import List, Optional, Sequence
+from ipyhop.methods import Methods
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from ipyhop.batch import ERROR, _domain_of, _make_planner
+
+# Seconds between two polls of the workers by the main process, and seconds given to the workers to stop by
+# themselves once the race is over (the workers still running after that are terminated).
+_POLL_SECONDS = 0.05
+_STOP_SECONDS = 1.0
+
+PortfolioConfig = namedtuple('PortfolioConfig', ['seed', 'restart_base'])
+PortfolioConfig.__doc__ = """
+The configuration of one worker of IPyHOP.plan_portfolio().
+
+*   seed seeds the random permutations of the method lists of the tasks and goals (see permute_methods()). If seed is
+    None, the methods are tried in the order they were declared, and restart_base is ignored.
+*   restart_base is None for a single search, or the number of iterations of the first search of a Luby restart
+    policy: the i-th search is stopped after restart_base * luby(i) iterations (1, 1, 2, 1, 1, 2, 4, ... times
+    restart_base) and started again from scratch with a new permutation of the methods.
+"""
+
+PortfolioResult = namedtuple('PortfolioResult', ['status', 'plan', 'stats', 'winner', 'config', 'error'])
+PortfolioResult.__doc__ = """
+The result of IPyHOP.plan_portfolio().
+
+*   status is SUCCESS or NO_PLAN if a worker completed its search (a complete search finding no plan proves that there
+    is none), BUDGET_EXHAUSTED if the budget of every worker ran out, and ERROR if every worker raised an exception.
+*   plan is the solution plan of the winner ([] if NO_PLAN, None if there is no winner).
+*   stats is the stats dictionary of the PlanResult of the winner (see ipyhop.budget), summed over its restarts,
+    with restarts (the number of restarts of the winner) and workers (the number of workers) added.
+*   winner is the index of the winning configuration, and config the winning PortfolioConfig (None if no winner).
+*   error is the formatted traceback of the exception of the first failing worker if status is ERROR (else None).
+"""
+
+
+# ****************************************        Function Declaration        **************************************** #
+def permute_methods(methods: Methods, rng: Random) -> Methods:
+    """
+    Get a copy of methods in which the method list of every task and goal is randomly permuted.
+
+    :param methods: An instance of Methods class.
+    :param rng: An instance of random.Random used to draw the permutations.
+    :return: A new instance of Methods class with the same methods in a different order.
+    """
+    permuted = Methods()
+    for task_name, method_list in methods.task_method_dict.items():
+        permuted.declare_task_methods(task_name, rng.sample(method_list, len(method_list)))
+    for goal_name, method_list in methods.goal_method_dict.items():
+        permuted.declare_goal_methods(goal_name, rng.sample(method_list, len(method_list)))
+    for multigoal_tag, method_list in methods.multigoal_method_dict.items():
+        permuted.declare_multigoal_methods(multigoal_tag, list(method_list))
+    return permuted
+
+
+# ****************************************        Function Declaration        **************************************** #
+def luby(i: int) -> int:
+    """
+    Get the i-th term (from 1) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ...
+
+    :param i: A positive integer.
+    :return: The i-th term of the Luby sequence.
+    """
+    assert i > 0, "i must be a positive integer."
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+# ****************************************        Function Declaration        **************************************** #
+def default_configs(k: int, seed: int = 0, restart_base: Optional[int] = None) -> List[PortfolioConfig]:
+    """
+    Get the configurations used by IPyHOP.plan_portfolio() when none are given: the declared method order first, then
+    k - 1 random method orders seeded with seed + 1, ..., seed + k - 1.
+
+    :param k: The number of configurations.
+    :param seed: [Optional] The seed of the random method orders.
+    :param restart_base: [Optional] The restart_base of the random method orders (see PortfolioConfig).
+    :return: A list of k PortfolioConfig.
+    """
+    assert k > 0, "k must be a positive integer."
+    return [PortfolioConfig(None, None)] + [PortfolioConfig(seed + i, restart_base) for i in range(1, k)]
+
+
+# ****************************************        Function Declaration        **************************************** #
+def plan_portfolio(planner, state, task_list, k: Optional[int] = None, seed: int = 0,
+                   restart_base: Optional[int] = None, configs: Optional[Sequence[PortfolioConfig]] = None,
+                   budget: Optional[Budget] = None, slice_iterations: int = 256) -> PortfolioResult:
+    """
+    Race several configurations of the search of a problem in parallel processes (see IPyHOP.plan_portfolio()).
+
+    :param planner: An instance of IPyHOP class.
+    :param state: An instance of State class (the initial state of the problem).
+    :param task_list: A list of tasks that need to be accomplished in the planning problem.
+    :param k: [Optional] The number of workers if configs is None (os.cpu_count() if None).
+    :param seed: [Optional] The seed of the default configurations (see default_configs()).
+    :param restart_base: [Optional] The restart_base of the default configurations (see default_configs()).
+    :param configs: [Optional] The PortfolioConfig of every worker.
+    :param budget: [Optional] An instance of Budget class limiting the search of each worker (summed over restarts).
+    :param slice_iterations: [Optional] The number of iterations between two checks of the stop flag by a worker.
+    :return: A PortfolioResult.
+    """
+    assert slice_iterations > 0, "slice_iterations must be a positive integer."
+    if configs is None:
+        configs = default_configs((os.cpu_count() or 1) if k is None else k, seed, restart_base)
+    configs = [PortfolioConfig(*config) for config in configs]
+    assert len(configs) > 0, "configs must not be empty."
+
+    domain = _domain_of(planner)
+    mp_context = multiprocessing.get_context()
+    stop, results = mp_context.Event(), mp_context.Queue()
+    workers = [mp_context.Process(target=_portfolio_worker, daemon=True,
+                                  args=(index, domain, config, state, task_list, budget, slice_iterations, stop,
+                                        results)) for index, config in enumerate(configs)]
+    outcomes = dict()
+    winner = None
+    try:
+        for worker in workers:
+            worker.start()
+        while winner is None and len(outcomes) < len(workers):
+            # A worker that exited before the queue was found empty has sent all it will ever send.
+            exited = {index for index, worker in enumerate(workers) if worker.exitcode is not None}
+            try:
+                index, outcome = results.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                for index in exited.difference(outcomes):
+                    outcomes[index] = (ERROR, None, dict(), "The worker process exited with code {}.".format(
+                        workers[index].exitcode))
+                continue
+            outcomes[index] = outcome
+            if outcome[0] in (SUCCESS, NO_PLAN):
+                winner = index
+    finally:
+        _stop_workers(workers, stop, results)
+
+    if winner is not None:
+        status, plan, stats, _ = outcomes[winner]
+        stats['workers'] = len(workers)
+        return PortfolioResult(status, plan, stats, winner, configs[winner], None)
+    statuses = [outcomes[index][0] for index in sorted(outcomes)]
+    if BUDGET_EXHAUSTED in statuses:
+        return PortfolioResult(BUDGET_EXHAUSTED, None, {'workers': len(workers)}, None, None, None)
+    return PortfolioResult(ERROR, None, {'workers': len(workers)}, None, None, outcomes[min(outcomes)][3])
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _stop_workers(workers, stop, results):
+    # Ask the workers to stop at their next slice, and keep draining the queue meanwhile (a process can not exit
+    # before the data it put in a queue is read). The workers stuck in a long method or action call are terminated.
+    stop.set()
+    deadline = monotonic() + _STOP_SECONDS
+    while any(worker.is_alive() for worker in workers) and monotonic() < deadline:
+        try:
+            results.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            pass
+    for worker in workers:
+        if worker.pid is None:  # Not started.
+            continue
+        if worker.is_alive():
+            worker.terminate()
+        worker.join()
+    results.close()
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _portfolio_worker(index, domain, config, state, task_list, budget, slice_iterations, stop, results):
+    try:
+        outcome = _run_config(domain, config, state, task_list, budget, slice_iterations, stop)
+    except Exception:  # The exception is reported to the main process, which keeps waiting for the other workers.
+        outcome = (ERROR, None, dict(), format_exc())
+    if outcome is not None:
+        results.put((index, outcome))
+
+
+# ****************************************        Function Declaration        **************************************** #
+def _run_config(domain, config, state, task_list, budget, slice_iterations, stop):
+    # Run the search of one configuration, in slices of at most slice_iterations iterations (the search is paused
+    # between two slices, and resumed unless the stop flag is set or the attempt reached its restart limit).
+    planner_class, methods, actions, options, blacklist = domain
+    rng = Random(config.seed)
+    user_budget = Budget() if budget is None else budget
+    totals = {'iterations': 0, 'backtracks': 0, 'elapsed': 0.0}
+    restarts = 0
+    while True:
+        if config.seed is None:
+            limit, attempt_methods = None, methods
+        else:
+            limit = None if config.restart_base is None else config.restart_base * luby(restarts + 1)
+            attempt_methods = permute_methods(methods, rng)
+        planner = _make_planner(planner_class, attempt_methods, actions, options, blacklist)
+        run_slice = lambda slice_budget: planner.plan(state, task_list, budget=slice_budget)
+        attempt_iterations = 0
+        while True:
+            if stop.is_set():
+                return None
+            max_iterations = slice_iterations
+            if limit is not None:
+                max_iterations = min(max_iterations, limit - attempt_iterations)
+            if user_budget.max_iterations is not None:
+                max_iterations = min(max_iterations, user_budget.max_iterations - totals['iterations'])
+            result = run_slice(Budget(max_iterations, user_budget.deadline, user_budget.max_nodes,
+                                      user_budget.max_snapshot_bytes, user_budget.check_interval))
+            run_slice = planner.resume
+
+            stats = result.stats
+            attempt_iterations += stats['iterations']
+            for key in totals:
+                totals[key] += stats[key]
+            stats.update(totals, restarts=restarts)
+            if result.status != BUDGET_EXHAUSTED or stats['exhausted'] != 'max_iterations':
+                return result.status, result.plan, stats, None
+            if user_budget.max_iterations is not None and totals['iterations'] >= user_budget.max_iterations:
+                return result.status, result.plan, stats, None
+            stats['exhausted'] = None
+            if limit is not None and attempt_iterations >= limit:
+                break
+        restarts += 1
+
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of SolutionTree Class (the array backed solution tree used by IPyHOP).
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from array import array
+from typing import List
+from networkx import DiGraph
+
+# Node type codes. NODE_TYPES[code] is the type name used in the exported DiGraph.
+D, T, A, G, M, VG, VM = range(7)
+NODE_TYPES = ('D', 'T', 'A', 'G', 'M', 'VG', 'VM')
+# Node status codes. NODE_STATUSES[code] is the status name used in the exported DiGraph.
+NA, OPEN, CLOSED = range(3)
+NODE_STATUSES = ('NA', 'O', 'C')
+# Status of the ids that are not (or no longer) used by a node of the tree.
+REMOVED = -1
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class _NoSnapshot(object):
+    """
+    Type of NO_SNAPSHOT, the value of SolNode.state for the nodes that have no alternative methods to resume with.
+    """
+
+    def __repr__(self):
+        return 'NO_SNAPSHOT'
+
+    def __reduce__(self):
+        return 'NO_SNAPSHOT'
+
+
+NO_SNAPSHOT = _NoSnapshot()
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class SolNode(object):
+    """
+    The payload of a node of the SolutionTree.
+
+    *   info: the task/goal/multigoal/action the node represents.
+    *   state: the state (or trail mark) saved on the first visit of a task/goal/multigoal node. It is NO_SNAPSHOT if
+        the node has at most one method, since such a node can never be resumed with an alternative method.
+    *   selected_method, method_index, methods: the method being tried, the index of the next method to try, and all
+        the relevant methods of a task/goal/multigoal node. (The methods left to try are methods[method_index:].)
+    *   action: the action function of an action node.
+    *   tag: 'new' for nodes added in the current planning call, 'old' for completed nodes kept from a previous plan.
+    """
+
+    __slots__ = ('info', 'state', 'selected_method', 'method_index', 'methods', 'action', 'tag')
+
+    def __init__(self, info, methods=None, action=None):
+        self.info = info
+        self.state = None
+        self.selected_method = None
+        self.methods = methods
+        self.method_index = 0
+        self.action = action
+        self.tag = 'new'
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class SolutionTree(object):
+    """
+    A SolutionTree stores the solution tree of IPyHOP in typed arrays indexed by the node id.
+
+    *   parent, first_child, last_child and next_sibling hold the node ids of the tree links (-1 if there is no link).
+    *   node_type and status hold the type and status codes of the nodes (see NODE_TYPES and NODE_STATUSES).
+    *   open_child holds the id of the first open child of each node (-1 if all its children are closed). Since the
+        children of a node are closed in order, it is a cursor that only moves forward, until backtracking re-opens a
+        child (see close() and reopen()).
+    *   nodes holds the SolNode payload of the nodes.
+    *   choice_points holds the ids of the closed nodes that have children (i.e., the nodes that were refined), in the
+        order they were refined. Since IPyHOP refines the nodes in depth first order, the node to backtrack to is
+        always the last one.
+
+    Node ids are allocated in increasing order. The ids of removed nodes are not reused.
+    tree.to_digraph() exports the tree to a networkx DiGraph (with the node attributes IPyHOP has always used) and
+    SolutionTree.from_digraph(graph) imports it back.
+    """
+
+    def __init__(self):
+        self.parent = array('i')
+        self.first_child = array('i')
+        self.last_child = array('i')
+        self.next_sibling = array('i')
+        self.open_child = array('i')
+        self.node_type = array('b')
+        self.status = array('b')
+        self.nodes = []
+        self.choice_points = array('i')
+        self.size = 0
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __len__(self):
+        return self.size
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def add_node(self, parent_id: int, node_type: int, status: int, node: SolNode) -> int:
+        """
+        Add a node as the last child of the node parent_id (or as a root if parent_id is -1).
+
+        :param parent_id: The id of the parent node.
+        :param node_type: The type code of the node.
+        :param status: The status code of the node.
+        :param node: The SolNode payload of the node.
+        :return: The id of the new node.
+        """
+        node_id = len(self.nodes)
+        self.parent.append(parent_id)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        self.open_child.append(-1)
+        self.node_type.append(node_type)
+        self.status.append(status)
+        self.nodes.append(node)
+        if parent_id >= 0:
+            last_id = self.last_child[parent_id]
+            if last_id < 0:
+                self.first_child[parent_id] = node_id
+            else:
+                self.next_sibling[last_id] = node_id
+            self.last_child[parent_id] = node_id
+            if status == OPEN and self.open_child[parent_id] < 0:
+                self.open_child[parent_id] = node_id
+        self.size += 1
+        return node_id
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def reserve_ids(self, next_id: int):
+        """
+        Make next_id the id of the next node added to the tree. The ids skipped over stay unused. Ids greater than or
+        equal to next_id can be given back only if they belong to removed nodes.
+
+        :param next_id: The id of the next node added to the tree.
+        """
+        n_ids = len(self.nodes)
+        if next_id < n_ids:
+            assert all(s == REMOVED for s in self.status[next_id:]), "Can not give back the ids of live nodes."
+            for arr in (self.parent, self.first_child, self.last_child, self.next_sibling, self.open_child,
+                        self.node_type, self.status, self.nodes):
+                del arr[next_id:]
+        else:
+            pad = next_id - n_ids
+            for arr in (self.parent, self.first_child, self.last_child, self.next_sibling, self.open_child):
+                arr.extend([-1] * pad)
+            self.node_type.extend([-1] * pad)
+            self.status.extend([REMOVED] * pad)
+            self.nodes.extend([None] * pad)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def close(self, node_id: int):
+        """
+        Mark an open node as closed, moving the open child cursor of its parent to the next sibling.
+        """
+        self.status[node_id] = CLOSED
+        parent_id = self.parent[node_id]
+        if parent_id >= 0 and self.open_child[parent_id] == node_id:
+            self.open_child[parent_id] = self.next_sibling[node_id]
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def reopen(self, node_id: int):
+        """
+        Mark a node as open, moving the open child cursor of its parent back to it if needed.
+        Siblings have increasing ids, so the cursor is the smallest id among the open children.
+        """
+        self.status[node_id] = OPEN
+        parent_id = self.parent[node_id]
+        if parent_id >= 0:
+            cursor = self.open_child[parent_id]
+            if cursor < 0 or node_id < cursor:
+                self.open_child[parent_id] = node_id
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def children(self, node_id: int):
+        """
+        Iterate over the ids of the children of a node, in order.
+        """
+        child_id = self.first_child[node_id]
+        next_sibling = self.next_sibling
+        while child_id >= 0:
+            yield child_id
+            child_id = next_sibling[child_id]
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def preorder(self, source: int = 0) -> List[int]:
+        """
+        Get the ids of the nodes of the subtree rooted at source, in depth first preorder.
+        """
+        first_child, next_sibling = self.first_child, self.next_sibling
+        order = []
+        stack = [source]
+        while stack:
+            node_id = stack.pop()
+            order.append(node_id)
+            child_id = first_child[node_id]
+            if child_id >= 0:
+                children = []
+                while child_id >= 0:
+                    children.append(child_id)
+                    child_id = next_sibling[child_id]
+                children.reverse()
+                stack.extend(children)
+        return order
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def node_ids(self) -> List[int]:
+        """
+        Get the ids of all the nodes of the tree, in increasing order.
+        """
+        return [node_id for node_id, status in enumerate(self.status) if status != REMOVED]
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def remove_descendants(self, node_id: int) -> int:
+        """
+        Remove all the descendants of a node from the tree.
+
+        :param node_id: The id of the node.
+        :return: The number of nodes removed.
+        """
+        if self.first_child[node_id] < 0:
+            return 0
+        removed = self.preorder(node_id)[1:]
+        status, nodes = self.status, self.nodes
+        for r_id in removed:
+            status[r_id] = REMOVED
+            nodes[r_id] = None
+        self.first_child[node_id] = self.last_child[node_id] = self.open_child[node_id] = -1
+        self.size -= len(removed)
+        return len(removed)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def rebuild_choice_points(self):
+        """
+        Recompute choice_points from the statuses of the nodes (after the tree was modified in arbitrary ways).
+        """
+        node_type, status, first_child = self.node_type, self.status, self.first_child
+        self.choice_points = array('i', [node_id for node_id in self.preorder(0) if status[node_id] == CLOSED and
+                                         first_child[node_id] >= 0 and node_type[node_id] != D])
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def to_digraph(self) -> DiGraph:
+        """
+        Export the tree to a networkx DiGraph. Each graph node has the attributes info, type and status, plus
+        state, selected_method, method_index, methods and tag for task/goal/multigoal nodes, action and tag for
+        action nodes, and tag for verification nodes.
+
+        :return: An instance of networkx DiGraph.
+        """
+        graph = DiGraph()
+        parent, node_type, status, nodes = self.parent, self.node_type, self.status, self.nodes
+        for node_id in self.node_ids():
+            node = nodes[node_id]
+            n_type = node_type[node_id]
+            attr = {'info': node.info, 'type': NODE_TYPES[n_type], 'status': NODE_STATUSES[status[node_id]]}
+            if n_type == T or n_type == G or n_type == M:
+                attr.update(state=node.state, selected_method=node.selected_method,
+                            method_index=node.method_index, methods=node.methods, tag=node.tag)
+            elif n_type == A:
+                attr.update(action=node.action, tag=node.tag)
+            elif n_type != D:
+                attr['tag'] = node.tag
+            graph.add_node(node_id, **attr)
+            if parent[node_id] >= 0:
+                graph.add_edge(parent[node_id], node_id)
+        return graph
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    @classmethod
+    def from_digraph(cls, graph: DiGraph):
+        """
+        Import a tree exported using to_digraph() (node ids must be non-negative integers, children having larger ids
+        than their parents).
+
+        :param graph: An instance of networkx DiGraph.
+        :return: An instance of SolutionTree.
+        """
+        tree = cls()
+        for node_id in sorted(graph.nodes):
+            attr = graph.nodes[node_id]
+            node = SolNode(attr['info'], methods=attr.get('methods'), action=attr.get('action'))
+            node.state = attr.get('state')
+            node.selected_method = attr.get('selected_method')
+            if 'method_index' in attr:
+                node.method_index = attr['method_index']
+            elif node.selected_method is not None:
+                # Graphs exported by older versions hold an iterator over the methods left to try instead.
+                node.method_index = node.methods.index(node.selected_method) + 1
+            node.tag = attr.get('tag', 'new')
+            tree.reserve_ids(node_id)
+            tree.add_node(next(graph.predecessors(node_id), -1), NODE_TYPES.index(attr['type']),
+                          NODE_STATUSES.index(attr['status']), node)
+        if tree.nodes:
+            tree.rebuild_choice_points()
+        return tree
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    print("Test instantiation of SolutionTree class ...")
+    test_tree = SolutionTree()
+    test_tree.add_node(-1, D, NA, SolNode(('root',)))
+    test_tree.add_node(0, T, OPEN, SolNode(('t_1',), methods=[]))
+    test_tree.add_node(0, A, OPEN, SolNode(('a_1',)))
+    test_tree.add_node(1, A, OPEN, SolNode(('a_2',)))
+    print(test_tree.preorder(0))
+    print(test_tree.to_digraph().nodes(data='info'))
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -4,7 +4,84 @@ File Description: File used for definition of State Class.
 """
 
 # ******************************************    Libraries to be imported    ****************************************** #
-from copy import deepcopy
+from copy import copy, deepcopy
+from ipyhop.fingerprint import bindings_fingerprint
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class RigidDict(dict):
+    """
+    A read-only dict used to store the rigid (immutable) state variables. Any attempt to modify it raises TypeError.
+    Since it can never change, it is shared by reference (never copied) between a state and all of its copies.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Rigid state variables can not be modified.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return RigidDict, (dict(self),)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class RigidList(list):
+    """
+    A read-only list used to store the lists of the rigid state variables (see RigidDict).
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Rigid state variables can not be modified.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return RigidList, (list(self),)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class RigidSet(set):
+    """
+    A read-only set used to store the sets of the rigid state variables (see RigidDict).
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Rigid state variables can not be modified.")
+
+    __ior__ = __iand__ = __isub__ = __ixor__ = _readonly
+    add = clear = discard = pop = remove = update = _readonly
+    difference_update = intersection_update = symmetric_difference_update = _readonly
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return RigidSet, (set(self),)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
 
 
 # ******************************************    Class Declaration Start     ****************************************** #
@@ -14,10 +91,20 @@ class State(object):
 
     *   state = State('foo') tells IPyHOP to create an empty state object named 'foo'.
         To put variables and values into it, you should do assignments such as foo.var1 = val1
+
+    *   state.declare_copy_policy('var1', policy) tells IPyHOP how the variable var1 is copied by state.copy().
+        The policy is one of State.DEEP (the default), State.SHALLOW, or State.RIGID.
     """
 
+    RIGID = 'rigid'
+    SHALLOW = 'shallow'
+    DEEP = 'deep'
+
+    __slots__ = ('__dict__', '__weakref__', '_copy_policy')
+
     def __init__(self, name: str):
         self.__name__ = name
+        self._copy_policy = None
 
     # ******************************        Class Method Declaration        ****************************************** #
     def __str__(self):
@@ -37,17 +124,108 @@ class State(object):
     def __repr__(self):
         return str(self.__class__) + ", " + self.__name__
 
+    # ******************************        Class Method Declaration        ****************************************** #
+    def declare_copy_policy(self, var_name: str, policy: str):
+        """
+        declare_copy_policy('foo', policy) tells IPyHOP how the state variable 'foo' is copied when the state is copied.
+        The policy is inherited by the copies of the state. This supersedes any previous call to
+        declare_copy_policy('foo', ...).
+            * State.DEEP (the default): foo is deep copied.
+            * State.SHALLOW: only the top level container of foo is copied. Its values are shared.
+            * State.RIGID: foo is shared by reference and never copied. It is made read-only (its dicts, lists and
+              sets become a RigidDict, RigidList and RigidSet, read-only subclasses of the same types) so that it is
+              guarded against mutation.
+
+        :param var_name: Name of the state variable.
+        :param policy: One of State.DEEP, State.SHALLOW, or State.RIGID.
+        """
+        assert type(var_name) == str, "var_name must be a string."
+        assert policy in (State.DEEP, State.SHALLOW, State.RIGID), "policy must be State.DEEP, SHALLOW or RIGID."
+        # The policy dict is shared by all the copies of a state. So, never modify it in place.
+        copy_policy = dict() if self._copy_policy is None else dict(self._copy_policy)
+        copy_policy[var_name] = policy
+        self._copy_policy = copy_policy
+        if policy == State.RIGID and var_name in self.__dict__:
+            self.__dict__[var_name] = _freeze(self.__dict__[var_name])
+
     # ******************************        Class Method Declaration        ****************************************** #
     def update(self, state):
         self.__dict__.update(state.__dict__)
+        self._update_copy_policy(state)
         return self
 
+    # ******************************        Class Method Declaration        ****************************************** #
+    def _update_copy_policy(self, state):
+        copy_policy = getattr(state, '_copy_policy', None)
+        if copy_policy is not None and copy_policy is not self._copy_policy:
+            self._copy_policy = copy_policy if self._copy_policy is None else {**self._copy_policy, **copy_policy}
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def fingerprint(self) -> int:
+        """
+        state.fingerprint() returns a 64-bit fingerprint of the variable bindings of the state (the state name is not a
+        part of it). States with the same variable bindings always have the same fingerprint, so it can be used as a
+        cache key. See ipyhop.fingerprint for the full equality contract.
+        The fingerprint of a State is computed in O(size of state). PersistentState maintains it incrementally, so
+        IPyHOP plans on a PersistentState whenever it uses the fingerprint (method_cache, nogood_memo, detect_cycles).
+
+        :return: A 64-bit integer.
+        """
+        return bindings_fingerprint(self.__dict__)
+
     # ******************************        Class Method Declaration        ****************************************** #
     def copy(self):
-        return deepcopy(self)
+        copy_policy = self._copy_policy
+        if copy_policy is None:
+            return deepcopy(self)
+        new_state = self.__class__.__new__(self.__class__)
+        new_state._copy_policy = copy_policy
+        new_dict = new_state.__dict__
+        self_dict = self.__dict__
+        memo = dict()
+        for name, val in self_dict.items():
+            policy = copy_policy.get(name, State.DEEP)
+            if policy == State.DEEP:
+                new_dict[name] = deepcopy(val, memo)
+            elif policy == State.RIGID:
+                if not _is_frozen(val):
+                    # The variable was re-bound after the policy was declared.
+                    val = self_dict[name] = _freeze(val)
+                new_dict[name] = val
+            else:
+                new_dict[name] = copy(val)
+        return new_state
 
 
 # ******************************************    Class Declaration End       ****************************************** #
+# **************************************        Function Declaration        ****************************************** #
+_RIGID_TYPES = frozenset({RigidDict, RigidList, RigidSet})
+_FROZEN_TYPES = _RIGID_TYPES | {tuple, frozenset, str, int, float, bool, complex, bytes, type(None)}
+
+
+def _is_frozen(value) -> bool:
+    return type(value) in _FROZEN_TYPES
+
+
+def _freeze(value):
+    """
+    Recursively convert a value into its read-only equivalent.
+    dict -> RigidDict, list -> RigidList, set -> RigidSet (and the values of the tuples are frozen). Other values are
+    returned unchanged.
+    """
+    if type(value) in _RIGID_TYPES:
+        return value
+    if isinstance(value, dict):
+        return RigidDict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return RigidList(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return RigidSet(value)
+    if type(value) is tuple:
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 # ******************************************    Demo / Test Routine         ****************************************** #
 if __name__ == '__main__':
     print("Test instantiation of State class ...")
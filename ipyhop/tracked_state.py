@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+"""
+File Description: File used for definition of TrackedState Class (a proxy of a State recording the state variables
+read and written through it) and AccessProfile Class (the accesses of the methods and actions over planning runs).
+
+An access is a (state_var, key) pair: state.loc[r] reads ('loc', r) and state.loc[r] = l writes it. Accessing a state
+variable as a whole (a scalar variable such as state.fuel, or iterating over state.loc) reads or writes the pair
+(state_var, None), which stands for every key of the variable.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from collections import Counter, namedtuple
+from collections.abc import Mapping, MutableMapping
+from threading import Lock
+from typing import Callable, Optional, Set, Tuple
+import sys
+from ipyhop.state import _RIGID_TYPES
+
+_MAPPING_TYPES = (dict, Mapping)
+# The values that can be changed in place once handed out (the dicts are wrapped instead, and the rigid values are
+# read-only).
+_MUTABLE_TYPES = (list, set, bytearray)
+# The key of the accesses made through a _TrackedMap wrapping a state variable itself (not a value nested in it).
+_TOP = object()
+
+AccessRecord = namedtuple('AccessRecord', ['name', 'args', 'reads', 'writes'])
+FunctionProfile = namedtuple('FunctionProfile', ['calls', 'reads', 'writes'])
+
+
+# ******************************************    Class Declaration Start     ****************************************** #
+class TrackedState(object):
+    """
+    A proxy of a State (or PersistentState) recording the (state_var, key) pairs read and written through it, so
+    that domain code runs unchanged on it.
+
+    *   tracked = TrackedState(state) wraps state. tracked.loc[r], tracked.rigid['adj'], vars(tracked) and the like
+        read and write state itself. tracked.reads and tracked.writes are the sets of the accesses made so far. Sets
+        to record the accesses into can also be given, to share them between several proxies.
+    *   The dicts nested in a state variable are wrapped too, and their accesses are recorded as accesses of the key
+        of the state variable they are nested in. A list or set handed out can be changed in place, so handing it out
+        is recorded as a write as well as a read. Calling a method of the state (e.g., copy()) reads every variable.
+    """
+
+    __slots__ = ('_state', 'reads', 'writes')
+
+    def __init__(self, state, reads: Optional[Set[Tuple]] = None, writes: Optional[Set[Tuple]] = None):
+        object.__setattr__(self, '_state', state)
+        object.__setattr__(self, 'reads', set() if reads is None else reads)
+        object.__setattr__(self, 'writes', set() if writes is None else writes)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __getattr__(self, name):
+        state = self._state
+        value = getattr(state, name)
+        if isinstance(value, _MAPPING_TYPES):
+            return _TrackedMap(value, name, _TOP, self.reads, self.writes)
+        if name in state.__dict__:
+            self.reads.add((name, None))
+            if isinstance(value, _MUTABLE_TYPES) and type(value) not in _RIGID_TYPES:
+                self.writes.add((name, None))
+        elif callable(value):
+            self.reads.update((var, None) for var in state.__dict__)
+        return value
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __setattr__(self, name, value):
+        self.writes.add((name, None))
+        setattr(self._state, name, value)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __delattr__(self, name):
+        self.writes.add((name, None))
+        delattr(self._state, name)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    @property
+    def __dict__(self):
+        # vars(tracked) gives the variables of the state, read through the proxy.
+        return _TrackedVars(self)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __str__(self):
+        self.reads.update((var, None) for var in self._state.__dict__)
+        return str(self._state)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return 'TrackedState(' + repr(self._state) + ')'
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def unwrap(self):
+        """
+        :return: The state wrapped by the proxy.
+        """
+        return self._state
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class _TrackedMap(MutableMapping):
+    """
+    A dict valued state variable (or a dict nested in one) read and written through a TrackedState.
+    """
+
+    __slots__ = ('_data', '_var', '_key', '_reads', '_writes')
+
+    def __init__(self, data, var, key, reads, writes):
+        self._data = data
+        self._var = var
+        self._key = key
+        self._reads = reads
+        self._writes = writes
+
+    def _access(self, key):
+        return (self._var, key) if self._key is _TOP else (self._var, self._key)
+
+    def _whole(self):
+        return (self._var, None) if self._key is _TOP else (self._var, self._key)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __getitem__(self, key):
+        access = self._access(key)
+        self._reads.add(access)
+        value = self._data[key]
+        if isinstance(value, _MAPPING_TYPES):
+            return _TrackedMap(value, self._var, access[1], self._reads, self._writes)
+        if isinstance(value, _MUTABLE_TYPES) and type(value) not in _RIGID_TYPES:
+            self._writes.add(access)
+        return value
+
+    def __setitem__(self, key, value):
+        self._writes.add(self._access(key))
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        self._writes.add(self._access(key))
+        del self._data[key]
+
+    def __contains__(self, key):
+        self._reads.add(self._access(key))
+        return key in self._data
+
+    def __iter__(self):
+        self._reads.add(self._whole())
+        return iter(self._data)
+
+    def __len__(self):
+        self._reads.add(self._whole())
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def copy(self) -> dict:
+        """
+        :return: A (shallow) dict copy of the wrapped dict.
+        """
+        self._reads.add(self._whole())
+        return dict(self._data)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class _TrackedVars(Mapping):
+    """
+    The variables of a state, read through a TrackedState (what vars(tracked) returns).
+    """
+
+    __slots__ = ('_tracked',)
+
+    def __init__(self, tracked):
+        self._tracked = tracked
+
+    def __getitem__(self, name):
+        if name not in self._tracked.unwrap().__dict__:
+            raise KeyError(name)
+        return getattr(self._tracked, name)
+
+    def __iter__(self):
+        state_vars = self._tracked.unwrap().__dict__
+        self._tracked.reads.update((var, None) for var in state_vars)
+        return iter(state_vars)
+
+    def __len__(self):
+        return len(self._tracked.unwrap().__dict__)
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ******************************************    Class Declaration Start     ****************************************** #
+class AccessProfile(object):
+    """
+    The (state_var, key) pairs read and written by each method and action (by function name) over planning runs.
+
+    *   planner = IPyHOP(methods, actions, access_profile=AccessProfile()) tells IPyHOP to run the methods and actions
+        on a TrackedState and to record their accesses in the profile. The method cache is then not used, so every
+        call is recorded. profile.call(func, state, args) records a call made outside of a planner.
+    *   profile[name] is the FunctionProfile(calls, reads, writes) of a function: the number of its calls, and the
+        Counters of the calls that read (wrote) each access. With keep_calls=True, profile.calls is also the list of the
+        AccessRecord(name, args, reads, writes) of every call, in order.
+    *   profile.dump(file) prints the profile of each function, and profile.as_dict() gives it as a JSON serializable
+        dict. profile.clear() forgets all the calls.
+
+    The profile is kept across calls to plan() and replan(), and can be shared between threads. It only records the
+    calls made in its own process (not the ones of plan_batch() or plan_portfolio() workers).
+    """
+
+    def __init__(self, keep_calls: bool = False):
+        self.keep_calls = keep_calls
+        self.calls = []
+        self._functions = dict()
+        self._lock = Lock()
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __getitem__(self, name: str) -> FunctionProfile:
+        calls, reads, writes = self._functions[name]
+        return FunctionProfile(calls, Counter(reads), Counter(writes))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __contains__(self, name):
+        return name in self._functions
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __iter__(self):
+        return iter(sorted(self._functions))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __len__(self):
+        return len(self._functions)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def __repr__(self):
+        return 'AccessProfile(' + ', '.join(name + '=' + str(self._functions[name][0]) for name in self) + ')'
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def call(self, func: Callable, state, args: tuple, reads: Optional[Set[Tuple]] = None,
+             writes: Optional[Set[Tuple]] = None):
+        """
+        Call func(state, *args) on a TrackedState of state, recording its accesses under the name of func.
+
+        :param func: A method, action, precondition or effect.
+        :param state: The state to call it on.
+        :param args: The arguments following the state.
+        :param reads: [Optional] A set the reads of the call are added to as well.
+        :param writes: [Optional] A set the writes of the call are added to as well.
+        :return: The result of the call (the state itself if it returned the TrackedState).
+        """
+        tracked = TrackedState(state)
+        result = func(tracked, *args)
+        self.record(func.__name__, args, tracked.reads, tracked.writes)
+        if reads is not None:
+            reads.update(tracked.reads)
+        if writes is not None:
+            writes.update(tracked.writes)
+        return result.unwrap() if type(result) is TrackedState else result
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def record(self, name: str, args: tuple, reads: Set[Tuple], writes: Set[Tuple]):
+        """
+        Record a call of a function.
+
+        :param name: The name of the function.
+        :param args: The arguments of the call following the state.
+        :param reads: The set of the accesses the call read.
+        :param writes: The set of the accesses the call wrote.
+        """
+        with self._lock:
+            function = self._functions.get(name)
+            if function is None:
+                function = self._functions[name] = [0, Counter(), Counter()]
+            function[0] += 1
+            function[1].update(reads)
+            function[2].update(writes)
+            if self.keep_calls:
+                self.calls.append(AccessRecord(name, args, frozenset(reads), frozenset(writes)))
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def as_dict(self) -> dict:
+        """
+        :return: A dict mapping the name of each function to a dict of its number of calls, and of the number of calls
+            reading (writing) each access, written as 'state_var[key]' (or 'state_var' for the whole variable).
+        """
+        with self._lock:
+            return {name: {'calls': calls, 'reads': _counts(reads), 'writes': _counts(writes)}
+                    for name, (calls, reads, writes) in sorted(self._functions.items())}
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def dump(self, file=None):
+        """
+        Print the number of calls of each function, and the accesses it read and wrote with the number of calls
+        making them (the most frequent first).
+
+        :param file: [Optional] The file to print to (sys.stdout by default).
+        """
+        file = sys.stdout if file is None else file
+        for name, function in self.as_dict().items():
+            print('{}: {} calls'.format(name, function['calls']), file=file)
+            for kind in ('reads', 'writes'):
+                counts = sorted(function[kind].items(), key=lambda item: (-item[1], item[0]))
+                print('    {}: {}'.format(kind, ', '.join('{} x{}'.format(*item) for item in counts) or '-'),
+                      file=file)
+
+    # ******************************        Class Method Declaration        ****************************************** #
+    def clear(self):
+        """
+        Forget all the calls recorded.
+        """
+        with self._lock:
+            self._functions.clear()
+            self.calls = []
+
+
+# ******************************************    Class Declaration End       ****************************************** #
+# ****************************************        Function Declaration        **************************************** #
+def _counts(counter):
+    return {var if key is None else '{}[{!r}]'.format(var, key): count for (var, key), count in counter.items()}
+
+
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    from ipyhop.state import State
+    print("Test instantiation of TrackedState class ...")
+    test_state = State('test_state')
+    test_state.loc = {'r1': 'l1', 'r2': 'l2'}
+    test_tracked = TrackedState(test_state)
+    test_tracked.loc['r1'] = test_tracked.loc['r2']
+    print(test_tracked.reads, test_tracked.writes)
+    test_profile = AccessProfile()
+    test_profile.record('test_function', (), test_tracked.reads, test_tracked.writes)
+    test_profile.dump()
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+"""
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+File Description: Access Profile Test File. Checks that a TrackedState records the (state_var, key) pairs read and
+written through it, and that the AccessProfile of a planner records the accesses of every method and action call.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+import json
+from io import StringIO
+from ipyhop import IPyHOP, State, TrackedState, AccessProfile, MethodCache
+from ipyhop.budget import Budget
+from ipyhop_tests.backjumping_test import robot_methods, robot_actions, robot_state, robot_tasks
+from ipyhop_tests.split_action_test import split_actions
+from examples.simple_travel.task_based.simple_travel_domain import actions, methods
+from examples.simple_travel.task_based.simple_travel_problem import init_state, task_list_2
+
+
+def tm_count(state, robot):
+    return [('a_move', robot, 'l' + str(len(state.loc)))]
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    # The accesses of a call.
+    state = State('state')
+    state.loc = {'r1': 'l1', 'r2': 'l2'}
+    state.rigid = {'adj': {'l1': ['l2'], 'l2': ['l1']}}
+    state.fuel = 3
+    tracked = TrackedState(state)
+    tracked.loc['r1'] = tracked.rigid['adj'][tracked.loc['r2']][0]
+    tracked.fuel -= 1
+    assert 'r3' not in tracked.loc
+    assert tracked.reads == {('loc', 'r2'), ('rigid', 'adj'), ('fuel', None), ('loc', 'r3')}
+    assert tracked.writes == {('loc', 'r1'), ('fuel', None), ('rigid', 'adj')}
+    assert state.loc['r1'] == 'l1' and state.fuel == 2
+
+    tracked = TrackedState(state)
+    assert sorted(vars(tracked)) == ['__name__', 'fuel', 'loc', 'rigid'] and not tracked.writes
+    assert tracked.reads == {('__name__', None), ('fuel', None), ('loc', None), ('rigid', None)}
+    tracked = TrackedState(state)
+    assert tm_count(tracked, 'r1') == [('a_move', 'r1', 'l2')] and tracked.reads == {('loc', None)}
+
+    # The profile of a search.
+    for trail in (False, True):
+        profile = AccessProfile(keep_calls=True)
+        exp_plan = IPyHOP(methods, actions, trail=trail).plan(init_state, task_list_2)
+        planner = IPyHOP(methods, actions, trail=trail, method_cache=MethodCache(), access_profile=profile)
+        assert planner.plan(init_state, task_list_2) == exp_plan
+        assert profile['a_walk'].calls == [action[0] for action in exp_plan].count('a_walk')
+        assert profile['a_walk'].writes == {('loc', 'bob'): 1} and profile['tm_travel_by_foot'].calls == 2
+        assert profile['a_pay_driver'].reads[('owe', 'alice')] == 1 and planner.method_cache.cache_info().misses == 0
+        assert [record.name for record in profile.calls if record.name[0] == 'a'] == [a[0] for a in exp_plan]
+        assert sum(profile[name].calls for name in profile) == len(profile.calls)
+
+        # The preconditions and effects of split actions are profiled by their names.
+        profile.clear()
+        planner = IPyHOP(methods, split_actions, trail=trail, access_profile=profile)
+        planner.plan(init_state, task_list_2)
+        assert 'tm_travel_by_foot' in profile and profile['a_walk'].calls <= profile['pre_walk'].calls
+        assert not profile['pre_walk'].writes and profile['a_walk'].writes == {('loc', 'bob'): 1}
+
+        # With backjumping, the search is unchanged.
+        profile = AccessProfile()
+        planner = IPyHOP(robot_methods, robot_actions, trail=trail, backjumping=True)
+        exp_plan = planner.plan(robot_state, robot_tasks)
+        exp_iterations = planner.iterations
+        planner = IPyHOP(robot_methods, robot_actions, trail=trail, backjumping=True, access_profile=profile)
+        assert planner.plan(robot_state, robot_tasks) == exp_plan and planner.iterations == exp_iterations
+        assert profile['a_check'].reads == {('loc', 'r1'): profile['a_check'].calls}
+
+    # The profile of a best first search, and its dump.
+    profile = AccessProfile()
+    planner = IPyHOP(methods, actions, access_profile=profile)
+    result = planner.plan_best_first(init_state, task_list_2, budget=Budget())
+    assert result.plan and all(profile[action[0]].calls >= 1 for action in result.plan)
+    profile_dict = json.loads(json.dumps(profile.as_dict()))
+    assert profile_dict['a_walk']['writes'] == {"loc['bob']": profile['a_walk'].writes[('loc', 'bob')]}
+    output = StringIO()
+    profile.dump(output)
+    assert output.getvalue().startswith('a_call_taxi: {} calls\n'.format(profile['a_call_taxi'].calls))
+    profile.clear()
+    assert len(profile) == 0 and not profile.calls
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+File Description: Async Test File. Checks that aplan() and areplan() find the same plans as plan() and replan(), yield
+to the event loop while planning, and leave the planner consistent when cancelled.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+import asyncio
+from time import monotonic
+from ipyhop import IPyHOP
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, CANCELLED
+from ipyhop_tests import sample_test_4
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based.blocks_world_problem import init_state_3, goal3
+
+
+async def tick(ticks):
+    while True:
+        ticks.append(None)
+        await asyncio.sleep(0)
+
+
+async def check_planning(trail):
+    planner = IPyHOP(methods, actions, trail=trail)
+    exp_plan = planner.plan(init_state_3, [goal3])
+    exp_iterations = planner.iterations
+
+    # Other tasks run while planning.
+    ticks = []
+    ticker = asyncio.ensure_future(tick(ticks))
+    await asyncio.sleep(0)
+    assert await planner.aplan(init_state_3, [goal3], yield_iterations=10, yield_ms=None) == exp_plan
+    assert len(ticks) > exp_iterations // 10 and planner.iterations == exp_iterations
+    ticker.cancel()
+    assert await planner.aplan(init_state_3, [goal3], yield_iterations=None, yield_ms=0) == exp_plan
+
+    # The budget of the caller is shared by all the slices.
+    result = await planner.aplan(init_state_3, [goal3], budget=Budget(max_iterations=exp_iterations // 2),
+                                 yield_iterations=7)
+    assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == 'max_iterations'
+    assert result.stats['iterations'] == exp_iterations // 2
+    result = await planner.aplan(init_state_3, [goal3], budget=Budget(deadline=monotonic() - 1))
+    assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == 'deadline'
+    result = await planner.aplan(init_state_3, [goal3], budget=Budget(deadline=monotonic() + 60), yield_iterations=3)
+    assert result.status == SUCCESS and result.plan == exp_plan and result.stats['iterations'] == exp_iterations
+
+    # A cancelled search is paused, and can be resumed.
+    task = asyncio.ensure_future(planner.aplan(init_state_3, [goal3], yield_iterations=5))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    task.cancel()
+    try:
+        await task
+        assert False, "aplan() must raise CancelledError when cancelled."
+    except asyncio.CancelledError:
+        pass
+    assert planner.result.status == CANCELLED and planner.iterations == 15
+    assert planner.sol_plan == exp_plan[:len(planner.sol_plan)]
+    assert planner.resume() == exp_plan
+
+    # Re-planning.
+    planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail)
+    plan = planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+    fail_node_id = [n for n in planner.sol_tree if planner.sol_tree.nodes[n]['info'] == plan[2]][0]
+    planner.blacklist_command(plan[2])
+    graph = planner.sol_tree.copy()
+    new_state = planner.simulate(sample_test_4.init_state)[2]
+    exp_plan = planner.replan(new_state, fail_node_id)
+    planner.sol_tree = graph
+    assert await planner.areplan(new_state, fail_node_id, yield_iterations=1) == exp_plan
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for trail in (False, True):
+        asyncio.run(check_planning(trail))
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
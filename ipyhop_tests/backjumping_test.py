@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+"""
+File Description: Backjumping Test File. Checks that the planner with backjumping finds the same plans as with
+chronological backtracking, that it skips the choice points that have nothing to do with a failure, and that the
+write sets declared by the methods are checked.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+import re
+from importlib import import_module
+from inspect import getsource
+from ipyhop import Methods, Actions, State, IPyHOP, NogoodMemo, writes
+from ipyhop.budget import Budget, NO_PLAN
+from ipyhop_tests import backtracking_test
+from ipyhop_tests.nogood_test import random_domain, set_actions
+from ipyhop_tests.cost_optimal_test import fuel_methods, fuel_actions, fuel_state
+from examples.blocks_world.goal_based import blocks_world_methods, blocks_world_actions, blocks_world_problem
+from examples.rescue.domain.rescue_methods import methods as rescue_methods
+from examples.rescue.domain.rescue_actions import actions as rescue_actions
+from examples.rescue.problem.rescue_prob_gen import StateSampler
+from examples.simple_travel.task_based import simple_travel_domain, simple_travel_problem
+
+
+def a_move(state, robot, loc):
+    state.loc[robot] = loc
+    return state
+
+
+def a_check(state, robot, loc):
+    if state.loc[robot] == loc:
+        return state
+
+
+robot_actions = Actions()
+robot_actions.declare_actions([a_move, a_check])
+
+
+def make_method(loc, declare_writes=True):
+    def tm_setup(state, robot):
+        return [('a_move', robot, loc)]
+    tm_setup.__name__ = 'tm_setup_' + loc
+    return writes(lambda robot: [('loc', robot)])(tm_setup) if declare_writes else tm_setup
+
+
+def tm_inspect(state, robot, loc):
+    return [('a_check', robot, loc)]
+
+
+# Only the last position of r1 passes the inspection, and the positions of r2 have nothing to do with it.
+robot_methods = Methods()
+robot_methods.declare_task_methods('setup', [make_method(loc) for loc in ('l1', 'l2', 'l3', 'l4', 'l5')])
+robot_methods.declare_task_methods('inspect', [tm_inspect])
+
+robot_state = State('robot_state')
+robot_state.loc = {'r1': 'l0', 'r2': 'l0'}
+robot_tasks = [('setup', 'r1'), ('setup', 'r2'), ('inspect', 'r1', 'l5')]
+
+
+@writes('loc')
+def tm_setup_both(state, robot):
+    return [('a_move', 'r1', 'l1'), ('a_move', 'r2', 'l1')]
+
+
+@writes(lambda robot: [('loc', robot)])
+def tm_setup_other(state, robot):
+    return [('a_move', 'r2' if robot == 'r1' else 'r1', 'l1')]
+
+
+@writes(('loc', 'w'), ('loc', 'y'), ('loc', 'z'))
+def tm_mode_then_w(state):
+    if state.loc['mode'] != 'l0':
+        return [('a_move', 'w', 'l1')]
+
+
+@writes(('loc', 'w'), ('loc', 'y'), ('loc', 'z'))
+def tm_mode_then_y(state):
+    return [('a_move', 'z', 'l1')] if state.loc['mode'] == 'l0' else [('a_move', 'y', 'l1')]
+
+
+def tm_need_y(state):
+    return [('a_check', 'y', 'l1')]
+
+
+# The second method of 'd' writes 'y' only once the mode is set. So, what it was seen writing does not tell what it
+# may write.
+mode_methods = Methods()
+mode_methods.declare_task_methods('d', [tm_mode_then_w, tm_mode_then_y])
+mode_methods.declare_task_methods('f', [tm_need_y])
+mode_state = State('mode_state')
+mode_state.loc = {'mode': 'l0', 'w': 'l0', 'y': 'l0', 'z': 'l0'}
+mode_tasks = [('d',), ('a_move', 'mode', 'l1'), ('d',), ('d',), ('f',)]
+
+
+def sample_problems():
+    problems = []
+    for index in range(1, 9):
+        module = import_module('ipyhop_tests.sample_test_{}'.format(index))
+        task_list = eval(re.search(r"planner.plan\(init_state, (\[.*?\])", getsource(module.main)).group(1))
+        problems.append((module.methods, module.actions, module.init_state, task_list))
+    return problems
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    problems = sample_problems()
+    for state, goal in ((blocks_world_problem.init_state_1, blocks_world_problem.goal1a),
+                        (blocks_world_problem.init_state_2, blocks_world_problem.goal2b),
+                        (blocks_world_problem.init_state_3, blocks_world_problem.goal3)):
+        problems.append((blocks_world_methods.methods, blocks_world_actions.actions, state, [goal]))
+    for task_list in (simple_travel_problem.task_list_1, simple_travel_problem.task_list_2):
+        problems.append((simple_travel_domain.methods, simple_travel_domain.actions, simple_travel_problem.init_state,
+                         task_list))
+    state_sampler = StateSampler(3)
+    for index in range(5):
+        state = state_sampler.sample()
+        task_list = [('survey_task', 'a1', state.rigid['other_loc'][index])]
+        problems.append((rescue_methods, rescue_actions, state, task_list))
+    for task_list in ([('put_it',), ('need1',)], [('put_it',), ('need0',)], [('need1',), ('need0',)]):
+        problems.append((backtracking_test.methods, backtracking_test.actions, backtracking_test.init_state, task_list))
+    problems.append((fuel_methods, fuel_actions, fuel_state, [('trip', 4)]))
+
+    problems.append((mode_methods, robot_actions, mode_state, mode_tasks))
+    for seed in range(200):
+        for n_tasks, keys in ((6, 'abc'), (9, 'abcd')):
+            random_methods, random_state, task_list = random_domain(seed, n_tasks, keys, declare_writes=True)
+            problems.append((random_methods, set_actions, random_state, task_list))
+
+    # The plans are the ones of chronological backtracking.
+    bt_iterations = bj_iterations = 0
+    for methods, actions, state, task_list in problems:
+        for options in ({}, {'trail': True}, {'nogood_memo': NogoodMemo()}, {'detect_cycles': True}):
+            planner = IPyHOP(methods, actions, **options)
+            exp_plan = planner.plan(state, task_list)
+            bt_iterations += planner.iterations
+            planner = IPyHOP(methods, actions, backjumping=True, **options)
+            assert planner.plan(state, task_list) == exp_plan
+            bj_iterations += planner.iterations
+    assert bj_iterations < bt_iterations
+    assert IPyHOP(mode_methods, robot_actions, backjumping=True).plan(mode_state, mode_tasks)[-2:] == [
+        ('a_move', 'y', 'l1'), ('a_check', 'y', 'l1')]
+
+    # The positions of r2 are not tried again for every position of r1.
+    for trail in (False, True):
+        planner = IPyHOP(robot_methods, robot_actions, trail=trail)
+        exp_plan = planner.plan(robot_state, robot_tasks)
+        bt_iterations = planner.iterations
+        planner = IPyHOP(robot_methods, robot_actions, trail=trail, backjumping=True)
+        assert planner.plan(robot_state, robot_tasks) == exp_plan
+        assert exp_plan[0] == ('a_move', 'r1', 'l5') and planner.iterations * 2 < bt_iterations
+
+        # Without a plan, the search still ends.
+        result = planner.plan(robot_state, [('setup', 'r1'), ('setup', 'r2'), ('inspect', 'r1', 'l6')],
+                              budget=Budget())
+        assert result.status == NO_PLAN and result.plan == []
+
+        # A paused search is resumed with its conflict sets.
+        planner = IPyHOP(robot_methods, robot_actions, trail=trail, backjumping=True)
+        result = planner.plan(robot_state, robot_tasks, budget=Budget(max_iterations=10))
+        restored = IPyHOP(robot_methods, robot_actions, trail=trail, backjumping=True)
+        result = restored.restore(planner.checkpoint(), budget=Budget())
+        assert result.plan == exp_plan
+
+        # Without write sets, no choice point with methods left is jumped over.
+        undeclared_methods = Methods()
+        undeclared_methods.declare_task_methods('setup', [make_method(loc, False)
+                                                          for loc in ('l1', 'l2', 'l3', 'l4', 'l5')])
+        undeclared_methods.declare_task_methods('inspect', [tm_inspect])
+        planner = IPyHOP(undeclared_methods, robot_actions, trail=trail, backjumping=True)
+        assert planner.plan(robot_state, robot_tasks) == exp_plan and planner.iterations * 2 > bt_iterations
+
+        # A write set that does not hold is reported.
+        for method in (tm_setup_both, tm_setup_other):
+            setup_methods = Methods()
+            setup_methods.declare_task_methods('setup', [method])
+            planner = IPyHOP(setup_methods, robot_actions, trail=trail, backjumping=True)
+            try:
+                plan = planner.plan(robot_state, [('setup', 'r1')])
+                assert method is tm_setup_both and plan == [('a_move', 'r1', 'l1'), ('a_move', 'r2', 'l1')]
+            except ValueError:
+                assert method is tm_setup_other
+
+    # The worker processes backjump as well.
+    planner = IPyHOP(robot_methods, robot_actions, backjumping=True)
+    exp_iterations = planner.plan(robot_state, robot_tasks, budget=Budget()).stats['iterations']
+    for result in planner.plan_batch([(robot_state, robot_tasks)] * 2, workers=2):
+        assert result.plan == exp_plan and result.stats['iterations'] == exp_iterations
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+File Description: Batch Test File. Checks that plan_batch() finds the same plans as plan(), in input order or in
+completion order, and that a failing problem does not stop the batch.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, MethodCache
+from ipyhop.batch import ERROR
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from examples.rescue.domain.rescue_methods import methods
+from examples.rescue.domain.rescue_actions import actions
+from examples.rescue.problem.rescue_prob_gen import StateSampler
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    sampler = StateSampler(seed_val=3)
+    states = [sampler.sample() for _ in range(24)]
+    problems = [(state, [('survey_task', 'a1', state.rigid['other_loc'][0])]) for state in states]
+    # A task that is not declared makes plan() raise a ValueError.
+    problems[5] = (states[5], [('no_such_task',)])
+
+    for trail in (False, True):
+        planner = IPyHOP(methods, actions, trail=trail, method_cache=MethodCache())
+        exp_plans = []
+        for state, task_list in problems:
+            try:
+                exp_plans.append(planner.plan(state, task_list))
+            except ValueError:
+                exp_plans.append(None)
+
+        for workers, chunksize, ordered in ((0, 1, True), (2, 1, True), (2, 5, False), (3, 24, False)):
+            results = list(planner.plan_batch(problems, workers=workers, chunksize=chunksize, ordered=ordered))
+            if ordered:
+                assert [result.index for result in results] == list(range(len(problems)))
+            results.sort(key=lambda r: r.index)
+            assert [result.plan for result in results] == exp_plans, "Result plans and expected plans are not same."
+            assert results[5].status == ERROR and 'no_such_task' in results[5].error
+            assert all(result.status == (SUCCESS if result.plan else NO_PLAN) and result.error is None and
+                       result.stats['iterations'] > 0 for result in results if result.index != 5)
+
+        # The budget limits every problem.
+        results = list(planner.plan_batch(problems[:4], workers=2, budget=Budget(max_iterations=2)))
+        assert all(result.status == BUDGET_EXHAUSTED and result.stats['iterations'] == 2 for result in results)
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
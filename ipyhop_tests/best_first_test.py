@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+File Description: Best First Test File. Checks that plan_best_first() finds plans of minimum cost, avoids the large
+failing subtrees a poor method order leads plan() into, and produces solution trees that can be re-planned.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from networkx import dfs_preorder_nodes
+from ipyhop import Methods, Actions, State, IPyHOP
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from ipyhop_tests import backtracking_test, sample_test_4
+from ipyhop_tests.cost_optimal_test import fuel_methods, fuel_actions, fuel_state, leg_lower_bound, brute_force_cost
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based import blocks_world_problem as problem
+
+
+def a_step(state):
+    state.steps += 1
+    return state
+
+
+step_actions = Actions()
+step_actions.declare_actions([a_step])
+
+
+def tm_deep(state, depth):
+    if depth > 0:
+        return [('a_step',), ('deep', depth - 1)]
+
+
+def tm_via_deep(state):
+    return [('deep', 10), ('a_step',)]
+
+
+def tm_direct(state):
+    return [('a_step',), ('a_step',)]
+
+
+# The first method of 'reach' leads to a binary tree of decompositions that all fail at its leaves.
+step_methods = Methods()
+step_methods.declare_task_methods('deep', [tm_deep, tm_deep])
+step_methods.declare_task_methods('reach', [tm_via_deep, tm_direct])
+
+step_state = State('step_state')
+step_state.steps = 0
+
+
+def tree_nodes(planner):
+    return [(n, repr(d['info']), d['type'], d['status'], d.get('selected_method'))
+            for n, d in planner.sol_tree.nodes(data=True)]
+
+
+def tree_plan(planner):
+    graph = planner.sol_tree
+    return [graph.nodes[n]['info'] for n in dfs_preorder_nodes(graph, 0) if graph.nodes[n]['type'] == 'A']
+
+
+def fuel_heuristic(state, tasks):
+    return sum(leg_lower_bound(state, task) for task in tasks if task[0] in ('trip', 'leg'))
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for trail in (False, True):
+        # Without backtracking, the solution tree is the one of plan().
+        planner = IPyHOP(methods, actions, trail=trail)
+        for state, goal in ((problem.init_state_1, problem.goal1a), (problem.init_state_2, problem.goal2a),
+                            (problem.init_state_3, problem.goal3)):
+            exp_plan = planner.plan(state, [goal])
+            exp_nodes = tree_nodes(planner)
+            assert planner.plan_best_first(state, [goal]) == exp_plan and tree_nodes(planner) == exp_nodes
+            assert tree_plan(planner) == exp_plan
+
+        # The plans have the minimum cost.
+        for n_legs in range(1, 6):
+            planner = IPyHOP(fuel_methods, fuel_actions, trail=trail)
+            for heuristic in (None, fuel_heuristic):
+                result = planner.plan_best_first(fuel_state, [('trip', n_legs)], heuristic, budget=Budget())
+                assert result.status == SUCCESS and result.stats['cost'] == brute_force_cost(n_legs)
+                assert tree_plan(planner) == result.plan
+                assert sum(fuel_actions.action_cost[action[0]] for action in result.plan) == result.stats['cost']
+
+        # A poor method order does not trap the search.
+        planner = IPyHOP(step_methods, step_actions, trail=trail)
+        exp_plan = planner.plan(step_state, [('reach',)])
+        dfs_iterations = planner.iterations
+        result = planner.plan_best_first(step_state, [('reach',)], budget=Budget())
+        assert result.plan == exp_plan and result.stats['iterations'] * 20 < dfs_iterations
+        assert planner.state.steps == 2
+        result = planner.plan_best_first(step_state, [('reach',)], budget=Budget(max_iterations=5))
+        assert result.status == BUDGET_EXHAUSTED and result.plan == []
+
+        # The budget is checked and the stats are reported as in plan().
+        dfs_stats = planner.plan(step_state, [('reach',)], budget=Budget()).stats
+        result = planner.plan_best_first(step_state, [('reach',)], budget=Budget())
+        assert set(result.stats) == set(dfs_stats) | {'queued', 'cost'}
+        assert result.stats['live_nodes'] == len(planner.sol_tree) and result.stats['snapshot_bytes'] > 0
+        for budget, exhausted in ((Budget(max_nodes=len(planner.sol_tree) - 1, check_interval=1), 'max_nodes'),
+                                  (Budget(max_snapshot_bytes=0), 'max_snapshot_bytes')):
+            result = planner.plan_best_first(step_state, [('reach',)], budget=budget)
+            assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == exhausted
+
+        planner = IPyHOP(backtracking_test.methods, backtracking_test.actions, trail=trail)
+        plan = planner.plan_best_first(backtracking_test.init_state, [('put_it',), ('need1',)])
+        assert plan == [('a_putv', 1), ('a_getv', 1), ('a_getv', 1)]
+        result = planner.plan_best_first(backtracking_test.init_state, [('need1',), ('need0',)], budget=Budget())
+        assert result.status == NO_PLAN and result.plan == [] and result.stats['cost'] is None
+
+        # The solution tree can be re-planned.
+        planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail)
+        plan = planner.plan_best_first(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+        assert len(plan) < len(planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)]))
+        planner.plan_best_first(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+        fail_node_id = [n for n in planner.sol_tree if planner.sol_tree.nodes[n]['info'] == plan[1]][0]
+        planner.blacklist_command(plan[1])
+        new_state = planner.simulate(sample_test_4.init_state)[1]
+        new_plan = planner.replan(new_state, fail_node_id)
+        assert new_plan and plan[1] not in new_plan
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+File Description: Budget Test File. Checks the search budgets and the structured result of plan() and replan().
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from time import monotonic
+from ipyhop import IPyHOP, Methods
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from ipyhop_tests import backtracking_test
+from ipyhop_tests.backjumping_test import robot_actions, robot_state, tm_inspect
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based.blocks_world_problem import init_state_3, goal3
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for trail in (False, True):
+        planner = IPyHOP(methods, actions, trail=trail)
+        exp_plan = planner.plan(init_state_3, [goal3])
+        exp_iterations = planner.iterations
+        assert planner.result.status == SUCCESS and planner.result.plan == exp_plan
+
+        result = planner.plan(init_state_3, [goal3], budget=Budget(10 ** 6, monotonic() + 60, 10 ** 6, 10 ** 9))
+        assert result.status == SUCCESS and result.plan == exp_plan and result.stats['iterations'] == exp_iterations
+        assert result.stats['exhausted'] is None and result.stats['live_nodes'] > len(exp_plan)
+
+        result = planner.plan(init_state_3, [goal3], budget=Budget(max_iterations=exp_iterations // 2))
+        assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == 'max_iterations'
+        assert result.stats['iterations'] == exp_iterations // 2 and result.plan == exp_plan[:len(result.plan)]
+
+        result = planner.plan(init_state_3, [goal3], budget=Budget(deadline=monotonic() - 1))
+        assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == 'deadline'
+        assert result.stats['iterations'] == 0 and result.plan == []
+
+        result = planner.plan(init_state_3, [goal3], budget=Budget(max_nodes=20, check_interval=1))
+        assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == 'max_nodes'
+        assert 20 < result.stats['live_nodes'] < 30
+
+        result = planner.plan(init_state_3, [goal3], budget=Budget(max_snapshot_bytes=0))
+        assert result.status == BUDGET_EXHAUSTED and result.stats['exhausted'] == 'max_snapshot_bytes'
+        assert result.stats['snapshot_bytes'] > 0
+
+        # The tasks with a single method do not save the state.
+        inspect_methods = Methods()
+        inspect_methods.declare_task_methods('inspect', [tm_inspect])
+        result = IPyHOP(inspect_methods, robot_actions, trail=trail).plan(
+            robot_state, [('inspect', 'r1', 'l0')] * 3, budget=Budget(max_snapshot_bytes=0, check_interval=1))
+        assert result.status == SUCCESS and result.plan == [('a_check', 'r1', 'l0')] * 3
+        assert result.stats['snapshots'] == result.stats['snapshot_bytes'] == 0
+
+        planner = IPyHOP(backtracking_test.methods, backtracking_test.actions, trail=trail)
+        result = planner.plan(backtracking_test.init_state, [('need1',), ('need0',)], budget=Budget())
+        assert result.status == NO_PLAN and result.plan == [] and result.stats['backtracks'] > 0
+        result = planner.plan(backtracking_test.init_state, [('put_it',), ('need1',)], budget=Budget())
+        assert result.status == SUCCESS and result.stats['backtracks'] > 1
+        assert result.plan == [('a_putv', 1), ('a_getv', 1), ('a_getv', 1)]
+
+        fail_node_id = [n for n in planner.sol_tree if planner.sol_tree.nodes[n]['info'] == ('a_getv', 1)][-1]
+        planner.blacklist_command(('a_getv', 1))
+        result = planner.replan(planner.simulate(backtracking_test.init_state)[1], fail_node_id, budget=Budget(5))
+        assert result.status == NO_PLAN and result.plan == []
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+File Description: Checkpoint Test File. Checks that a search paused by its budget can be resumed, and serialized to
+bytes and restored (in the same or another process), without changing the plan.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from concurrent.futures import ProcessPoolExecutor
+from ipyhop import IPyHOP
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from ipyhop_tests import backtracking_test, sample_test_4
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based.blocks_world_problem import init_state_3, goal3
+
+problems = [(methods, actions, init_state_3, [goal3]),
+            (backtracking_test.methods, backtracking_test.actions, backtracking_test.init_state,
+             [('put_it',), ('need1',)]),
+            (backtracking_test.methods, backtracking_test.actions, backtracking_test.init_state,
+             [('need1',), ('need0',)]),
+            (sample_test_4.methods, sample_test_4.actions, sample_test_4.init_state, [('tm_1',), ('tm_3',)])]
+
+
+def tree_nodes(planner):
+    return [(n, repr(d['info']), d['type'], d['status']) for n, d in planner.sol_tree.nodes(data=True)]
+
+
+def restore_in_worker(problem_ind, trail, data):
+    planner = IPyHOP(*problems[problem_ind][:2], trail=trail)
+    return planner.restore(data, budget=Budget())
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for trail in (False, True):
+        for problem_ind, (p_methods, p_actions, state, task_list) in enumerate(problems):
+            planner = IPyHOP(p_methods, p_actions, trail=trail)
+            exp_plan = planner.plan(state, task_list)
+            exp_iterations, exp_nodes = planner.iterations, tree_nodes(planner)
+
+            for step in (1, 3, 7):
+                # Pause the search every few iterations, and resume it in the same planner.
+                result = planner.plan(state, task_list, budget=Budget(max_iterations=step))
+                iterations = result.stats['iterations']
+                while result.status == BUDGET_EXHAUSTED:
+                    assert result.stats['iterations'] == step
+                    result = planner.resume(Budget(max_iterations=step))
+                    iterations += result.stats['iterations']
+                assert result.plan == exp_plan and iterations == exp_iterations and tree_nodes(planner) == exp_nodes
+                assert result.status == (SUCCESS if exp_plan else NO_PLAN)
+
+                # Checkpoint the search at every pause, and restore it in a new planner.
+                result = planner.plan(state, task_list, budget=Budget(max_iterations=step))
+                while result.status == BUDGET_EXHAUSTED:
+                    data = planner.checkpoint()
+                    assert isinstance(data, bytes)
+                    planner = IPyHOP(p_methods, p_actions, trail=trail)
+                    result = planner.restore(data, budget=Budget(max_iterations=step))
+                assert result.plan == exp_plan and tree_nodes(planner) == exp_nodes
+
+            # A completed search can not be resumed.
+            try:
+                planner.resume()
+                assert False, "resume() must fail if no search is paused."
+            except ValueError:
+                pass
+
+            # Restore a checkpoint in another process.
+            result = planner.plan(state, task_list, budget=Budget(max_iterations=exp_iterations // 2))
+            assert result.status == BUDGET_EXHAUSTED
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(restore_in_worker, problem_ind, trail, planner.checkpoint()).result()
+            assert result.plan == exp_plan
+
+        # Re-planning can be paused too.
+        planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail)
+        plan = planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+        fail_node_id = [n for n in planner.sol_tree if planner.sol_tree.nodes[n]['info'] == plan[2]][0]
+        planner.blacklist_command(plan[2])
+        graph = planner.sol_tree.copy()
+        new_state = planner.simulate(sample_test_4.init_state)[2]
+        exp_plan = planner.replan(new_state, fail_node_id)
+        planner.sol_tree = graph
+        result = planner.replan(new_state, fail_node_id, budget=Budget(max_iterations=2))
+        assert result.status == BUDGET_EXHAUSTED
+        data = planner.checkpoint()
+        planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail)
+        assert planner.restore(data) == exp_plan
+        assert plan[2] in planner.blacklist
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
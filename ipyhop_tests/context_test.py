@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+File Description: Context Test File. Checks that one planner can run several searches at once in separate planning
+contexts (from the threads of a ThreadPoolExecutor), and that the attribute API follows the last context.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from concurrent.futures import ThreadPoolExecutor
+from ipyhop import IPyHOP, PlanningContext, MethodCache, NogoodMemo
+from ipyhop.budget import Budget, BUDGET_EXHAUSTED
+from ipyhop_tests import sample_test_4
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based.blocks_world_problem import init_state_1, init_state_2, init_state_3, goal1a, \
+    goal1b, goal2a, goal2b, goal3
+
+problems = [(init_state_1, [goal1a]), (init_state_1, [goal1b]), (init_state_2, [goal2a]), (init_state_2, [goal2b]),
+            (init_state_3, [goal3])]
+
+
+def replan_in_context(planner):
+    # Plan, then re-plan after the failure of the third action, in a context of its own.
+    context = PlanningContext()
+    plan = planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)], context=context)
+    fail_node_id = [n for n in context.sol_tree if context.sol_tree.nodes[n]['info'] == plan[2]][0]
+    new_state = planner.simulate(sample_test_4.init_state, context=context)[2]
+    return plan, planner.replan(new_state, fail_node_id, context=context)
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for trail in (False, True):
+        exp_plans = [IPyHOP(methods, actions, trail=trail).plan(state, task_list) for state, task_list in problems]
+        for kwargs in ({}, {'method_cache': MethodCache(), 'nogood_memo': NogoodMemo(), 'detect_cycles': True}):
+            planner = IPyHOP(methods, actions, trail=trail, **kwargs)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                # Without a context, every call creates one.
+                plans = list(executor.map(lambda p: planner.plan(*p), problems * 4))
+                assert plans == exp_plans * 4
+                # With a context, the results of each search stay in its context.
+                contexts = [PlanningContext() for _ in problems * 4]
+                plans = list(executor.map(lambda p, c: planner.plan(*p, context=c), problems * 4, contexts))
+                assert plans == exp_plans * 4
+                assert [c.sol_plan for c in contexts] == exp_plans * 4 and all(c.result.plan for c in contexts)
+
+        # Re-planning in separate contexts.
+        planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail)
+        planner.blacklist_command(('t_a', 2, 3))
+        exp_result = replan_in_context(planner)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(replan_in_context, [planner] * 8)) == [exp_result] * 8
+
+        # The attribute API follows the context of the last call made without one.
+        planner = IPyHOP(methods, actions, trail=trail)
+        plan = planner.plan(init_state_3, [goal3])
+        context = PlanningContext()
+        result = planner.plan(init_state_1, [goal1a], budget=Budget(max_iterations=3), context=context)
+        assert planner.sol_plan == plan and planner.context is not context and planner.state.__name__ != 'init_state_1'
+        assert result.status == BUDGET_EXHAUSTED and planner.resume(context=context) == exp_plans[0]
+        assert context.sol_plan == exp_plans[0] and planner.sol_plan == plan
+        planner.plan(init_state_1, [goal1a])
+        assert planner.sol_plan == exp_plans[0] and planner.result.plan == exp_plans[0]
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
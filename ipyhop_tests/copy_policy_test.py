@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+File Description: Copy Policy Test File. Checks the rigid, shallow and deep copy policies of State variables.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import State, PersistentState, IPyHOP, MonteCarloExecutor
+from examples.simple_travel.task_based.simple_travel_domain import methods, actions
+from examples.simple_travel.task_based.simple_travel_problem import init_state, task_list_2
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for state_class in (State, PersistentState):
+        state = state_class('state')
+        state.rigid = {'adj': {'l0': ['l1'], 'l1': ['l0']}, 'obstacles': {(2, 2)}}
+        state.loc = {'r1': 'l0'}
+        state.images = {'a1': [1, 2]}
+        state.declare_copy_policy('rigid', State.RIGID)
+        state.declare_copy_policy('images', State.SHALLOW)
+
+        state_copy = state.copy()
+        assert state_copy.rigid is state.rigid, "Rigid variable was copied."
+        assert state_copy.rigid['adj']['l0'] == ['l1'] and state_copy.rigid['obstacles'] == {(2, 2)}
+        assert isinstance(state_copy.rigid['adj']['l0'], list) and isinstance(state_copy.rigid['obstacles'], set)
+        if state_class is State:
+            # PersistentState always copies dict variables on write. So, this holds only for State.
+            assert state_copy.images['a1'] is state.images['a1'], "Shallow variable was deep copied."
+        state_copy.loc['r1'] = 'l1'
+        assert state.loc['r1'] == 'l0', "Deep variable was shared."
+
+        for modify in (lambda: state_copy.rigid['adj'].update(l2=['l1']),
+                       lambda: state_copy.rigid['adj']['l0'].append('l2'),
+                       lambda: state_copy.rigid['obstacles'].add((3, 3))):
+            try:
+                modify()
+                raise AssertionError("Rigid variable was modified.")
+            except TypeError:
+                pass
+        assert state_copy.rigid['adj']['l0'] == ['l1'] and state_copy.rigid['obstacles'] == {(2, 2)}
+
+        # The policies are inherited by the copies.
+        state_copy.rigid = {'adj': {}}
+        assert state_copy.copy().rigid is state_copy.rigid
+
+    planner = IPyHOP(methods, actions)
+    plan = planner.plan(init_state, task_list_2)
+    exp_0 = [('a_call_taxi', 'alice', 'home_a'), ('a_ride_taxi', 'alice', 'park'), ('a_pay_driver', 'alice', 'park'),
+             ('a_walk', 'bob', 'home_b', 'park')]
+    assert plan == exp_0, "Result plan and expected plan are not same"
+    exec_list = MonteCarloExecutor(actions).execute(init_state, plan)
+    assert all(result_state.rigid is init_state.rigid for _, result_state in exec_list), "Rigid variable was copied."
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
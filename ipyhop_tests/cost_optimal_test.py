@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""
+File Description: Cost Optimal Test File. Checks that plan_optimal() finds the plans of minimum total action cost (as
+found by brute force), reports the improving plans, uses the lower bound hook, and can be paused and resumed.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from itertools import product
+from ipyhop import Methods, Actions, State, IPyHOP, MethodCache, NogoodMemo
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from ipyhop_tests import backtracking_test
+from examples.simple_travel.task_based import simple_travel_domain as travel
+from examples.simple_travel.task_based.simple_travel_problem import init_state as travel_state, task_list_2
+
+
+# Walking is slow: it costs more than the three actions of a taxi ride.
+travel_actions = Actions()
+travel_actions.declare_actions([travel.a_walk, travel.a_call_taxi, travel.a_ride_taxi, travel.a_pay_driver])
+travel_actions.declare_action_models({'a_walk': [1, 0], 'a_call_taxi': [1, 0], 'a_ride_taxi': [1, 0],
+                                      'a_pay_driver': [1, 0]},
+                                     {'a_walk': 5.0, 'a_call_taxi': 1.0, 'a_ride_taxi': 1.0, 'a_pay_driver': 1.0})
+
+
+# Each leg of a trip is driven cheaply (using 2 fuel), normally (using 1 fuel) or expensively (using no fuel).
+def a_drive(state, leg, fuel):
+    if state.fuel >= fuel:
+        state.fuel -= fuel
+        state.legs[leg] = fuel
+        return state
+
+
+def a_drive_far(state, leg):
+    state.legs[leg] = -1
+    return state
+
+
+fuel_actions = Actions()
+fuel_actions.declare_actions([a_drive, a_drive_far])
+fuel_actions.declare_action_models({'a_drive': [1, 0], 'a_drive_far': [1, 0]}, {'a_drive': 1.0, 'a_drive_far': 4.0})
+
+
+def tm_trip(state, n_legs):
+    return [('leg', leg) for leg in range(n_legs)]
+
+
+def tm_leg_far(state, leg):
+    return [('a_drive_far', leg)]
+
+
+def tm_leg_fuel_1(state, leg):
+    return [('a_drive', leg, 1), ('a_drive', leg, 0)]
+
+
+def tm_leg_fuel_2(state, leg):
+    return [('a_drive', leg, 2)]
+
+
+fuel_methods = Methods()
+fuel_methods.declare_task_methods('trip', [tm_trip])
+fuel_methods.declare_task_methods('leg', [tm_leg_far, tm_leg_fuel_1, tm_leg_fuel_2])
+
+fuel_state = State('fuel_state')
+fuel_state.fuel = 5
+fuel_state.legs = {}
+
+
+def a_pick_mid(state):
+    state.picked = 'mid'
+    return state
+
+
+def a_pick_dear(state):
+    state.picked = 'dear'
+    return state
+
+
+def a_pick_cheap(state):
+    state.picked = 'cheap'
+    return state
+
+
+def tm_pick_mid(state):
+    return [('a_pick_mid',)]
+
+
+def tm_pick_dear(state):
+    return [('a_pick_dear',)]
+
+
+def tm_pick_cheap(state):
+    return [('a_pick_cheap',)]
+
+
+def tm_nothing(state):
+    return []
+
+
+# After the first plan, picking dear is pruned. Then 'finish' (refined without children, using its only method) must be
+# refined anew after picking cheap.
+pick_actions = Actions()
+pick_actions.declare_actions([a_pick_mid, a_pick_dear, a_pick_cheap])
+pick_actions.declare_action_models({'a_pick_mid': [1, 0], 'a_pick_dear': [1, 0], 'a_pick_cheap': [1, 0]},
+                                   {'a_pick_mid': 3.0, 'a_pick_dear': 5.0, 'a_pick_cheap': 1.0})
+pick_methods = Methods()
+pick_methods.declare_task_methods('pick', [tm_pick_mid, tm_pick_dear, tm_pick_cheap])
+pick_methods.declare_task_methods('finish', [tm_nothing])
+pick_state = State('pick_state')
+pick_state.picked = None
+pick_tasks = [('pick',), ('finish',)]
+
+
+def leg_lower_bound(state, node_info):
+    # Every leg costs at least 1.
+    return node_info[1] if node_info[0] == 'trip' else 1.0
+
+
+def brute_force_cost(n_legs):
+    # Apply every combination of leg methods, and return the cost of the cheapest applicable one.
+    best = None
+    for leg_methods in product(fuel_methods.task_method_dict['leg'], repeat=n_legs):
+        state, cost = fuel_state.copy(), 0.0
+        for leg, method in enumerate(leg_methods):
+            for action in method(state, leg):
+                state = fuel_actions.action_dict[action[0]](state, *action[1:]) if state else None
+                cost += fuel_actions.action_cost[action[0]]
+        if state and (best is None or cost < best):
+            best = cost
+    return best
+
+
+def plan_cost(plan, p_actions):
+    return sum(p_actions.action_cost[action[0]] for action in plan)
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    # The first plan walks, but taking taxis is cheaper.
+    planner = IPyHOP(travel.methods, travel_actions)
+    first_plan = planner.plan(travel_state, task_list_2)
+    solutions = []
+    plan = planner.plan_optimal(travel_state, task_list_2, on_solution=lambda p, c: solutions.append((p, c)))
+    assert solutions[0] == (first_plan, plan_cost(first_plan, travel_actions)) and solutions[-1] == (plan, 6.0)
+    assert all(cost_1 > cost_2 for (_, cost_1), (_, cost_2) in zip(solutions, solutions[1:]))
+    assert ('a_walk', 'bob', 'home_b', 'park') in first_plan and ('a_call_taxi', 'bob', 'home_b') in plan
+    tree_plan = [planner.sol_tree.nodes[n]['info'] for n in planner.sol_tree if planner.sol_tree.nodes[n]['type'] == 'A']
+    assert sorted(tree_plan) == sorted(plan) and planner.state.loc['bob'] == 'park'
+    assert planner.plan(travel_state, task_list_2) == first_plan
+
+    for n_legs in range(1, 6):
+        exp_cost = brute_force_cost(n_legs)
+        for options in ({}, {'trail': True}, {'nogood_memo': NogoodMemo()}, {'method_cache': MethodCache()},
+                        {'detect_cycles': True, 'trail': True, 'nogood_memo': NogoodMemo()}):
+            planner = IPyHOP(fuel_methods, fuel_actions, **options)
+            result = planner.plan_optimal(fuel_state, [('trip', n_legs)], budget=Budget())
+            assert result.status == SUCCESS and plan_cost(result.plan, fuel_actions) == exp_cost
+            assert result.stats['cost'] == exp_cost and result.stats['solutions'] >= 1
+            iterations = result.stats['iterations']
+
+            # An admissible lower bound prunes more, but finds a plan of the same cost.
+            result = planner.plan_optimal(fuel_state, [('trip', n_legs)], lower_bound=leg_lower_bound,
+                                          budget=Budget())
+            assert result.stats['cost'] == exp_cost and result.stats['iterations'] <= iterations
+
+            # The search can be paused, resumed and checkpointed.
+            result = planner.plan_optimal(fuel_state, [('trip', n_legs)], lower_bound=leg_lower_bound,
+                                          budget=Budget(max_iterations=4))
+            while result.status == BUDGET_EXHAUSTED:
+                assert result.plan is None or plan_cost(result.plan, fuel_actions) == result.stats['cost']
+                data = planner.checkpoint()
+                planner = IPyHOP(fuel_methods, fuel_actions, **options)
+                result = planner.restore(data, budget=Budget(max_iterations=4))
+            assert result.status == SUCCESS and result.stats['cost'] == exp_cost
+
+    for options in ({}, {'trail': True}, {'nogood_memo': NogoodMemo()}):
+        result = IPyHOP(pick_methods, pick_actions, **options).plan_optimal(pick_state, pick_tasks, budget=Budget())
+        assert result.status == SUCCESS and result.plan == [('a_pick_cheap',)] and result.stats['solutions'] == 2
+
+    planner = IPyHOP(backtracking_test.methods, backtracking_test.actions)
+    result = planner.plan_optimal(backtracking_test.init_state, [('need1',), ('need0',)], budget=Budget())
+    assert result.status == NO_PLAN and result.plan == [] and result.stats['cost'] is None
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
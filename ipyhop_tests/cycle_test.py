@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+File Description: Cycle Test File. Checks the detection of looping decompositions.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, Methods, Actions, State
+from ipyhop.nogood_memo import NogoodMemo
+
+
+def a_inc(state, key):
+    state.val[key] += 1
+    return state
+
+
+def a_dec(state, key):
+    state.val[key] -= 1
+    return state
+
+
+def tm_loop(state):
+    return [('loop',)]
+
+
+def tm_inc(state):
+    return [('a_inc', 'x')]
+
+
+def tm_wrap(state):
+    return [('loop',), ('a_dec', 'x')]
+
+
+def tm_count_down(state, n):
+    return [('a_inc', 'y'), ('count_down', n - 1)] if n > 0 else []
+
+
+def gm_same(state, key, val):
+    return [('val', key, val)]
+
+
+def gm_inc(state, key, val):
+    return [('a_inc', key)]
+
+
+actions = Actions()
+actions.declare_actions([a_inc, a_dec])
+methods = Methods()
+methods.declare_task_methods('loop', [tm_loop, tm_inc])
+methods.declare_task_methods('wrap', [tm_wrap])
+methods.declare_task_methods('count_down', [tm_count_down])
+methods.declare_goal_methods('val', [gm_same, gm_inc])
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    state = State('state')
+    state.val = {'x': 0, 'y': 0}
+    for trail in (False, True):
+        for memo in (None, NogoodMemo()):
+            planner = IPyHOP(methods, actions, trail=trail, nogood_memo=memo, detect_cycles=True)
+            # Without cycle detection, the first method of 'loop' (or 'val') recurses forever.
+            assert planner.plan(state, [('loop',)]) == [('a_inc', 'x')]
+            assert planner.plan(state, [('val', 'x', 1)]) == [('a_inc', 'x')]
+            # Recursions that change the state are not cycles.
+            assert planner.plan(state, [('count_down', 3)]) == [('a_inc', 'y')] * 3
+            # The failure of a node on a cycle depends on its ancestors, so it must not be learned as a nogood.
+            assert planner.plan(state, [('wrap',), ('loop',)]) == [('a_inc', 'x'), ('a_dec', 'x'), ('a_inc', 'x')]
+            # The path multiset holds the ancestors of the last refined node.
+            path_keys = [key for key in planner.context._path_keys if key is not None]
+            assert sum(planner.context._path_counts.values()) == len(path_keys)
+            assert planner.context._path == [0]
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
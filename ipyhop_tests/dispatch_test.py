@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+File Description: Dispatch Table Test File. Checks the dispatch table compiled from the methods and actions.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, Methods, Actions
+from ipyhop.dispatch import compile_domain, handler_arity
+from ipyhop.sol_tree import T, A, G
+from ipyhop_tests.sample_test_4 import methods, actions, init_state
+
+
+def tm_bad_name(state):
+    return [('t_typo', 0, 1)]
+
+
+def tm_bad_arity(state):
+    return [('t_a', 0)]
+
+
+def a_var(state, *args):
+    return state
+
+
+def gm_default(state, arg, val=None):
+    return []
+
+
+def _raises(func, *args):
+    try:
+        func(*args)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    table = compile_domain(methods, actions)
+    assert table['tm_1'] == (T, methods.task_method_dict['tm_1'], 0)
+    assert table['t_a'] == (A, [actions.action_dict['t_a']], 2)
+    assert handler_arity([a_var]) is None and handler_arity([gm_default]) is None
+    assert handler_arity([tm_bad_name, tm_bad_arity]) == 0 and handler_arity([tm_bad_name, gm_default]) is None
+
+    # A name can only have one kind.
+    domain_methods = Methods()
+    domain_methods.declare_task_methods('loc', [tm_bad_name])
+    assert "already declared as a task" in _raises(domain_methods.declare_goal_methods, 'loc', [gm_default])
+    domain_actions = Actions()
+    domain_actions.declare_actions([a_var])
+    domain_methods.declare_task_methods('a_var', [tm_bad_name])
+    assert "already declared as a task" in _raises(compile_domain, domain_methods, domain_actions)
+    assert _raises(IPyHOP(domain_methods, domain_actions).plan, init_state, [('loc',)]) is not None
+
+    # Unknown subtasks and subtasks with the wrong number of arguments are errors.
+    domain_methods = Methods()
+    domain_methods.declare_task_methods('bad_name', [tm_bad_name])
+    domain_methods.declare_task_methods('bad_arity', [tm_bad_arity])
+    planner = IPyHOP(domain_methods, actions)
+    assert "('t_typo', 0, 1) (in the subtasks of ('bad_name',)) is not a declared" in \
+           _raises(planner.plan, init_state, [('bad_name',)])
+    assert "has 1 arguments, but 't_a' expects 2" in _raises(planner.plan, init_state, [('bad_arity',)])
+
+    # The table is compiled again only when the domain changes.
+    planner = IPyHOP(methods, actions)
+    planner.plan(init_state, [('tm_1',)])
+    table = planner._dispatch
+    planner.plan(init_state, [('tm_1',)])
+    assert planner._dispatch is table
+    methods.declare_task_methods('tm_1', methods.task_method_dict['tm_1'])
+    planner.plan(init_state, [('tm_1',)])
+    assert planner._dispatch is not table and planner._dispatch == table
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+File Description: Fingerprint Test File. Checks the incremental state fingerprints against recomputed ones.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+import random
+from ipyhop import State, PersistentState, MultiGoal
+from ipyhop.fingerprint import bindings_fingerprint
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def check(state):
+    # The fingerprint is taken first, since reading the bindings may mark the variables as modified.
+    fp = state.fingerprint()
+    exp_fp = bindings_fingerprint(vars(state))
+    assert fp == exp_fp, "Incremental fingerprint differs from the recomputed fingerprint."
+    return exp_fp
+
+
+def main():
+    state_1 = State('state_1')
+    state_1.loc = {'r1': 'l1', 'r2': 'l2'}
+    state_1.flag = 0
+    state_2 = State('state_2')
+    state_2.flag = 0
+    state_2.loc = {'r2': 'l2', 'r1': 'l1'}
+    assert state_1.fingerprint() == state_2.fingerprint(), "Same bindings must give the same fingerprint."
+    assert state_1.fingerprint() == PersistentState.from_state(state_2).fingerprint()
+    state_2.loc['r1'] = 'l2'
+    assert state_1.fingerprint() != state_2.fingerprint(), "Different bindings gave the same fingerprint."
+    state_2.loc['r1'] = 'l1'
+    state_2.empty = {}
+    assert state_1.fingerprint() != state_2.fingerprint(), "An empty variable must change the fingerprint."
+
+    goal_1 = MultiGoal('goal_1')
+    goal_1.loc = {'r1': 'l1', 'r2': 'l2'}
+    goal_1.flag = 0
+    goal_2 = goal_1.copy()
+    assert goal_1.fingerprint() == goal_2.fingerprint()
+    goal_2.goal_tag = 'tag'
+    assert goal_1.fingerprint() != goal_2.fingerprint(), "The goal tag must be a part of the fingerprint."
+
+    # Undoing a rebind after a value was modified in place.
+    state = PersistentState('state')
+    state.a = {'x': 1, 'y': [0]}
+    state.start_trail()
+    check(state)
+    state.a['y'].append(1)
+    mark = state.trail_mark()
+    state.a = {'x': 2}
+    check(state)
+    state.undo_trail(mark)
+    check(state)
+    assert state.a == {'x': 1, 'y': [0, 1]}
+
+    rng = random.Random(0)
+    state = PersistentState('state')
+    state.loc = {'r%d' % i: 'l0' for i in range(5)}
+    state.coffin_filled = {'c1': [], 'c2': []}
+    state.flag = 0
+    state.visited = []
+    state.rigid = {'types': {'r1': 'robot'}}
+    state.declare_copy_policy('rigid', State.RIGID)
+    check(state)
+    states = [state]
+    state.start_trail()
+    marks = []
+    for _ in range(2000):
+        state = rng.choice(states)
+        op = rng.randrange(10)
+        if op == 0:
+            state.loc['r%d' % rng.randrange(6)] = 'l%d' % rng.randrange(3)
+        elif op == 1:
+            state.coffin_filled['c%d' % rng.randrange(1, 3)].append(rng.randrange(3))
+        elif op == 2:
+            state.flag = rng.randrange(3)
+        elif op == 3:
+            state.visited.append(rng.randrange(3))
+        elif op == 4 and len(states) < 10:
+            states.append(state.copy())
+        elif op == 5:
+            state.loc.pop('r%d' % rng.randrange(6), None)
+        elif op == 6:
+            state.loc = {'r0': 'l%d' % rng.randrange(3)}
+        elif op == 7 and state._trail is not None:
+            marks.append(state.trail_mark())
+        elif op == 8 and marks and states[0]._trail is not None:
+            states[0].undo_trail(marks.pop())
+            marks = [m for m in marks if m <= len(states[0]._trail)]
+        elif op == 9:
+            state.coffin_filled = {'c1': [], 'c2': [rng.randrange(3)]}
+        if rng.random() < 0.3:
+            check(state)
+    for state in states:
+        exp_fp = check(state)
+        assert exp_fp == State.fingerprint(state), "PersistentState fingerprint differs from State fingerprint."
+        assert exp_fp == state.copy().fingerprint(), "A copy of a state must have the same fingerprint."
+        assert exp_fp == PersistentState.from_state(state).fingerprint()
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
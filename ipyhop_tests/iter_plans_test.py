@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+File Description: Iter Plans Test File. Checks that iter_plans() yields every solution once, in the order of the depth
+first search, by resuming a single search, and that its dedup, max_plans and budget options work.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from itertools import product
+from networkx import dfs_preorder_nodes
+from ipyhop import Methods, IPyHOP, NogoodMemo
+from ipyhop.budget import Budget, BUDGET_EXHAUSTED
+from ipyhop_tests import backtracking_test
+from ipyhop_tests.cost_optimal_test import fuel_methods, fuel_actions, fuel_state, pick_methods, pick_actions, \
+    pick_state, pick_tasks
+
+
+def tm_never(state):
+    return None
+
+
+# The same domain, with a task that can never be accomplished.
+never_methods = Methods()
+never_methods.declare_task_methods('trip', fuel_methods.task_method_dict['trip'])
+never_methods.declare_task_methods('leg', fuel_methods.task_method_dict['leg'])
+never_methods.declare_task_methods('never', [tm_never])
+
+
+def tm_put_again(state):
+    return [('a_putv', 1)]
+
+
+# Two decompositions of 'put_twice' lead to the same actions.
+twice_methods = Methods()
+twice_methods.declare_task_methods('put_twice', [tm_put_again, tm_put_again])
+
+
+def all_plans(n_legs):
+    # Apply every combination of leg methods, in the order of the depth first search.
+    plans = []
+    for leg_methods in product(fuel_methods.task_method_dict['leg'], repeat=n_legs):
+        state, plan = fuel_state.copy(), []
+        for leg, method in enumerate(leg_methods):
+            for action in method(state, leg):
+                state = fuel_actions.action_dict[action[0]](state, *action[1:]) if state else None
+                plan.append(action)
+        if state:
+            plans.append(plan)
+    return plans
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    # The task refined without children after the choice is refined anew for every choice.
+    for options in ({}, {'trail': True}, {'nogood_memo': NogoodMemo()}):
+        plans = [solution.plan for solution in IPyHOP(pick_methods, pick_actions, **options).iter_plans(
+            pick_state, pick_tasks)]
+        assert plans == [[('a_pick_mid',)], [('a_pick_dear',)], [('a_pick_cheap',)]]
+
+    for n_legs in range(1, 5):
+        exp_plans = all_plans(n_legs)
+        for options in ({}, {'trail': True}, {'nogood_memo': NogoodMemo()}, {'detect_cycles': True, 'trail': True}):
+            planner = IPyHOP(fuel_methods, fuel_actions, **options)
+            iterations = 0
+            solutions = []
+            for solution in planner.iter_plans(fuel_state, [('trip', n_legs)]):
+                assert planner.sol_plan == solution.plan
+                iterations += planner.iterations
+                solutions.append(solution)
+            iterations += planner.iterations
+            assert [solution.plan for solution in solutions] == exp_plans
+            assert solutions[0].plan == planner.plan(fuel_state, [('trip', n_legs)])
+            for plan, sol_tree, cost in solutions:
+                assert [sol_tree.nodes[n]['info'] for n in dfs_preorder_nodes(sol_tree, 0)
+                        if sol_tree.nodes[n]['type'] == 'A'] == plan
+                assert cost == sum(fuel_actions.action_cost[action[0]] for action in plan)
+
+            # A single search is resumed: it makes the iterations of a search failing after each plan.
+            planner = IPyHOP(never_methods, fuel_actions, **options)
+            assert planner.plan(fuel_state, [('trip', n_legs), ('never',)]) == []
+            assert iterations + len(exp_plans) == planner.iterations
+
+    planner = IPyHOP(fuel_methods, fuel_actions)
+    exp_plans = all_plans(4)
+    assert [s.plan for s in planner.iter_plans(fuel_state, [('trip', 4)], max_plans=5)] == exp_plans[:5]
+    assert list(planner.iter_plans(fuel_state, [('trip', 4)], max_plans=0)) == []
+    solutions = list(planner.iter_plans(fuel_state, [('trip', 4)], budget=Budget(max_iterations=100)))
+    assert 0 < len(solutions) < len(exp_plans) and planner.result.status == BUDGET_EXHAUSTED
+    assert [solution.plan for solution in solutions] == exp_plans[:len(solutions)]
+
+    # The decompositions leading to the same actions are yielded once with dedup.
+    planner = IPyHOP(twice_methods, backtracking_test.actions, trail=True)
+    task_list = [('put_twice',), ('put_twice',)]
+    assert len(list(planner.iter_plans(backtracking_test.init_state, task_list))) == 4
+    solutions = list(planner.iter_plans(backtracking_test.init_state, task_list, dedup=True))
+    assert [solution.plan for solution in solutions] == [[('a_putv', 1), ('a_putv', 1)]]
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
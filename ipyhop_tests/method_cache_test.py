@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+File Description: Method Cache Test File. Checks the bounded LRU cache of method refinements.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, MethodCache, State, PersistentState, Methods, Actions, uncached
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based.blocks_world_problem import init_state_1, goal1a, goal1b, init_state_3, goal3
+
+calls = []
+
+
+def m_count(state, key):
+    calls.append(key)
+    return [('a_noop', key)]
+
+
+@uncached
+def m_impure(state, key):
+    calls.append(key)
+    return []
+
+
+def a_noop(state):
+    return state
+
+
+def a_done(state):
+    return state
+
+
+def a_push(state):
+    state.a['y'].append(1)
+    return state
+
+
+def a_rebind(state):
+    state.a = {'x': 2}
+
+
+def tm_probe(state):
+    return [('a_done',)] if len(state.a['y']) > 1 else [('a_noop',)]
+
+
+@uncached
+def tm_rebind(state):
+    return [('a_rebind',)]
+
+
+def tm_skip(state):
+    return []
+
+
+# The failed action rebinds a variable modified in place before. Undoing it must not bring back a stale fingerprint.
+rebind_actions = Actions()
+rebind_actions.declare_actions([a_noop, a_done, a_push, a_rebind])
+rebind_methods = Methods()
+rebind_methods.declare_task_methods('t_probe', [tm_probe])
+rebind_methods.declare_task_methods('t_choice', [tm_rebind, tm_skip])
+rebind_state = State('rebind_state')
+rebind_state.a = {'x': 1, 'y': [0]}
+rebind_tasks = [('t_probe',), ('a_push',), ('t_choice',), ('t_probe',)]
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    # LRU eviction and statistics.
+    cache = MethodCache(2)
+    state = State('state')
+    state.val = {'a': 1}
+    for key in ('a', 'b', 'a', 'c', 'b', 'a'):
+        cache.call(m_count, state, (key,))
+    assert calls == ['a', 'b', 'c', 'b', 'a'], "The least recently used result must be evicted first."
+    assert tuple(cache.cache_info()) == (1, 5, 3, 2, 2)
+    state.val['a'] = 2
+    cache.call(m_count, state, ('a',))
+    assert len(calls) == 6 and cache.misses == 6, "A different state must not reuse the cached result."
+    cache.call(m_impure, state, ('a',))
+    cache.call(m_impure, state, ('a',))
+    assert len(calls) == 8 and cache.misses == 6 and len(cache) == 2, "Impure methods must not be cached."
+    cache.clear()
+    assert tuple(cache.cache_info()) == (0, 0, 0, 2, 0)
+
+    # Caching must not change the plans.
+    for trail in (False, True):
+        for maxsize in (1, 4096):
+            cache = MethodCache(maxsize)
+            planner = IPyHOP(methods, actions, trail=trail)
+            c_planner = IPyHOP(methods, actions, trail=trail, method_cache=cache)
+            for state, goal in ((init_state_1, goal1a), (init_state_1, goal1b), (init_state_3, goal3),
+                                (init_state_1, [('pos', 'b', 'hand')])):
+                goal = goal if type(goal) == list else [goal]
+                assert c_planner.plan(state, goal) == planner.plan(state, goal), "Caching changed the plan."
+                assert c_planner.iterations == planner.iterations
+                # The fingerprint used as the cache key is maintained incrementally.
+                assert isinstance(c_planner.state, PersistentState)
+            assert cache.hits > 0 or maxsize == 1
+
+        planner = IPyHOP(rebind_methods, rebind_actions, trail=trail, method_cache=MethodCache())
+        assert planner.plan(rebind_state, rebind_tasks) == [('a_noop',), ('a_push',), ('a_done',)]
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+"""
+File Description: Nogood Test File. Checks that the nogoods learned by the planner prune the search but never change
+the plans.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from random import Random
+from ipyhop import IPyHOP, Methods, Actions, State, PlanningContext, writes
+from ipyhop.nogood_memo import NogoodMemo
+from ipyhop_tests import backtracking_test, sample_test_4
+
+calls = []
+
+
+def a_inc(state, key):
+    state.val[key] += 1
+    return state
+
+
+def a_fail(state):
+    return None
+
+
+def tm_inc_z(state):
+    return [('a_inc', 'z')]
+
+
+def tm_hard_1(state, depth):
+    calls.append(depth)
+    return [('a_inc', 'x'), ('hard', depth - 1)] if depth > 0 else [('a_fail',)]
+
+
+def tm_hard_2(state, depth):
+    calls.append(depth)
+    return [('a_inc', 'y'), ('hard', depth - 1)] if depth > 0 else [('a_fail',)]
+
+
+actions = Actions()
+actions.declare_actions([a_inc, a_fail])
+methods = Methods()
+methods.declare_task_methods('choose', [tm_inc_z, tm_inc_z, tm_inc_z])
+methods.declare_task_methods('hard', [tm_hard_1, tm_hard_2])
+
+
+def a_set(state, key, val):
+    state.val[key] = val
+    return state
+
+
+def a_need(state, key, val):
+    if state.val[key] == val:
+        return state
+
+
+def a_done(state):
+    return state
+
+
+set_actions = Actions()
+set_actions.declare_actions([a_set, a_need, a_done])
+
+
+def tm_top_1(state):
+    return [('c',), ('x',), ('f',)]
+
+
+def tm_top_2(state):
+    return [('x',), ('a_done',)]
+
+
+def tm_c_1(state):
+    return [('a_set', 'x', 1)]
+
+
+def tm_empty(state):
+    return []
+
+
+def tm_never(state):
+    return None
+
+
+def tm_f(state):
+    return [('a_need', 'x', 2)]
+
+
+# The leaf 'x' re-opened when backtracking to 'c' is only tried with its second method, and fails from the same state
+# as the 'x' of the second method of 'top'.
+reopen_methods = Methods()
+reopen_methods.declare_task_methods('top', [tm_top_1, tm_top_2])
+reopen_methods.declare_task_methods('c', [tm_c_1, tm_empty])
+reopen_methods.declare_task_methods('x', [tm_empty, tm_never])
+reopen_methods.declare_task_methods('f', [tm_f])
+
+
+def make_method(name, condition, subtasks):
+    def tm_random(state):
+        if condition is None or state.val[condition[0]] == condition[1]:
+            return list(subtasks)
+    tm_random.__name__ = name
+    tm_random.subtasks = subtasks
+    return tm_random
+
+
+def random_domain(seed, n_tasks=6, keys='abc', declare_writes=False):
+    # Tasks t0, ..., t<n_tasks-1> with 1 to 3 methods each (some conditioned on the state). A method of a task
+    # decomposes it into actions setting or needing the values of keys, and tasks of higher indices. With
+    # declare_writes, the methods declare the keys their subtrees may set (see ipyhop.conflict_tracker.writes).
+    rng = Random(seed)
+    task_methods = []
+    for task_index in range(n_tasks):
+        task_methods.append([])
+        for method_index in range(rng.randint(1, 3)):
+            condition = (rng.choice(keys), rng.randint(0, 1)) if rng.random() < 0.3 else None
+            subtasks = []
+            for _ in range(rng.randint(0, 3)):
+                pick = rng.random()
+                if pick < 0.35 and task_index + 1 < n_tasks:
+                    subtasks.append(('t{}'.format(rng.randint(task_index + 1, n_tasks - 1)),))
+                else:
+                    subtasks.append(('a_set' if pick < 0.7 else 'a_need', rng.choice(keys), rng.randint(0, 1)))
+            task_methods[-1].append(make_method('tm_t{}_{}'.format(task_index, method_index), condition, subtasks))
+
+    random_methods = Methods()
+    task_writes = dict()
+    for task_index in range(n_tasks - 1, -1, -1):
+        task_writes[task_index] = set()
+        for method in task_methods[task_index]:
+            method_writes = set()
+            for subtask in method.subtasks:
+                if subtask[0] == 'a_set':
+                    method_writes.add(('val', subtask[1]))
+                elif subtask[0] != 'a_need':
+                    method_writes.update(task_writes[int(subtask[0][1:])])
+            if declare_writes:
+                writes(*method_writes)(method)
+            task_writes[task_index].update(method_writes)
+        random_methods.declare_task_methods('t{}'.format(task_index), task_methods[task_index])
+    random_state = State('random_state')
+    random_state.val = {key: 0 for key in keys}
+    return random_methods, random_state, [('t0',), ('t1',), ('t0',)]
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    state = State('state')
+    state.val = {'x': 0, 'y': 0, 'z': 0}
+    for trail in (False, True):
+        # Every method of 'choose' leads to the same state, so 'hard' is re-entered in the same state.
+        del calls[:]
+        plan = IPyHOP(methods, actions, trail=trail).plan(state, [('choose',), ('hard', 3)])
+        n_calls = len(calls)
+        del calls[:]
+        planner = IPyHOP(methods, actions, trail=trail, nogood_memo=NogoodMemo())
+        assert planner.plan(state, [('hard', 3)]) == []
+        n_memo_calls = len(calls)
+        del calls[:]
+        assert planner.plan(state, [('choose',), ('hard', 3)]) == plan == []
+        assert len(calls) == n_memo_calls, "The nogood of 'hard' must be pruned on re-entry."
+        memo = planner.context.nogood_memo
+        # The sub-tasks reached through different orders of the x and y increments are pruned too.
+        assert 3 * n_memo_calls < n_calls and memo.hits > 2
+
+        # Every search has its own memo, reset at every call to plan().
+        context = PlanningContext()
+        assert planner.plan(state, [('hard', 3)], context=context) == []
+        assert context.nogood_memo is not memo and len(context.nogood_memo) == len(memo) > 0
+        assert planner.plan(state, [('choose',)]) == [('a_inc', 'z')]
+        assert len(planner.context.nogood_memo) == 0 and len(memo) > 0
+        assert planner.plan(state, [('choose',)], context=context) == [('a_inc', 'z')]
+        assert len(context.nogood_memo) == 0 and context.nogood_memo.hits == 0
+
+        # A bounded memo must still give the same plans.
+        for maxsize in (1, 4096):
+            for task_list in ([('put_it',), ('need0',)], [('put_it',), ('need01',)], [('put_it',), ('need10',)],
+                              [('put_it',), ('need1',)], [('need1',), ('need0',)]):
+                planner = IPyHOP(backtracking_test.methods, backtracking_test.actions, trail=trail,
+                                 nogood_memo=NogoodMemo(maxsize))
+                exp_plan = IPyHOP(backtracking_test.methods, backtracking_test.actions).plan(
+                    backtracking_test.init_state, task_list)
+                assert planner.plan(backtracking_test.init_state, task_list) == exp_plan
+
+            exp_plans = []
+            for memo in (None, NogoodMemo(maxsize)):
+                planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail, nogood_memo=memo)
+                plan = planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+                fail_node_id = [n for n in planner.sol_tree if planner.sol_tree.nodes[n]['info'] == plan[2]][0]
+                planner.blacklist_command(plan[2])
+                exp_plans.append((plan, planner.replan(planner.simulate(sample_test_4.init_state)[2], fail_node_id)))
+            assert exp_plans[0] == exp_plans[1], "Result plan and expected plan are not same."
+
+        # A node that only tried some of its methods is not a nogood.
+        reopen_state = State('reopen_state')
+        reopen_state.val = {'x': 0}
+        exp_plan = IPyHOP(reopen_methods, set_actions, trail=trail).plan(reopen_state, [('top',)])
+        planner = IPyHOP(reopen_methods, set_actions, trail=trail, nogood_memo=NogoodMemo(100))
+        assert planner.plan(reopen_state, [('top',)]) == exp_plan == [('a_done',)]
+
+        # Every solution is still found.
+        for seed in range(300):
+            random_methods, random_state, task_list = random_domain(seed)
+            planner = IPyHOP(random_methods, set_actions, trail=trail)
+            exp_plans = [solution.plan for solution in planner.iter_plans(random_state, task_list, max_plans=200)]
+            planner = IPyHOP(random_methods, set_actions, trail=trail, nogood_memo=NogoodMemo(100))
+            plans = [solution.plan for solution in planner.iter_plans(random_state, task_list, max_plans=200)]
+            assert plans == exp_plans, "The nogoods of seed {} pruned some solutions.".format(seed)
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
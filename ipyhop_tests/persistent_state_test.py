@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+File Description: Persistent State Test File. Checks that PersistentState is a drop-in replacement for State.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, PersistentState
+from ipyhop_tests.test_state_models import init_state_1
+from ipyhop_tests import sample_test_1
+from examples.robosub.domain.robosub_mod_methods import methods as robosub_methods
+from examples.robosub.domain.robosub_mod_actions import actions as robosub_actions
+from examples.robosub.problem.robosub_mod_problem import init_state as robosub_state, task_list_1 as robosub_tasks
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    state = PersistentState('state')
+    state.loc = {'r1': (1, 1), 'r2': (2, 2)}
+    state.coffin_filled = {'c1': []}
+    state.flag = 0
+
+    state_copy = state.copy()
+    state_copy.loc['r1'] = (5, 5)
+    state_copy.coffin_filled['c1'].append('1o')
+    state_copy.flag = 1
+    assert state.loc == {'r1': (1, 1), 'r2': (2, 2)}, "Write to a copy leaked into the original state."
+    assert state.coffin_filled == {'c1': []}, "Nested write to a copy leaked into the original state."
+    assert state.flag == 0, "Rebinding a variable in a copy leaked into the original state."
+    assert state_copy.loc == {'r1': (5, 5), 'r2': (2, 2)} and state_copy.coffin_filled == {'c1': ['1o']}
+
+    state.loc['r2'] = (3, 3)
+    assert state_copy.loc['r2'] == (2, 2), "Write to the original state leaked into a copy."
+    print(state)
+
+    planner = IPyHOP(sample_test_1.methods, sample_test_1.actions)
+    exp_plan = planner.plan(init_state_1, [('tm_1',), ('tm_2',)])
+    plan = planner.plan(PersistentState.from_state(init_state_1), [('tm_1',), ('tm_2',)])
+    assert plan == exp_plan, "Result plan and expected plan are not same"
+
+    planner = IPyHOP(robosub_methods, robosub_actions)
+    planner.blacklist_command(('a_touch_back_v', 'v1', 'l2'))
+    planner.blacklist_command(('a_touch_front_v', 'v1', 'l2'))
+    exp_plan = planner.plan(robosub_state, robosub_tasks)
+    p_state = PersistentState.from_state(robosub_state)
+    plan = planner.plan(p_state, robosub_tasks)
+    assert plan == exp_plan, "Result plan and expected plan are not same"
+    assert p_state.coffin_filled == robosub_state.coffin_filled, "Planning modified the initial state."
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
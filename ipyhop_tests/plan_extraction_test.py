@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+File Description: Plan Extraction Test File. Checks the plan maintained incrementally by the planner during search.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, Actions, State
+from ipyhop.sol_tree import A, CLOSED
+from ipyhop_tests import backtracking_test, sample_test_4
+
+planner = None
+checks = []
+
+
+def _closed_actions():
+    tree = planner.context._tree
+    return [tree.nodes[n].info for n in tree.preorder(0) if tree.node_type[n] == A and tree.status[n] == CLOSED and
+            tree.nodes[n].tag == 'new']
+
+
+def _checked(action):
+    # Wraps an action to check (mid-search) that the plan holds the completed actions, in depth first order.
+    def checked_action(state, *args):
+        assert planner.sol_plan == _closed_actions(), "The plan is out of sync with the solution tree."
+        checks.append(len(planner.sol_plan))
+        return action(state, *args)
+
+    checked_action.__name__ = action.__name__
+    return checked_action
+
+
+def _checked_actions(actions):
+    checked_actions = Actions()
+    checked_actions.declare_actions([_checked(action) for action in actions.action_dict.values()])
+    return checked_actions
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    global planner
+    for trail in (False, True):
+        planner = IPyHOP(sample_test_4.methods, _checked_actions(sample_test_4.actions), trail=trail)
+        plan = planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+        assert plan == [('t_a', 0, 1), ('t_a', 1, 2), ('t_a', 2, 3), ('t_a', 3, 7), ('t_a', 3, 4), ('t_a', 4, 5),
+                        ('t_a', 7, 8)], "Result plan and expected plan are not same."
+        assert plan == _closed_actions()
+
+        fail_node_id = [n for n in planner.sol_tree if planner.sol_tree.nodes[n]['info'] == plan[2]][0]
+        planner.blacklist_command(plan[2])
+        state = planner.simulate(sample_test_4.init_state)[2]
+        plan = planner.replan(state, fail_node_id)
+        assert plan == _closed_actions(), "Re-planning must only return the new actions."
+
+        planner = IPyHOP(backtracking_test.methods, _checked_actions(backtracking_test.actions), trail=trail)
+        state = State('state')
+        state.flag = -1
+        plan = planner.plan(state, [('put_it',), ('need1',)])
+        assert plan == [('a_putv', 1), ('a_getv', 1), ('a_getv', 1)], "Result plan and expected plan are not same."
+        assert planner.plan(state, [('need1',), ('need0',)]) == [] and planner.sol_plan == []
+    assert max(checks) > 0
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
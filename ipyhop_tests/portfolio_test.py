@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+File Description: Portfolio Test File. Checks that plan_portfolio() returns the plan of the winning configuration,
+stops the other workers, and reports the problems without a plan, the exhausted budgets and the errors.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from random import Random
+from time import monotonic
+from ipyhop import Methods, IPyHOP
+from ipyhop.batch import ERROR
+from ipyhop.budget import Budget, SUCCESS, BUDGET_EXHAUSTED, NO_PLAN
+from ipyhop.portfolio import PortfolioConfig, permute_methods, luby
+from ipyhop_tests import backtracking_test
+from examples.blocks_world.goal_based.blocks_world_actions import actions
+from examples.blocks_world.goal_based.blocks_world_methods import methods
+from examples.blocks_world.goal_based.blocks_world_problem import init_state_3, goal3
+
+
+def m_loop(state):
+    return [('loop',)]
+
+
+def m_done(state):
+    return [('a_putv', 1)]
+
+
+# The declared method order never ends: 'loop' is decomposed into 'loop' forever.
+loop_methods = Methods()
+loop_methods.declare_task_methods('loop', [m_loop, m_done])
+
+
+def config_plan(p_methods, p_actions, config, state, task_list):
+    # The plan found by a configuration without restarts.
+    if config.seed is not None:
+        p_methods = permute_methods(p_methods, Random(config.seed))
+    return IPyHOP(p_methods, p_actions).plan(state, task_list)
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    assert [luby(i) for i in range(1, 16)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+    permuted = permute_methods(backtracking_test.methods, Random(0))
+    for task_name, method_list in backtracking_test.methods.task_method_dict.items():
+        assert sorted(permuted.task_method_dict[task_name], key=id) == sorted(method_list, key=id)
+    assert permuted.dispatch.keys() == backtracking_test.methods.dispatch.keys()
+
+    # The plan is the plan of the winning configuration.
+    planner = IPyHOP(backtracking_test.methods, backtracking_test.actions)
+    state, task_list = backtracking_test.init_state, [('put_it',), ('need1',)]
+    for k in (1, 3):
+        result = planner.plan_portfolio(state, task_list, k=k, seed=7)
+        assert result.status == SUCCESS and result.error is None and result.stats['workers'] == k
+        assert 0 <= result.winner < k and result.config == PortfolioConfig(None if result.winner == 0 else
+                                                                           7 + result.winner, None)
+        assert result.plan == config_plan(backtracking_test.methods, backtracking_test.actions, result.config, state,
+                                          task_list)
+    result = planner.plan_portfolio(state, task_list, k=1)
+    assert result.plan == planner.plan(state, task_list) and result.winner == 0
+
+    # The workers with restarts still find a plan.
+    planner = IPyHOP(methods, actions, trail=True)
+    planner.plan(init_state_3, [goal3])
+    exp_iterations = planner.iterations
+    configs = [PortfolioConfig(seed, 2) for seed in range(3)]
+    result = planner.plan_portfolio(init_state_3, [goal3], configs=configs, slice_iterations=5)
+    assert result.status == SUCCESS and result.config in configs and result.stats['restarts'] >= 0
+    state_copy = init_state_3.copy()
+    for action in result.plan:
+        state_copy = actions.action_dict[action[0]](state_copy, *action[1:])
+    assert all(state_copy.pos[block] == pos for block, pos in goal3.pos.items())
+    result = planner.plan_portfolio(init_state_3, [goal3], k=2, budget=Budget(max_iterations=exp_iterations // 4))
+    assert result.status == BUDGET_EXHAUSTED and result.winner is None and result.plan is None
+
+    # The first worker to end wins, and the others are stopped (here, the worker with the declared method order would
+    # never end).
+    planner = IPyHOP(loop_methods, backtracking_test.actions)
+    seed = next(s for s in range(100) if permute_methods(loop_methods, Random(s)).task_method_dict['loop'][0] is m_done)
+    start_time = monotonic()
+    result = planner.plan_portfolio(backtracking_test.init_state, [('loop',)],
+                                    configs=[PortfolioConfig(None, None), PortfolioConfig(seed, None)])
+    assert result.status == SUCCESS and result.plan == [('a_putv', 1)] and result.winner == 1
+    assert monotonic() - start_time < 30
+    result = planner.plan_portfolio(backtracking_test.init_state, [('loop',)],
+                                    configs=[PortfolioConfig(None, None), PortfolioConfig(0, 1)])
+    assert result.status == SUCCESS and result.winner == 1
+
+    # A complete search finding no plan wins too, and the errors are reported.
+    planner = IPyHOP(backtracking_test.methods, backtracking_test.actions)
+    result = planner.plan_portfolio(state, [('need1',), ('need0',)], k=2)
+    assert result.status == NO_PLAN and result.plan == [] and result.winner in (0, 1)
+    result = planner.plan_portfolio(state, [('no_such_task',)], k=2)
+    assert result.status == ERROR and 'no_such_task' in result.error and result.winner is None
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
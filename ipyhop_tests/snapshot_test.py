@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+File Description: Snapshot Test File. Checks that the state is saved only at the nodes having alternative methods.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, State
+from ipyhop.sol_tree import NO_SNAPSHOT
+from ipyhop_tests import backtracking_test, sample_test_4
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    for trail in (False, True):
+        planner = IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=trail)
+        plan = planner.plan(sample_test_4.init_state, [('tm_1',), ('tm_3',)])
+        assert plan == [('t_a', 0, 1), ('t_a', 1, 2), ('t_a', 2, 3), ('t_a', 3, 7), ('t_a', 3, 4), ('t_a', 4, 5),
+                        ('t_a', 7, 8)], "Result plan and expected plan are not same."
+        graph = planner.sol_tree
+        for node_id in graph.nodes:
+            node = graph.nodes[node_id]
+            if node['type'] in ('T', 'G', 'M'):
+                if len(node['methods']) > 1:
+                    assert node['state'] is not NO_SNAPSHOT, "A node with alternative methods was not saved."
+                else:
+                    assert node['state'] is NO_SNAPSHOT, "A node without alternative methods was saved."
+        assert any(graph.nodes[n]['info'] == ('tm_3',) and graph.nodes[n]['state'] is NO_SNAPSHOT for n in graph)
+
+    # need1 has a single method. Backtracking through it must resume put_it from its saved state.
+    planner = IPyHOP(backtracking_test.methods, backtracking_test.actions)
+    state = State('state')
+    state.flag = -1
+    plan = planner.plan(state, [('put_it',), ('need1',)])
+    assert plan == [('a_putv', 1), ('a_getv', 1), ('a_getv', 1)], \
+        "Result plan and expected plan are not same."
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+File Description: Solution Tree Test File. Checks the array backed solution tree and its DiGraph export / import.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from networkx import is_tree, dfs_preorder_nodes
+from ipyhop import IPyHOP
+from ipyhop.sol_tree import SolutionTree, SolNode, D, T, A, NA, OPEN
+from ipyhop_tests.sample_test_4 import methods, actions, init_state
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    tree = SolutionTree()
+    root_id = tree.add_node(-1, D, NA, SolNode(('root',)))
+    t_id = tree.add_node(root_id, T, OPEN, SolNode(('tm_1',), methods=[]))
+    a_id = tree.add_node(root_id, A, OPEN, SolNode(('t_a', 0, 1)))
+    tree.add_node(t_id, A, OPEN, SolNode(('t_a', 1, 2)))
+    assert tree.preorder(root_id) == [0, 1, 3, 2] and list(tree.children(root_id)) == [t_id, a_id]
+    assert tree.remove_descendants(t_id) == 1 and len(tree) == 3 and tree.node_ids() == [0, 1, 2]
+    tree.reserve_ids(5)
+    assert tree.add_node(a_id, A, OPEN, SolNode(('t_a', 2, 3))) == 5
+
+    planner = IPyHOP(methods, actions)
+    plan = planner.plan(init_state, [('tm_1',), ('tm_3',)])
+    # The choice point stack maintained while backtracking must match the one recomputed from the tree.
+    choice_points = list(planner.context._tree.choice_points)
+    planner.context._tree.rebuild_choice_points()
+    assert choice_points == list(planner.context._tree.choice_points), "Choice point stack is out of sync with the tree."
+    tree = planner.context._tree
+    for node_id in tree.node_ids():
+        open_children = [c_id for c_id in tree.children(node_id) if tree.status[c_id] == OPEN]
+        assert tree.open_child[node_id] == (open_children[0] if open_children else -1), "Open child cursor is wrong."
+    graph = planner.sol_tree
+    assert is_tree(graph), "Error! Solution graph is not a tree."
+    assert [graph.nodes[n]['info'] for n in dfs_preorder_nodes(graph, 0) if graph.nodes[n]['type'] == 'A'] == plan
+    fail_node_id = [n for n in graph.nodes if graph.nodes[n]['info'] == plan[2]][0]
+
+    # Importing the exported tree back must give the same replanning result.
+    exp_plans = []
+    for reimport in (False, True):
+        planner = IPyHOP(methods, actions)
+        planner.plan(init_state, [('tm_1',), ('tm_3',)])
+        if reimport:
+            planner.sol_tree = planner.sol_tree.copy()
+        planner.blacklist_command(plan[2])
+        exp_plans.append(planner.replan(planner.simulate(init_state)[2], fail_node_id))
+        assert is_tree(planner.sol_tree)
+    assert exp_plans[0] == exp_plans[1], "Replanning on an imported solution tree gave a different plan."
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
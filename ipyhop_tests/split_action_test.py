@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+File Description: Split Action Test File. Checks the actions declared as (precondition, effect) pairs.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, Actions, State
+from examples.simple_travel.task_based.simple_travel_domain import actions, methods, is_a, taxi_rate, distance
+from examples.simple_travel.task_based.simple_travel_problem import init_state, task_list_2
+
+
+def pre_walk(state, p, x, y):
+    return is_a(state, p, 'person') and is_a(state, x, 'location') and is_a(state, y, 'location') and x != y and \
+        state.loc[p] == x
+
+
+def a_walk(state, p, x, y):
+    state.loc[p] = y
+
+
+def pre_call_taxi(state, p, x):
+    return is_a(state, p, 'person') and is_a(state, x, 'location')
+
+
+def a_call_taxi(state, p, x):
+    state.loc['taxi1'] = x
+    state.loc[p] = 'taxi1'
+
+
+def pre_ride_taxi(state, p, y):
+    return is_a(state, p, 'person') and is_a(state, state.loc[p], 'taxi') and is_a(state, y, 'location') and \
+        is_a(state, state.loc[state.loc[p]], 'location') and state.loc[state.loc[p]] != y
+
+
+def a_ride_taxi(state, p, y):
+    taxi = state.loc[p]
+    x = state.loc[taxi]
+    state.loc[taxi] = y
+    state.owe[p] = taxi_rate(distance(state, x, y))
+
+
+def pre_pay_driver(state, p, y):
+    return is_a(state, p, 'person') and state.cash[p] >= state.owe[p]
+
+
+def a_pay_driver(state, p, y):
+    state.cash[p] = state.cash[p] - state.owe[p]
+    state.owe[p] = 0
+    state.loc[p] = y
+
+
+split_actions = Actions()
+split_actions.declare_actions([(pre_walk, a_walk), (pre_call_taxi, a_call_taxi), (pre_ride_taxi, a_ride_taxi),
+                               (pre_pay_driver, a_pay_driver)])
+
+
+class CountingState(State):
+    copies = 0
+
+    def copy(self):
+        CountingState.copies += 1
+        return State.copy(self)
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    assert list(split_actions.action_dict) == ['a_walk', 'a_call_taxi', 'a_ride_taxi', 'a_pay_driver']
+
+    state = CountingState('state')
+    state.update(init_state)
+    state.cash = {'alice': 20, 'bob': 1}
+    for trail in (False, True):
+        planner = IPyHOP(methods, actions, trail=trail)
+        CountingState.copies = 0
+        exp_plan = planner.plan(state, task_list_2)
+        exp_copies = CountingState.copies
+        exp_states = planner.simulate(state)
+
+        planner = IPyHOP(methods, split_actions, trail=trail)
+        CountingState.copies = 0
+        plan = planner.plan(state, task_list_2)
+        assert plan == exp_plan, "Result plan and expected plan are not same."
+        if not trail:
+            assert CountingState.copies < exp_copies, "Actions with preconditions must not copy the state."
+        assert [vars(s) for s in planner.simulate(state)] == [vars(s) for s in exp_states]
+
+    # A failing precondition never modifies the state.
+    state = init_state.copy()
+    assert split_actions.action_dict['a_pay_driver'](state, 'alice', 'park') is state
+    assert split_actions.action_dict['a_walk'](state, 'alice', 'home_b', 'park') is None
+    assert state.loc['alice'] == 'park'
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""
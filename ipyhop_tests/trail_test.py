@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+File Description: Trail Test File. Checks that trail based backtracking gives the same plans as state snapshots.
+"""
+
+# ******************************************    Libraries to be imported    ****************************************** #
+from ipyhop import IPyHOP, PersistentState
+from ipyhop_tests import backtracking_test, sample_test_4
+from ipyhop_tests.test_state_models import init_state_1
+from examples.robosub.domain.robosub_mod_methods import methods as robosub_methods
+from examples.robosub.domain.robosub_mod_actions import actions as robosub_actions
+from examples.robosub.problem.robosub_mod_problem import init_state as robosub_state, task_list_2 as robosub_tasks
+
+
+# ******************************************        Main Program Start      ****************************************** #
+def main():
+    state = PersistentState('state')
+    state.loc = {'r1': 'l0'}
+    state.coffin_filled = {'c1': []}
+    state.start_trail()
+    mark = state.trail_mark()
+    state.loc['r1'] = 'l1'
+    state.loc['r2'] = 'l2'
+    state.coffin_filled['c1'].append('1o')
+    state.flag = True
+    state.undo_trail(mark)
+    assert state.loc == {'r1': 'l0'} and state.coffin_filled == {'c1': []} and 'flag' not in vars(state)
+
+    snap_planner = IPyHOP(backtracking_test.methods, backtracking_test.actions)
+    trail_planner = IPyHOP(backtracking_test.methods, backtracking_test.actions, trail=True)
+    for task_list in [[('put_it',), ('need0',)], [('put_it',), ('need01',)], [('put_it',), ('need10',)],
+                      [('put_it',), ('need1',)]]:
+        exp_plan = snap_planner.plan(backtracking_test.init_state, task_list)
+        plan = trail_planner.plan(backtracking_test.init_state, task_list)
+        assert plan == exp_plan, "Result plan and expected plan are not same"
+        assert trail_planner.iterations == snap_planner.iterations, "Trail planner searched differently."
+
+    for planner in [IPyHOP(sample_test_4.methods, sample_test_4.actions),
+                    IPyHOP(sample_test_4.methods, sample_test_4.actions, trail=True)]:
+        plan = planner.plan(init_state_1, [('tm_1',), ('tm_3',)])
+        exp_0 = [('t_a', 0, 1), ('t_a', 1, 2), ('t_a', 2, 3), ('t_a', 3, 7), ('t_a', 3, 4), ('t_a', 4, 5),
+                 ('t_a', 7, 8)]
+        assert plan == exp_0, "Result plan and expected plan are not same"
+        planner.blacklist_command(plan[2])
+        fail_node_id = [n for n in planner.sol_tree.nodes if planner.sol_tree.nodes[n]['info'] == plan[2]][0]
+        plan = planner.replan(planner.simulate(init_state_1)[2], fail_node_id)
+        exp_1 = [('t_a', 0, 1), ('t_a', 1, 3), ('t_a', 3, 7), ('t_a', 3, 4), ('t_a', 4, 5), ('t_a', 7, 8)]
+        assert plan == exp_1, "Result plan and expected plan are not same"
+
+    snap_planner = IPyHOP(robosub_methods, robosub_actions)
+    trail_planner = IPyHOP(robosub_methods, robosub_actions, trail=True)
+    for planner in (snap_planner, trail_planner):
+        planner.blacklist_command(('a_touch_back_v', 'v1', 'l2'))
+        planner.blacklist_command(('a_touch_front_v', 'v1', 'l2'))
+    exp_plan = snap_planner.plan(robosub_state, robosub_tasks)
+    plan = trail_planner.plan(robosub_state, robosub_tasks)
+    assert plan == exp_plan, "Result plan and expected plan are not same"
+
+
+# ******************************************        Main Program End        ****************************************** #
+# ******************************************    Demo / Test Routine         ****************************************** #
+if __name__ == '__main__':
+    try:
+        main()
+        print('\nFile executed successfully!\n')
+    except KeyboardInterrupt:
+        print('\nProcess interrupted by user. Bye!')
+
+"""
+Author(s): Yash Bansod
+Repository: https://github.com/YashBansod/IPyHOP
+Organization: University of Maryland at College Park
+"""